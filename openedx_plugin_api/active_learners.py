@@ -0,0 +1,155 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          maintain CourseActiveLearner, the per-course index of
+                learners with courseware activity.
+
+                StudentModule is far too large to join and distinct() on
+                request. Instead, each StudentModule save upserts the
+                learner's index row (at most once per ACTIVITY_RESOLUTION per
+                learner and course), each CourseEnrollment save copies the
+                enrollment's mode and status onto it, and rebuild_course()
+                backfills a course with set-based queries.
+"""
+# python stuff
+import logging
+
+# django stuff
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+
+# open edx stuff
+from common.djangoapps.student.models import CourseEnrollment
+from lms.djangoapps.courseware.models import StudentModule
+
+# our stuff
+from .models import CourseActiveLearner
+
+log = logging.getLogger(__name__)
+
+# last_activity is kept to within this many seconds, which bounds the
+# index writes caused by a learner working through a course.
+ACTIVITY_RESOLUTION = 60 * 15
+ACTIVITY_CACHE_NAMESPACE = "plugin.api.active_learner.activity."
+
+COUNT_CACHE_NAMESPACE = "plugin.api.active_learner.count."
+COUNT_CACHE_TIMEOUT = 60 * 5
+
+REBUILD_CHUNK_SIZE = 2000
+
+
+def get_active_learners(course_key, mode: str = "honor", exclude_removed: bool = True):
+    queryset = CourseActiveLearner.objects.filter(course_id=course_key, mode=mode)
+    if exclude_removed:
+        queryset = queryset.filter(is_active=True)
+    return queryset
+
+
+def get_active_learner_count(course_key, mode: str = "honor", exclude_removed: bool = True) -> int:
+    """
+    returns the number of active learners of the course, cached for COUNT_CACHE_TIMEOUT.
+    """
+    cache_key = "{namespace}{course_key}.{mode}.{exclude_removed}".format(
+        namespace=COUNT_CACHE_NAMESPACE, course_key=course_key, mode=mode, exclude_removed=exclude_removed
+    )
+    count = cache.get(cache_key)
+    if count is None:
+        count = get_active_learners(course_key, mode, exclude_removed).count()
+        cache.set(cache_key, count, COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def record_activity(course_key, user_id: int, activity_date) -> None:
+    """
+    upsert the learner's index row after a StudentModule save.
+    """
+    cache_key = "{namespace}{course_key}.{user_id}".format(
+        namespace=ACTIVITY_CACHE_NAMESPACE, course_key=course_key, user_id=user_id
+    )
+    if not cache.add(cache_key, True, ACTIVITY_RESOLUTION):
+        return
+
+    try:
+        upsert_activity(course_key, user_id, activity_date)
+    except Exception:  # noqa: B902
+        # otherwise the learner's activity would be dropped until the key expires.
+        cache.delete(cache_key)
+        raise
+
+
+def upsert_activity(course_key, user_id: int, activity_date) -> None:
+    updated = CourseActiveLearner.objects.filter(course_id=course_key, user_id=user_id).update(
+        last_activity=activity_date
+    )
+    if updated:
+        return
+
+    enrollment = (
+        CourseEnrollment.objects.filter(course_id=course_key, user_id=user_id).values("mode", "is_active").first()
+    )
+    try:
+        with transaction.atomic():
+            CourseActiveLearner.objects.create(
+                course_id=course_key,
+                user_id=user_id,
+                mode=enrollment["mode"] if enrollment else "",
+                is_active=enrollment["is_active"] if enrollment else False,
+                last_activity=activity_date,
+            )
+    except IntegrityError:
+        # a concurrent save created the row first.
+        pass
+
+
+def record_enrollment(course_key, user_id: int, mode: str, is_active: bool) -> None:
+    """
+    copy an enrollment's mode and status onto the learner's index row, if there is one.
+    """
+    CourseActiveLearner.objects.filter(course_id=course_key, user_id=user_id).update(mode=mode, is_active=is_active)
+
+
+def rebuild_course(course_key) -> int:
+    """
+    replace the index rows of a course from StudentModule and CourseEnrollment.
+    returns the number of rows written.
+
+    This reads StudentModule once, grouped by learner, on its
+    (course_id, student) index, rather than joining it to CourseEnrollment.
+    """
+    activity = (
+        StudentModule.objects.filter(course_id=course_key)
+        .values_list("student_id")
+        .annotate(last_activity=Max("modified"))
+        .order_by()
+    )
+    enrollments = {
+        user_id: (mode, is_active)
+        for user_id, mode, is_active in CourseEnrollment.objects.filter(course_id=course_key).values_list(
+            "user_id", "mode", "is_active"
+        )
+    }
+
+    rows = []
+    for user_id, last_activity in activity:
+        mode, is_active = enrollments.get(user_id, ("", False))
+        rows.append(
+            CourseActiveLearner(
+                course_id=course_key,
+                user_id=user_id,
+                mode=mode,
+                is_active=is_active,
+                last_activity=last_activity,
+            )
+        )
+
+    with transaction.atomic():
+        CourseActiveLearner.objects.filter(course_id=course_key).delete()
+        CourseActiveLearner.objects.bulk_create(rows, batch_size=REBUILD_CHUNK_SIZE)
+
+    log.info("rebuild_course() {course_key}: {n} active learners".format(course_key=course_key, n=len(rows)))
+    return len(rows)
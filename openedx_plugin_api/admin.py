@@ -8,11 +8,25 @@ date:           sep-2021
 usage:          register the custom Django model in LMS Django Admin
 """
 from django.contrib import admin
-from .models import CoursePoints
+from .models import CoursePoints, BulkEnrollmentJob, CourseActiveLearner
 
 
 class CoursePointsAdmin(admin.ModelAdmin):
     pass
 
 
+class BulkEnrollmentJobAdmin(admin.ModelAdmin):
+    ordering = ("-id",)
+    list_filter = ("operation", "status")
+    list_display = ("id", "operation", "status", "requested_by", "total", "succeeded", "failed", "created")
+
+
+class CourseActiveLearnerAdmin(admin.ModelAdmin):
+    search_fields = ("course_id", "user__username")
+    list_display = ("course_id", "user", "mode", "is_active", "last_activity")
+    raw_id_fields = ("user",)
+
+
 admin.site.register(CoursePoints, CoursePointsAdmin)
+admin.site.register(BulkEnrollmentJob, BulkEnrollmentJobAdmin)
+admin.site.register(CourseActiveLearner, CourseActiveLearnerAdmin)
@@ -14,6 +14,8 @@ import json
 
 # django stuff
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, OuterRef, Q, Subquery
 from django.http.response import HttpResponseNotFound
 from openedx.core.djangoapps.oauth_dispatch.jwt import create_jwt_for_user
 from openedx.core.lib.api.view_utils import view_auth_classes
@@ -24,6 +26,7 @@ from rest_framework.views import APIView
 from social_django.models import UserSocialAuth
 
 # open edx stuff
+from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from openedx.core.djangoapps.enrollments import api
 from common.djangoapps.student.models import CourseEnrollment, email_exists_or_retired
@@ -38,7 +41,6 @@ from openedx.core.djangoapps.django_comment_common.models import (
     FORUM_ROLE_MODERATOR,
     Role,
 )
-import openedx.core.djangoapps.django_comment_common.comment_client as cc
 import lms.djangoapps.discussion.django_comment_client.utils as utils
 
 try:
@@ -58,8 +60,21 @@ except ImportError:
     )
 
 # our stuff
-from .utils import get_course_info
-from .models import CoursePoints
+from .utils import parse_since
+from .course_info import get_course_info_snapshot, get_course_infos
+from .enrollments import bulk_enrollment, ENROLL, UNENROLL, BULK_MAX_SYNC_ITEMS
+from .models import CoursePoints, BulkEnrollmentJob
+from .tasks import bulk_enrollment_job
+from .active_learners import get_active_learners, get_active_learner_count
+from .forum_export import get_discussion_rows, FIELDS as FORUM_EXPORT_FIELDS
+from .pagination import (
+    csv_response,
+    json_list_response,
+    paginated_response,
+    parse_cursor,
+    parse_fields,
+    parse_page_size,
+)
 from .__about__ import __version__
 
 User = get_user_model()
@@ -76,10 +91,50 @@ class ResponseSuccess(Response):
 
 @view_auth_classes(is_authenticated=True)
 class UsersAPIView(APIView):
+    """
+    List users, one page at a time, ordered by id.
+
+    GET users/?fields=id,username,email&page_size=500&after=<cursor>&updated_since=2026-10-01T00:00:00Z
+
+    fields:         comma separated, from USER_FIELDS. Defaults to id,name
+    page_size:      rows per page, up to 10000. Defaults to 100
+    after:          the cursor taken from the "next" url of the previous page
+    updated_since:  only users who joined or last logged in on or after this
+                    ISO 8601 date or datetime
+    stream:         true / false. Pages of more than 1000 rows are streamed by default
+    """
+
+    # response field name: User column
+    USER_FIELDS = {
+        "id": "id",
+        "name": "username",
+        "username": "username",
+        "email": "email",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "is_active": "is_active",
+        "is_staff": "is_staff",
+        "date_joined": "date_joined",
+        "last_login": "last_login",
+    }
+    DEFAULT_FIELDS = ("id", "name")
+
     def get(self, request):
+        try:
+            fields = parse_fields(request.GET.get("fields"), self.USER_FIELDS, self.DEFAULT_FIELDS)
+            page_size = parse_page_size(request.GET.get("page_size"))
+            after = parse_cursor(request.GET.get("after"))
+            updated_since = parse_since(request.GET.get("updated_since"))
+        except ValueError as e:
+            return Response(status=status.HTTP_400_BAD_REQUEST, data={"message": str(e)})
+
         users = User.objects.all()
-        results = [{"id": user.id, "name": user.username} for user in users]
-        return Response(results, content_type="application/json")
+        if updated_since:
+            # auth_user has no modified timestamp, so joining and logging in are what we can see change.
+            users = users.filter(Q(date_joined__gte=updated_since) | Q(last_login__gte=updated_since))
+
+        columns = [self.USER_FIELDS[field] for field in fields]
+        return paginated_response(request, users, "id", fields, columns, page_size, after)
 
 
 @view_auth_classes(is_authenticated=True)
@@ -115,6 +170,65 @@ class EnrollUserAPIView(APIView):
         return Response(response, content_type="application/json")
 
 
+@view_auth_classes(is_authenticated=True)
+class BulkEnrollmentAPIView(APIView):
+    """
+    Enroll or unenroll a batch of learners.
+
+    POST {"items": [{"username": ..., "course_id": ..., "mode": ...}, ...], "async": false}
+
+    Returns one result per item. Batches larger than BULK_MAX_SYNC_ITEMS,
+    or any batch with "async": true, are queued as a BulkEnrollmentJob
+    and the response is the job id, to be polled at enroll/jobs/<job_id>/
+    """
+
+    operation = None
+
+    def post(self, request):
+        items = request.data.get("items")
+        if not isinstance(items, list):
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"message": "items must be a list of username, course_id and mode objects."},
+            )
+
+        run_async = str(request.data.get("async", "false")).lower() == "true"
+        if run_async or len(items) > BULK_MAX_SYNC_ITEMS:
+            job = BulkEnrollmentJob.objects.create(
+                operation=self.operation,
+                requested_by=request.user if request.user.is_authenticated else None,
+                items=json.dumps(items),
+                total=len(items),
+            )
+            # the task looks the job up by id, so it mustn't be queued before the job is committed.
+            transaction.on_commit(lambda: bulk_enrollment_job.delay(job.id))
+            return ResponseSuccess(job.to_dict(include_results=False), http_status=status.HTTP_202_ACCEPTED)
+
+        results = bulk_enrollment(self.operation, items)
+        succeeded = sum(1 for result in results if result["success"])
+        return ResponseSuccess(
+            {"total": len(results), "succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
+        )
+
+
+class BulkEnrollUserAPIView(BulkEnrollmentAPIView):
+    operation = ENROLL
+
+
+class BulkUnenrollUserAPIView(BulkEnrollmentAPIView):
+    operation = UNENROLL
+
+
+@view_auth_classes(is_authenticated=True)
+class BulkEnrollmentJobAPIView(APIView):
+    def get(self, request, job_id):
+        try:
+            job = BulkEnrollmentJob.objects.get(id=job_id)
+        except BulkEnrollmentJob.DoesNotExist:
+            return HttpResponseNotFound()
+        return ResponseSuccess(job.to_dict())
+
+
 @view_auth_classes(is_authenticated=True)
 class AssociateUserOAuthAPIView(APIView):
     def post(self, request):
@@ -189,45 +303,93 @@ class CourseRevokeRoleAccessAPIView(APIView):
 
 @view_auth_classes(is_authenticated=True)
 class StudentHistoryAPIView(APIView):
+    """
+    List a learner's courseware state records in a course, one page at a
+    time, in the order they were created. The state json itself is never read.
+
+    GET student/<username>/course/<course_key>/modules/?module_type=problem,video&modified_since=2026-10-01
+
+    fields:         comma separated, from MODULE_FIELDS. Defaults to id, grade,
+                    max_grade, done and module_type
+    module_type:    comma separated list of XBlock types
+    modified_since: only records modified on or after this ISO 8601 date or datetime
+    page_size, after and stream are as for users/
+
+    The response is {"results": [...], "next": ...}, as for users/, rather
+    than the bare list of earlier releases. An unknown username is a 404.
+    """
+
+    # response field name: StudentModule column
+    MODULE_FIELDS = {
+        "id": "id",
+        "grade": "grade",
+        "max_grade": "max_grade",
+        "done": "done",
+        "module_type": "module_type",
+        "module_id": "module_state_key",
+        "created": "created",
+        "modified": "modified",
+    }
+    DEFAULT_FIELDS = ("id", "grade", "max_grade", "done", "module_type")
+
     def get(self, request, username, course_key):
-        user = User.objects.get(username=username)
-        student_modules = StudentModule.objects.filter(student=user, course_id=course_key).order_by("created")
-        results = [
-            {
-                "id": sm.id,
-                "grade": sm.grade,
-                "max_grade": sm.max_grade,
-                "done": sm.done,
-                "module_type": sm.module_type,
-            }
-            for sm in student_modules
+        try:
+            course_key = CourseKey.from_string(course_key)
+            fields = parse_fields(request.query_params.get("fields"), self.MODULE_FIELDS, self.DEFAULT_FIELDS)
+            page_size = parse_page_size(request.query_params.get("page_size"))
+            after = parse_cursor(request.query_params.get("after"))
+            modified_since = parse_since(request.query_params.get("modified_since"))
+        except (InvalidKeyError, ValueError) as e:
+            return Response(status=status.HTTP_400_BAD_REQUEST, data={"message": str(e)})
+
+        user_id = User.objects.filter(username=username).values_list("id", flat=True).first()
+        if user_id is None:
+            return HttpResponseNotFound()
+
+        student_modules = StudentModule.objects.filter(student_id=user_id, course_id=course_key)
+        module_types = [
+            module_type for module_type in request.query_params.get("module_type", "").split(",") if module_type
         ]
-        return Response(results, content_type="application/json")
+        if module_types:
+            student_modules = student_modules.filter(module_type__in=module_types)
+        if modified_since:
+            student_modules = student_modules.filter(modified__gte=modified_since)
+
+        columns = [self.MODULE_FIELDS[field] for field in fields]
+        return paginated_response(request, student_modules, "id", fields, columns, page_size, after)
 
 
 @view_auth_classes(is_authenticated=True)
 class CourseActiveStudentsAPIView(APIView):
+    """
+    List the honor mode learners of a course who have any courseware activity,
+    one page at a time, from the CourseActiveLearner index.
+
+    GET course/<course_key>/users/active/?exclude_removed=true&page_size=500&after=<cursor>
+    """
+
+    FIELDS = ("id", "email", "username")
+
     def get(self, request, course_key):
+        try:
+            course_key = CourseKey.from_string(course_key)
+            page_size = parse_page_size(request.query_params.get("page_size"))
+            after = parse_cursor(request.query_params.get("after"))
+        except (InvalidKeyError, ValueError) as e:
+            return Response(status=status.HTTP_400_BAD_REQUEST, data={"message": str(e)})
+
         exclude_removed = request.query_params.get("exclude_removed", "true") == "true"
-        active_user_ids = StudentModule.objects.filter(course_id=course_key).filter(
-            student__courseenrollment__mode="honor"
+        return paginated_response(
+            request,
+            get_active_learners(course_key, exclude_removed=exclude_removed),
+            "user_id",
+            self.FIELDS,
+            ["user_id", "user__email", "user__username"],
+            page_size,
+            after,
+            results_key="users",
+            extra={"total": get_active_learner_count(course_key, exclude_removed=exclude_removed)},
         )
-        if exclude_removed:
-            active_user_ids = active_user_ids.filter(student__courseenrollment__is_active=True)
-        active_user_ids = active_user_ids.values_list("student", flat=True).distinct()
-        active_users = User.objects.filter(id__in=active_user_ids)
-        results = {
-            "total": active_users.count(),
-            "users": [
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "username": user.username,
-                }
-                for user in active_users
-            ],
-        }
-        return Response(results, content_type="application/json")
 
 
 @view_auth_classes(is_authenticated=True)
@@ -246,19 +408,135 @@ class StudentCourseGradeAPIView(APIView):
         return ResponseSuccess(response)
 
 
+@view_auth_classes(is_authenticated=True)
+class StudentCourseGradesAPIView(APIView):
+    """
+    Look up the persisted course grades of many learners and / or courses.
+
+    GET student/grades/?usernames=learner1,learner2&course_ids=course-v1:edX%2BDemoX%2BDemo_Course&modified_since=2026-10-01
+    POST student/grades/ {"usernames": [...], "course_ids": [...], "modified_since": "2026-10-01"}
+
+    Course ids in a query string must be url encoded: an unencoded + decodes
+    to a space, so course-v1:edX+DemoX+Demo_Course is passed as
+    course-v1:edX%2BDemoX%2BDemo_Course. POST bodies need no encoding.
+
+    At least one of usernames, course_ids or modified_since is required, and
+    each list may hold up to MAX_KEYS values. Results are ordered on the grade
+    record's id and paginated with the same page_size, after and stream
+    parameters as users/. To page a POST, POST the same body to the next url.
+    """
+
+    MAX_KEYS = 1000
+    FIELDS = (
+        "username",
+        "user_id",
+        "course_id",
+        "percent_grade",
+        "letter_grade",
+        "passed",
+        "passed_timestamp",
+        "modified",
+    )
+
+    def get_list(self, params, name: str) -> list:
+        value = params.get(name) or []
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",")]
+        value = [str(item) for item in value if item]
+        if len(value) > self.MAX_KEYS:
+            raise ValueError("{name} may hold up to {n} values".format(name=name, n=self.MAX_KEYS))
+        return value
+
+    def get(self, request):
+        return self.get_grades(request, request.query_params)
+
+    def post(self, request):
+        return self.get_grades(request, request.data)
+
+    def get_grades(self, request, params):
+        try:
+            usernames = self.get_list(params, "usernames")
+            course_keys = [CourseKey.from_string(course_id) for course_id in self.get_list(params, "course_ids")]
+            modified_since = parse_since(params.get("modified_since"))
+            page_size = parse_page_size(request.query_params.get("page_size") or params.get("page_size"))
+            after = parse_cursor(request.query_params.get("after"))
+        except (InvalidKeyError, ValueError) as e:
+            return Response(status=status.HTTP_400_BAD_REQUEST, data={"message": str(e)})
+        if not (usernames or course_keys or modified_since):
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"message": "at least one of usernames, course_ids or modified_since is required."},
+            )
+
+        # PersistentCourseGrade.user_id is not a foreign key, so users are
+        # joined with subqueries rather than select_related().
+        grades = PersistentCourseGrade.objects.annotate(
+            username=Subquery(User.objects.filter(id=OuterRef("user_id")).values("username")[:1]),
+            passed=ExpressionWrapper(Q(passed_timestamp__isnull=False), output_field=BooleanField()),
+        )
+        if usernames:
+            grades = grades.filter(user_id__in=User.objects.filter(username__in=usernames).values("id"))
+        if course_keys:
+            grades = grades.filter(course_id__in=course_keys)
+        if modified_since:
+            grades = grades.filter(modified__gte=modified_since)
+
+        return paginated_response(request, grades, "id", self.FIELDS, self.FIELDS, page_size, after)
+
+
 @view_auth_classes(is_authenticated=True)
 class CourseInfoAPIView(APIView):
     def get(self, request, course_key):
         response = {}
         try:
             key = CourseKey.from_string(course_key)
-            response = get_course_info(key)
+            response = get_course_info_snapshot(key)
         except Exception as exc:  # noqa: B902
             response["error"] = str(exc)
         finally:
             return ResponseSuccess(response)  # noqa: B012
 
 
+@view_auth_classes(is_authenticated=True)
+class CourseInfoBatchAPIView(APIView):
+    """
+    Course info of many courses, keyed on course id.
+
+    GET courses/info/?course_ids=course-v1:edX%2BDemoX%2BDemo_Course,course-v1:edX%2BE2E-101%2Bcourse
+    POST courses/info/ {"course_ids": [...]}
+
+    As for student/grades/, each + of a course id in the query string must
+    be sent as %2B. POST bodies need no encoding.
+
+    Courses with a cached snapshot get the full course info. Other courses
+    get the subset that CourseOverview holds, and only courses without a
+    CourseOverview are read from the modulestore. A course answered from
+    CourseOverview has no published_on, edited_on, has_changes or
+    group_access. Request it from course/<course_key>/info/ to build its
+    snapshot.
+    """
+
+    MAX_KEYS = 1000
+
+    def get(self, request):
+        return self.get_course_infos(request.query_params.get("course_ids", "").split(","))
+
+    def post(self, request):
+        return self.get_course_infos(request.data.get("course_ids") or [])
+
+    def get_course_infos(self, course_ids):
+        try:
+            course_keys = [CourseKey.from_string(str(course_id).strip()) for course_id in course_ids if course_id]
+        except InvalidKeyError as e:
+            return Response(status=status.HTTP_400_BAD_REQUEST, data={"message": str(e)})
+        if not course_keys or len(course_keys) > self.MAX_KEYS:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"message": "course_ids must hold between 1 and {n} course ids.".format(n=self.MAX_KEYS)},
+            )
+        return ResponseSuccess({"courses": get_course_infos(course_keys)})
+
+
 @view_auth_classes(is_authenticated=True)
 class CoursePointsAPIView(APIView):
     def get(self, request, course_key):
@@ -410,68 +688,25 @@ class APIInfoView(APIView):
 
 @view_auth_classes(is_authenticated=True)
 class DiscussionForum(APIView):
-    def get_discussion_page(self, course_id, page):
-        from lms.djangoapps.discussion.views import THREADS_PER_PAGE
-
-        params = {
-            "sort_key": "activity",
-            "course_id": course_id,
-            "context": "course",
-            "per_page": THREADS_PER_PAGE,
-            "page": page,
-        }
-        paginated_results = cc.Thread.search(params)
-        return paginated_results.collection, paginated_results.num_pages
-
-    def get_thread(self, thread_id):
-        thread = cc.Thread.find(thread_id).retrieve(
-            with_responses=True,
-            recursive=True,
-        )
-        return thread
-
-    def base_row(self, thread):
-        row = {
-            "course_id": thread["course_id"],
-            "module": "",
-            "section": "",
-            "title": thread.get("title"),
-            "pinned": "Yes" if thread.get("pinned") else "No",
-        }
-        return row
+    """
+    Export every thread and response of a course's discussion forum.
 
-    def row(self, row, block):
-        if "user_id" in block:
-            user = User.objects.get(id=int(block["user_id"]))
-            row["email"] = user.email
+    GET course/<course_id>/discussion/?export=csv
 
-        row["content"] = block.get("body")
-        row["char_count"] = len(row["content"])
-        row["votes"] = block.get("votes", {}).get("count")
-        row["num_responses"] = block.get("comments_count")
-        row["post_type"] = block.get("type")
-        row["created_at"] = block.get("created_at")
-        return row
+    export:     json (default) or csv. Either way, rows are streamed as
+                each thread is retrieved from the forum service, and a
+                thread that can't be retrieved is a row with post_type "error".
+                (not ?format=, which DRF reserves for content negotiation.)
+    """
 
     def get(self, request, course_id):
-        self.user = request.user
-        self.course_id = course_id
-        # course_key = CourseKey.from_string(course_id)
-        # course = get_course(course_key)
-        results = []
-        page = total_pages = 1
-        while page <= total_pages:
-            collection, total_pages = self.get_discussion_page(course_id, page)
-            for item in collection:
-                thread = self.get_thread(item["id"])
-                row = self.row(row=self.base_row(thread), block=item)
-                results.append(row)
-                for comment in thread.get("children", []):
-                    row = self.row(row=self.base_row(thread), block=comment)
-                    results.append(row)
-            page += 1
-
-        return Response(results, content_type="application/json")
+        rows = get_discussion_rows(course_id)
+        if request.query_params.get("export") == "csv":
+            filename = "discussion-{course_id}.csv".format(course_id=course_id.replace(":", "-").replace("+", "-"))
+            rows = ([row.get(field) for field in FORUM_EXPORT_FIELDS] for row in rows)
+            return csv_response(filename, FORUM_EXPORT_FIELDS, rows)
+        return json_list_response(rows)
+
 
 class UsersProfileUpdateView(APIView):
     """
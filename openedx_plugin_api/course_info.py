@@ -0,0 +1,176 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          cached course info snapshots.
+
+                get_course_info() reads the whole course from the modulestore
+                and walks its draft tree for has_changes, so its result is
+                cached as a snapshot. The snapshot's cache key includes the
+                course's version, which is the ids of its draft and published
+                structures in the split modulestore. Split writes a new
+                structure on every edit and every publish, so the version
+                changes whenever any field of the snapshot can, including
+                has_changes and edited_on. Reading it costs one lookup of the
+                course's index, rather than a read of the course.
+
+                get_course_infos() answers many courses at once from cached
+                snapshots and CourseOverview, and only reads the modulestore
+                for courses that have no CourseOverview. The course index is
+                read only for courses that have a snapshot: the version of
+                each course's latest snapshot is also cached under a key
+                without a version, and those keys are read in one call.
+"""
+# python stuff
+import logging
+from datetime import datetime
+from pytz import UTC
+
+# django stuff
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+
+# open edx stuff
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+try:
+    # for olive and later
+    from xmodule.modulestore.django import modulestore
+    from xmodule.modulestore import (
+        ModuleStoreEnum,
+    )  # lint-amnesty, pylint: disable=wrong-import-order
+except ImportError:
+    # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.modulestore.django import modulestore
+    from common.lib.xmodule.xmodule.modulestore import (
+        ModuleStoreEnum,
+    )  # lint-amnesty, pylint: disable=wrong-import-order
+
+# our stuff
+from .utils import get_course_info
+
+log = logging.getLogger(__name__)
+
+COURSE_INFO_CACHE_NAMESPACE = "plugin.api.course_info."
+COURSE_INFO_CACHE_TIMEOUT = getattr(settings, "OPENEDX_PLUGIN_API_COURSE_INFO_CACHE_TIMEOUT", 60 * 60 * 24)
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def get_cache_key(course_key, version: str) -> str:
+    return "{namespace}{course_key}.{version}".format(
+        namespace=COURSE_INFO_CACHE_NAMESPACE, course_key=course_key, version=version
+    )
+
+
+def get_latest_version_key(course_key) -> str:
+    return "{namespace}{course_key}.latest".format(namespace=COURSE_INFO_CACHE_NAMESPACE, course_key=course_key)
+
+
+def get_version(course_index: dict) -> str:
+    versions = course_index.get("versions") or {}
+    return "{draft}.{published}".format(
+        draft=versions.get(ModuleStoreEnum.BranchName.draft),
+        published=versions.get(ModuleStoreEnum.BranchName.published),
+    )
+
+
+def get_course_versions(course_keys) -> dict:
+    """
+    the current version of each course that is in the split modulestore.
+    Courses in any other modulestore have no version, and are never cached.
+    """
+    store = modulestore()
+    versions = {}
+    for course_key in course_keys:
+        course_store = store._get_modulestore_for_courselike(course_key)  # pylint: disable=protected-access
+        if not hasattr(course_store, "get_course_index"):
+            continue
+        course_index = course_store.get_course_index(course_key)
+        if course_index:
+            versions[course_key] = get_version(course_index)
+    return versions
+
+
+def set_released_to_students(course_info: dict) -> dict:
+    # this depends on the time of the request, so it isn't cached.
+    start = parse_datetime(course_info["start"]) if course_info.get("start") else None
+    course_info["released_to_students"] = bool(start) and datetime.now(UTC) > start
+    return course_info
+
+
+def build_course_info_snapshot(course_key, version: str = None) -> dict:
+    """
+    read the course info from the modulestore, and cache it if the course has a version.
+    """
+    course_info = get_course_info(course_key)
+    if version:
+        cache.set_many(
+            {get_cache_key(course_key, version): course_info, get_latest_version_key(course_key): version},
+            COURSE_INFO_CACHE_TIMEOUT,
+        )
+    return course_info
+
+
+def get_course_info_snapshot(course_key) -> dict:
+    """
+    returns the cached course info of the current version of the course, building it if necessary.
+    """
+    version = get_course_versions([course_key]).get(course_key)
+    course_info = cache.get(get_cache_key(course_key, version)) if version else None
+    if course_info is None:
+        course_info = build_course_info_snapshot(course_key, version)
+    return set_released_to_students(dict(course_info))
+
+
+def get_course_info_from_overview(overview) -> dict:
+    """
+    the subset of the course info that CourseOverview holds. Only published
+    courses have a CourseOverview.
+    """
+    return {
+        "id": str(modulestore().make_course_usage_key(overview.id)),
+        "language": overview.language,
+        "display_name": overview.display_name_with_default,
+        "published": True,
+        "has_explicit_staff_lock": bool(overview.visible_to_staff_only),
+        "start": overview.start.strftime(DATE_FORMAT) if overview.start else None,
+        "certificate_available_date": overview.certificate_available_date,
+    }
+
+
+def get_course_infos(course_keys) -> dict:
+    """
+    returns the course info of each course key, keyed on the course key string.
+
+    Cached snapshots are returned in full. Other courses are answered from
+    CourseOverview, and courses without a CourseOverview from the modulestore.
+    Only courses that have a snapshot are version checked, so the course index
+    is read for those alone.
+    """
+    overviews = {overview.id: overview for overview in CourseOverview.objects.filter(id__in=course_keys)}
+    latest_keys = {get_latest_version_key(course_key): course_key for course_key in course_keys}
+    cached_course_keys = [latest_keys[latest_key] for latest_key in cache.get_many(latest_keys)]
+    versions = get_course_versions(cached_course_keys)
+    cache_keys = {get_cache_key(course_key, version): course_key for course_key, version in versions.items()}
+    snapshots = {cache_keys[cache_key]: course_info for cache_key, course_info in cache.get_many(cache_keys).items()}
+
+    results = {}
+    for course_key in course_keys:
+        if course_key in snapshots:
+            course_info = dict(snapshots[course_key])
+        elif course_key in overviews:
+            course_info = get_course_info_from_overview(overviews[course_key])
+        else:
+            try:
+                version = versions.get(course_key) or get_course_versions([course_key]).get(course_key)
+                course_info = dict(build_course_info_snapshot(course_key, version))
+            except Exception as e:  # noqa: B902
+                results[str(course_key)] = {"error": str(e)}
+                continue
+        results[str(course_key)] = set_released_to_students(course_info)
+    return results
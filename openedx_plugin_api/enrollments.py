@@ -0,0 +1,218 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          bulk enrollment and unenrollment of learners.
+
+                Users, course overviews, course modes and existing enrollments
+                are each resolved with one query per chunk of items rather
+                than one query per item. Changes are applied in chunked
+                transactions, with a savepoint per item so that one bad item
+                doesn't roll back the rest of its chunk.
+"""
+# python stuff
+import logging
+
+# django stuff
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+# open edx stuff
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+from common.djangoapps.student.models import CourseEnrollment
+from common.djangoapps.course_modes.models import CourseMode
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+log = logging.getLogger(__name__)
+User = get_user_model()
+
+ENROLL = "enroll"
+UNENROLL = "unenroll"
+OPERATIONS = (ENROLL, UNENROLL)
+
+BULK_CHUNK_SIZE = 200
+
+# larger batches must be submitted as an asynchronous job.
+BULK_MAX_SYNC_ITEMS = getattr(settings, "OPENEDX_PLUGIN_API_BULK_MAX_SYNC_ITEMS", 1000)
+
+
+def get_result(item: dict, success: bool, status: str, error: str = None) -> dict:
+    result = {
+        "username": item.get("username"),
+        "course_id": item.get("course_id"),
+        "success": success,
+        "status": status,
+    }
+    if item.get("mode"):
+        result["mode"] = item["mode"]
+    if error:
+        result["error"] = error
+    return result
+
+
+def parse_items(items) -> list:
+    """
+    validate the request items. returns a list with one entry per item:
+    either a (item, course_key) tuple, or the error result of the item.
+    """
+    parsed = []
+    for item in items:
+        if not isinstance(item, dict) or not item.get("username") or not item.get("course_id"):
+            item = item if isinstance(item, dict) else {}
+            parsed.append(get_result(item, False, "invalid", "username and course_id are required"))
+            continue
+        try:
+            parsed.append((item, CourseKey.from_string(str(item["course_id"]))))
+        except InvalidKeyError:
+            parsed.append(get_result(item, False, "invalid", "invalid course_id"))
+    return parsed
+
+
+def get_users(usernames) -> dict:
+    return {user.username: user for user in User.objects.filter(username__in=set(usernames))}
+
+
+def get_enrollments(user_ids, course_keys) -> dict:
+    """
+    the existing enrollments of any of the users in any of the courses,
+    keyed on (user_id, course_key).
+    """
+    enrollments = CourseEnrollment.objects.filter(user_id__in=set(user_ids), course_id__in=set(course_keys))
+    return {(enrollment.user_id, enrollment.course_id): enrollment for enrollment in enrollments}
+
+
+def get_course_modes(course_keys, mode_slugs) -> set:
+    """
+    create any course modes that don't yet exist, as EnrollUserAPIView
+    does, and return the set of (course_key, mode_slug) that are available.
+    """
+    course_keys = set(course_keys)
+    existing = set(
+        CourseMode.objects.filter(course_id__in=course_keys, mode_slug__in=set(mode_slugs)).values_list(
+            "course_id", "mode_slug"
+        )
+    )
+    courses = {overview.id: overview for overview in CourseOverview.objects.filter(id__in=course_keys)}
+    for course_key in course_keys:
+        for mode_slug in mode_slugs:
+            if (course_key, mode_slug) in existing or course_key not in courses:
+                continue
+            CourseMode.objects.get_or_create(
+                course=courses[course_key],
+                mode_slug=mode_slug,
+                defaults={"mode_display_name": mode_slug.capitalize()},
+            )
+            existing.add((course_key, mode_slug))
+    return existing
+
+
+def enroll_chunk(chunk: list) -> list:
+    """
+    enroll one chunk of parsed (item, course_key) tuples.
+    """
+    users = get_users(item["username"] for item, _ in chunk)
+    course_keys = [course_key for _, course_key in chunk]
+    courses = set(CourseOverview.objects.filter(id__in=set(course_keys)).values_list("id", flat=True))
+    course_modes = get_course_modes(
+        [course_key for course_key in course_keys if course_key in courses],
+        {item.get("mode") for item, _ in chunk if item.get("mode")},
+    )
+    enrollments = get_enrollments([user.id for user in users.values()], course_keys)
+
+    results = []
+    with transaction.atomic():
+        for item, course_key in chunk:
+            user = users.get(item["username"])
+            mode = item.get("mode") or CourseMode.DEFAULT_MODE_SLUG
+            if not user:
+                results.append(get_result(item, False, "error", "user not found"))
+                continue
+            if course_key not in courses:
+                results.append(get_result(item, False, "error", "course not found"))
+                continue
+            if item.get("mode") and (course_key, mode) not in course_modes:
+                results.append(get_result(item, False, "error", "course mode not found"))
+                continue
+
+            enrollment = enrollments.get((user.id, course_key))
+            if enrollment and enrollment.is_active and enrollment.mode == mode:
+                results.append(get_result(item, True, "unchanged"))
+                continue
+            try:
+                with transaction.atomic():
+                    CourseEnrollment.enroll(user, course_key, mode=mode, check_access=True)
+                results.append(get_result(item, True, "enrolled"))
+            except Exception as e:  # noqa: B902
+                results.append(get_result(item, False, "error", str(e) or e.__class__.__name__))
+    return results
+
+
+def unenroll_chunk(chunk: list) -> list:
+    """
+    unenroll one chunk of parsed (item, course_key) tuples.
+    """
+    users = get_users(item["username"] for item, _ in chunk)
+    enrollments = get_enrollments([user.id for user in users.values()], [course_key for _, course_key in chunk])
+
+    results = []
+    with transaction.atomic():
+        for item, course_key in chunk:
+            user = users.get(item["username"])
+            enrollment = enrollments.get((user.id, course_key)) if user else None
+            if not enrollment:
+                results.append(get_result(item, False, "error", "enrollment not found"))
+                continue
+            if not enrollment.is_active:
+                results.append(get_result(item, True, "unchanged"))
+                continue
+            try:
+                with transaction.atomic():
+                    enrollment.is_active = False
+                    enrollment.save()
+                results.append(get_result(item, True, "unenrolled"))
+            except Exception as e:  # noqa: B902
+                results.append(get_result(item, False, "error", str(e) or e.__class__.__name__))
+    return results
+
+
+def bulk_enrollment(operation: str, items: list, progress=None) -> list:
+    """
+    enroll or unenroll a list of {"username", "course_id", "mode"} items.
+    mode is optional, and is ignored when unenrolling.
+
+    returns one result per item, in the order of the items.
+
+    progress:   optional callable, called as progress(processed, total)
+                after each chunk.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError("operation must be one of {operations}".format(operations=OPERATIONS))
+    apply_chunk = enroll_chunk if operation == ENROLL else unenroll_chunk
+
+    parsed = parse_items(items)
+    results = [None] * len(parsed)
+    valid = []
+    for i, entry in enumerate(parsed):
+        if isinstance(entry, dict):
+            results[i] = entry
+        else:
+            valid.append((i, entry))
+
+    for start in range(0, len(valid), BULK_CHUNK_SIZE):
+        chunk = valid[start : start + BULK_CHUNK_SIZE]  # noqa: E203
+        for (i, _), result in zip(chunk, apply_chunk([entry for _, entry in chunk])):
+            results[i] = result
+        if progress:
+            progress(min(start + BULK_CHUNK_SIZE, len(valid)), len(valid))
+
+    log.info(
+        "bulk_enrollment() {operation}: {succeeded} of {total} items succeeded".format(
+            operation=operation, succeeded=sum(1 for result in results if result["success"]), total=len(results)
+        )
+    )
+    return results
@@ -0,0 +1,155 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          export the discussion forum of a course.
+
+                Each thread's responses need their own forum service round
+                trip, so threads are retrieved by a bounded pool of worker
+                threads, and the next page of the thread list is fetched while
+                the current one is being retrieved. Rows are generated as each
+                thread completes, and post authors are resolved with one
+                id__in query per thread for the users not seen before.
+
+                The worker threads only make forum service requests. All
+                database reads stay on the calling thread.
+
+                A thread that can't be retrieved is exported as a single row
+                with post_type "error", so that a partial export can be told
+                apart from a complete one.
+"""
+# python stuff
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# django stuff
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+# open edx stuff
+import openedx.core.djangoapps.django_comment_common.comment_client as cc
+
+log = logging.getLogger(__name__)
+User = get_user_model()
+
+FORUM_EXPORT_WORKERS = getattr(settings, "OPENEDX_PLUGIN_API_FORUM_EXPORT_WORKERS", 8)
+
+FIELDS = [
+    "course_id",
+    "module",
+    "section",
+    "title",
+    "pinned",
+    "email",
+    "content",
+    "char_count",
+    "votes",
+    "num_responses",
+    "post_type",
+    "created_at",
+]
+
+
+def get_discussion_page(course_id: str, page: int):
+    from lms.djangoapps.discussion.views import THREADS_PER_PAGE
+
+    params = {
+        "sort_key": "activity",
+        "course_id": course_id,
+        "context": "course",
+        "per_page": THREADS_PER_PAGE,
+        "page": page,
+    }
+    paginated_results = cc.Thread.search(params)
+    return paginated_results.collection, paginated_results.num_pages
+
+
+def get_thread(thread_id: str):
+    return cc.Thread.find(thread_id).retrieve(
+        with_responses=True,
+        recursive=True,
+    )
+
+
+def iter_threads(course_id: str, workers: int = FORUM_EXPORT_WORKERS):
+    """
+    generate (item, thread, error) for every thread of the course, where
+    item is the thread's entry in the thread list and thread is its full
+    retrieval, in the order in which the retrievals complete.
+
+    If a thread can't be retrieved, thread is None and error is the exception.
+    """
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        collection, num_pages = get_discussion_page(course_id, 1)
+        page = 1
+        while True:
+            next_page = executor.submit(get_discussion_page, course_id, page + 1) if page < num_pages else None
+            futures = {executor.submit(get_thread, item["id"]): item for item in collection}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    thread = future.result()
+                except Exception as e:  # noqa: B902
+                    log.error(
+                        "iter_threads() {course_id} thread {id}: {e}".format(course_id=course_id, id=item["id"], e=e)
+                    )
+                    yield item, None, e
+                    continue
+                yield item, thread, None
+
+            if not next_page:
+                break
+            collection, _ = next_page.result()
+            page += 1
+
+
+def base_row(thread) -> dict:
+    return {
+        "course_id": thread["course_id"],
+        "module": "",
+        "section": "",
+        "title": thread.get("title"),
+        "pinned": "Yes" if thread.get("pinned") else "No",
+    }
+
+
+def get_row(thread, block, emails: dict) -> dict:
+    row = base_row(thread)
+    row["email"] = emails.get(int(block["user_id"]), "") if block.get("user_id") else ""
+    row["content"] = block.get("body")
+    row["char_count"] = len(row["content"] or "")
+    row["votes"] = block.get("votes", {}).get("count")
+    row["num_responses"] = block.get("comments_count")
+    row["post_type"] = block.get("type")
+    row["created_at"] = block.get("created_at")
+    return row
+
+
+def get_error_row(item, error) -> dict:
+    row = base_row(item)
+    row["content"] = "thread {id} could not be retrieved: {error}".format(id=item.get("id"), error=error)
+    row["post_type"] = "error"
+    return row
+
+
+def get_discussion_rows(course_id: str, workers: int = FORUM_EXPORT_WORKERS):
+    """
+    generate one row for each thread of the course, followed by one row
+    for each of its responses, or a single error row for a thread that
+    can't be retrieved.
+    """
+    emails = {}
+    for item, thread, error in iter_threads(course_id, workers):
+        if error:
+            yield get_error_row(item, error)
+            continue
+        blocks = [item] + list(thread.get("children", []))
+        user_ids = {int(block["user_id"]) for block in blocks if block.get("user_id")} - emails.keys()
+        if user_ids:
+            found = dict(User.objects.filter(id__in=user_ids).values_list("id", "email"))
+            emails.update({user_id: found.get(user_id, "") for user_id in user_ids})
+        for block in blocks:
+            yield get_row(thread, block, emails)
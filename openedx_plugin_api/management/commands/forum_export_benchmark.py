@@ -0,0 +1,101 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Management command to benchmark the discussion forum export against a
+local stub forum service.
+"""
+import logging
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from openedx.core.djangoapps.django_comment_common.comment_client import settings as cc_settings
+
+from ...forum_export import get_discussion_rows
+from ...tests.forum_stub import StubForum, StubForumServer
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+BENCHMARK_COURSE_ID = "course-v1:plugin_api_benchmark+Forum+run"
+
+
+class Command(BaseCommand):
+    """
+        Export a generated course forum from a local stub forum service with
+        different numbers of worker threads, and print the elapsed time,
+        forum service requests and database queries of each run.
+
+        The stub answers from 127.0.0.1 and sleeps --latency seconds per request.
+        The comment client is pointed at it for the duration of the benchmark.
+
+    Example usage:
+    ./manage.py lms forum_export_benchmark --threads 500 --responses 5 --latency 0.05 --workers 1,4,8,16
+    ./manage.py lms forum_export_benchmark --serve --port 4567
+    """
+
+    help = "Benchmark the discussion forum export against a local stub forum service."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=500, help="number of threads in the stub forum.")
+        parser.add_argument("--responses", type=int, default=5, help="number of responses per thread.")
+        parser.add_argument("--latency", type=float, default=0.05, help="seconds of latency per stub request.")
+        parser.add_argument(
+            "--workers",
+            default="1,4,8,16",
+            help="comma separated list of worker thread counts to benchmark.",
+        )
+        parser.add_argument(
+            "--serve",
+            action="store_true",
+            default=False,
+            help="run the stub forum service in the foreground instead of benchmarking.",
+        )
+        parser.add_argument("--port", type=int, default=0, help="port of the stub forum service.")
+
+    def handle(self, *args, **options):
+        try:
+            workers = [int(n) for n in options["workers"].split(",")]
+        except ValueError:
+            raise CommandError("--workers must be a comma separated list of integers")
+
+        user_ids = list(User.objects.order_by("id").values_list("id", flat=True)[:100])
+        forum = StubForum(BENCHMARK_COURSE_ID, options["threads"], options["responses"], user_ids)
+        server = StubForumServer(forum, latency=options["latency"], port=options["port"])
+
+        if options["serve"]:
+            self.stdout.write(
+                "stub forum service for {course_id} at {url}".format(course_id=BENCHMARK_COURSE_ID, url=server.url)
+            )
+            try:
+                server.httpd.serve_forever()
+            except KeyboardInterrupt:
+                server.stop()
+            return
+
+        prefix = cc_settings.PREFIX
+        with server:
+            cc_settings.PREFIX = server.url + "/api/v1"
+            try:
+                for n in workers:
+                    server.requests = 0
+                    start = time.monotonic()
+                    with CaptureQueriesContext(connection) as queries:
+                        rows = sum(1 for _ in get_discussion_rows(BENCHMARK_COURSE_ID, workers=n))
+                    self.stdout.write(
+                        "{n} workers: {rows} rows in {elapsed:.2f}s, "
+                        "{requests} forum requests, {queries} db queries".format(
+                            n=n,
+                            rows=rows,
+                            elapsed=time.monotonic() - start,
+                            requests=server.requests,
+                            queries=len(queries),
+                        )
+                    )
+            finally:
+                cc_settings.PREFIX = prefix
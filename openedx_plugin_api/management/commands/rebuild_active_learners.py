@@ -0,0 +1,60 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Management command to backfill the CourseActiveLearner index.
+"""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+from ...active_learners import rebuild_course
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+        Rebuild the active learner index of one or more courses from
+        StudentModule and CourseEnrollment. Run this once with --all after
+        installing, after which the index is maintained by signals.
+
+    Example usage:
+    ./manage.py lms rebuild_active_learners course-v1:edX+DemoX+Demo_Course
+    ./manage.py lms rebuild_active_learners --all
+    """
+
+    help = "Rebuild the CourseActiveLearner index of one or more courses."
+
+    def add_arguments(self, parser):
+        parser.add_argument("course_ids", nargs="*", metavar="course_id")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="all",
+            default=False,
+            help="rebuild every course.",
+        )
+
+    def handle(self, *args, **options):
+        if options.get("all"):
+            course_keys = CourseOverview.objects.order_by("id").values_list("id", flat=True)
+        else:
+            try:
+                course_keys = [CourseKey.from_string(course_id) for course_id in options.get("course_ids")]
+            except InvalidKeyError as e:
+                raise CommandError("invalid course_id: {e}".format(e=e))
+        if not options.get("all") and not course_keys:
+            raise CommandError("pass one or more course_ids, or --all")
+
+        total = 0
+        for course_key in course_keys:
+            n = rebuild_course(course_key)
+            total += n
+            self.stdout.write("{course_key}: {n} active learners".format(course_key=course_key, n=n))
+        self.stdout.write("{total} active learners indexed".format(total=total))
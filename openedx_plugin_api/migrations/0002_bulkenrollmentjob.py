@@ -0,0 +1,64 @@
+# coding=utf-8
+# Generated by Django 3.2.20 on 2026-10-17 15:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("openedx_plugin_api", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BulkEnrollmentJob",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                ("operation", models.CharField(max_length=16)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("q", "Queued"), ("r", "Running"), ("s", "Succeeded"), ("f", "Failed")],
+                        db_index=True,
+                        default="q",
+                        max_length=1,
+                    ),
+                ),
+                ("items", models.TextField(help_text="the request items, as json")),
+                ("results", models.TextField(blank=True, default="", help_text="one result per item, as json")),
+                ("total", models.IntegerField(default=0)),
+                ("processed", models.IntegerField(default=0)),
+                ("succeeded", models.IntegerField(default=0)),
+                ("failed", models.IntegerField(default=0)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("message", models.TextField(blank=True, default="")),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+    ]
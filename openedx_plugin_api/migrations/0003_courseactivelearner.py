@@ -0,0 +1,38 @@
+# coding=utf-8
+# Generated by Django 3.2.20 on 2026-10-17 16:10
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("openedx_plugin_api", "0002_bulkenrollmentjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseActiveLearner",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("course_id", opaque_keys.edx.django.models.CourseKeyField(max_length=255)),
+                ("mode", models.CharField(blank=True, default="", max_length=100)),
+                ("is_active", models.BooleanField(default=False)),
+                ("last_activity", models.DateTimeField(db_index=True)),
+                (
+                    "user",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+            options={
+                "unique_together": {("course_id", "user")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="courseactivelearner",
+            index=models.Index(fields=["course_id", "mode", "is_active", "user"], name="plugin_api_cal_course_idx"),
+        ),
+    ]
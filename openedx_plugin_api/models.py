@@ -8,7 +8,14 @@ date:           sep-2021
 usage:          example custom Django model for
                 openedx_plugin_api plugin
 """
+import json
+
+from django.contrib.auth import get_user_model
 from django.db import models
+from model_utils.models import TimeStampedModel
+from opaque_keys.edx.django.models import CourseKeyField
+
+User = get_user_model()
 
 
 class CoursePoints(models.Model):
@@ -17,3 +24,75 @@ class CoursePoints(models.Model):
 
     def __str__(self):
         return f"{self.course_id}: {self.points} points"
+
+
+class BulkEnrollmentJob(TimeStampedModel):
+    """
+    An asynchronous bulk enrollment or unenrollment, for batches that are
+    too large to process within one request.
+    """
+
+    QUEUED = "q"
+    RUNNING = "r"
+    SUCCEEDED = "s"
+    FAILED = "f"
+    STATUSES = [(QUEUED, "Queued"), (RUNNING, "Running"), (SUCCEEDED, "Succeeded"), (FAILED, "Failed")]
+
+    operation = models.CharField(max_length=16)
+    status = models.CharField(max_length=1, choices=STATUSES, default=QUEUED, db_index=True)
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, blank=True, null=True)
+    items = models.TextField(help_text="the request items, as json")
+    results = models.TextField(blank=True, default="", help_text="one result per item, as json")
+    total = models.IntegerField(default=0)
+    processed = models.IntegerField(default=0)
+    succeeded = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    message = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"{self.operation} {self.id}: {self.get_status_display()}"
+
+    def to_dict(self, include_results=True) -> dict:
+        retval = {
+            "job_id": self.id,
+            "operation": self.operation,
+            "status": self.get_status_display().lower(),
+            "total": self.total,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "created": self.created.isoformat() if self.created else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "message": self.message,
+        }
+        if include_results and self.results:
+            retval["results"] = json.loads(self.results)
+        return retval
+
+
+class CourseActiveLearner(models.Model):
+    """
+    One row per learner who has any courseware activity (StudentModule) in
+    a course, maintained from StudentModule and CourseEnrollment saves so that
+    the active learners of a course can be listed without scanning StudentModule.
+    mode and is_active mirror the learner's CourseEnrollment.
+    """
+
+    class Meta:
+        unique_together = [["course_id", "user"]]
+        indexes = [
+            # active learner pages: filter on course, mode and enrollment status, ordered by user.
+            models.Index(fields=["course_id", "mode", "is_active", "user"], name="plugin_api_cal_course_idx"),
+        ]
+
+    course_id = CourseKeyField(max_length=255, db_index=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    mode = models.CharField(max_length=100, blank=True, default="")
+    is_active = models.BooleanField(default=False)
+    last_activity = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.course_id}: {self.user_id}"
@@ -0,0 +1,225 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          cursor pagination and json / csv streaming for the
+                openedx_plugin_api list endpoints. parse_cursor() and
+                csv_response() are shared with openedx_plugin_cms.
+
+                Pages are read with WHERE key > cursor ORDER BY key LIMIT n
+                from a values_list() projection, so deep pages cost the same
+                as the first one and no model instances are built. Every
+                response has the same shape:
+
+                {"results": [...], "next": "<url of the next page, or null>"}
+
+                Large pages are written with StreamingHttpResponse one chunk
+                of rows at a time, rather than being built in memory first.
+"""
+# python stuff
+import csv
+import json
+
+# django stuff
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.response import Response
+
+# open edx stuff
+from opaque_keys import OpaqueKey
+
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 10000
+
+# pages larger than this are streamed unless ?stream=false is passed.
+STREAM_THRESHOLD = 1000
+STREAM_CHUNK_SIZE = 2000
+
+
+def parse_cursor(value) -> int:
+    """
+    returns a cursor token from a query string or url capture as an int,
+    or None if it is missing. raises ValueError if it is malformed.
+    """
+    if value in (None, ""):
+        return None
+    try:
+        cursor = int(value)
+    except (TypeError, ValueError):
+        cursor = -1
+    if cursor < 0:
+        raise ValueError("invalid cursor: {value}. Cursors are non-negative integers".format(value=value))
+    return cursor
+
+
+def parse_page_size(value, default: int = PAGE_SIZE, maximum: int = MAX_PAGE_SIZE) -> int:
+    """
+    returns the ?page_size= parameter, capped at maximum.
+    raises ValueError if it is malformed.
+    """
+    if value in (None, ""):
+        return default
+    page_size = int(value)
+    if page_size < 1:
+        raise ValueError("page_size must be 1 or more")
+    return min(page_size, maximum)
+
+
+def parse_fields(value, allowed, default) -> list:
+    """
+    returns the list of field names in a comma separated ?fields= parameter.
+    raises ValueError if any of them is not in allowed.
+    """
+    if not value:
+        return list(default)
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    invalid = [field for field in fields if field not in allowed]
+    if invalid or not fields:
+        raise ValueError(
+            "invalid fields: {invalid}. Valid fields are: {allowed}".format(
+                invalid=", ".join(invalid), allowed=", ".join(allowed)
+            )
+        )
+    return fields
+
+
+def get_next_url(request, cursor) -> str:
+    if cursor is None:
+        return None
+    params = request.GET.copy()
+    params["after"] = cursor
+    return "{url}?{params}".format(url=request.build_absolute_uri(request.path), params=params.urlencode())
+
+
+def get_row(fields, row) -> dict:
+    """
+    key the columns of a (key, *columns) row by field name. Course and usage keys become strings.
+    """
+    return {field: str(value) if isinstance(value, OpaqueKey) else value for field, value in zip(fields, row[1:])}
+
+
+def get_rows(queryset, key: str, columns, after: int = None):
+    """
+    a values_list() queryset of (key, *columns) ordered on key, starting after the cursor.
+    """
+    if after is not None:
+        queryset = queryset.filter(**{"{key}__gt".format(key=key): after})
+    return queryset.order_by(key).values_list(key, *columns)
+
+
+def stream_page(rows, fields, page_size: int, next_url, results_key: str = "results", extra: dict = None):
+    """
+    generate the json of one page. rows holds up to page_size + 1 tuples
+    of (key, *columns), the extra row only telling us that there is a
+    next page.
+    """
+    encoder = DjangoJSONEncoder()
+    yield "{"
+    for name, value in (extra or {}).items():
+        yield "{name}: {value}, ".format(name=json.dumps(name), value=encoder.encode(value))
+    yield "{results_key}: [".format(results_key=json.dumps(results_key))
+    last_key = None
+    for n, row in enumerate(rows):
+        if n == page_size:
+            break
+        yield ("," if n else "") + encoder.encode(get_row(fields, row))
+        last_key = row[0]
+    else:
+        # the loop ran out of rows before reaching the extra one: this is the last page.
+        last_key = None
+    yield '], "next": {next}}}'.format(next=json.dumps(next_url(last_key)))
+
+
+def paginated_response(
+    request,
+    queryset,
+    key: str,
+    fields,
+    columns,
+    page_size: int,
+    after: int = None,
+    results_key: str = "results",
+    extra: dict = None,
+):
+    """
+    returns one page of queryset, projected onto columns and keyed in the
+    results by fields, as a Response, or as a StreamingHttpResponse if the
+    page is large.
+
+    results_key:    the name of the list of rows in the response
+    extra:          any other values to include in the response, such as a total
+    """
+    rows = get_rows(queryset, key, columns, after)[: page_size + 1]
+
+    stream = request.GET.get("stream")
+    if stream is None:
+        stream = page_size > STREAM_THRESHOLD
+    else:
+        stream = str(stream).lower() == "true"
+
+    if stream:
+        return StreamingHttpResponse(
+            stream_page(
+                rows.iterator(chunk_size=STREAM_CHUNK_SIZE),
+                fields,
+                page_size,
+                lambda cursor: get_next_url(request, cursor),
+                results_key=results_key,
+                extra=extra,
+            ),
+            content_type="application/json",
+        )
+
+    rows = list(rows)
+    next_cursor = rows[page_size - 1][0] if len(rows) > page_size else None
+    data = dict(extra or {})
+    data[results_key] = [get_row(fields, row) for row in rows[:page_size]]
+    data["next"] = get_next_url(request, next_cursor)
+    return Response(data, content_type="application/json")
+
+
+class Echo:
+    """
+    An object that implements just the write method of the file-like
+    interface, so that csv.writer returns each row rather than buffering it.
+    see: https://docs.djangoproject.com/en/3.2/howto/outputting-csv/#streaming-large-csv-files
+    """
+
+    def write(self, value):
+        return value
+
+
+def csv_response(filename: str, header: list, rows) -> StreamingHttpResponse:
+    """
+    stream a csv file download. ´rows´ is any iterable of row sequences in
+    the order of the header, and is consumed lazily as the response is
+    sent, so memory stays flat regardless of the size of the export.
+    """
+    writer = csv.writer(Echo())
+
+    def stream():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(stream(), content_type="text/csv")
+    response["Content-Disposition"] = "attachment; filename={filename}".format(filename=filename)
+    return response
+
+
+def json_list_response(rows) -> StreamingHttpResponse:
+    """
+    stream an iterable of row dicts as a json list.
+    """
+    encoder = DjangoJSONEncoder()
+
+    def stream():
+        yield "["
+        for n, row in enumerate(rows):
+            yield ("," if n else "") + encoder.encode(row)
+        yield "]"
+
+    return StreamingHttpResponse(stream(), content_type="application/json")
@@ -14,13 +14,17 @@ import logging
 import requests
 
 # Django
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.conf import settings
 
 # Open edX
 from openedx.core.djangoapps.signals.signals import COURSE_GRADE_NOW_PASSED
+from common.djangoapps.student.models import CourseEnrollment
+from lms.djangoapps.courseware.models import StudentModule
 
 # this repo
+from .active_learners import record_activity, record_enrollment
 
 log = logging.getLogger(__name__)
 log.info("openedx_plugin_api.signals loaded")
@@ -35,3 +39,26 @@ def listen_for_passing_grade(sender, user, course_id, **kwargs):  # pylint: disa
         "Enrolled student {username} has achieved a passing grade in the course"
         " {course_id} [{kwargs}]".format(username=user.username, course_id=course_id, kwargs=kwargs)
     )
+
+
+@receiver(post_save, sender=StudentModule, dispatch_uid="plugin_active_learner_activity")
+def listen_for_student_module(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Keep the learner's CourseActiveLearner row current.
+    """
+    try:
+        record_activity(instance.course_id, instance.student_id, instance.modified)
+    except Exception as e:  # noqa: B902
+        # never let the index break courseware state saves.
+        log.error("listen_for_student_module() {course_id}: {e}".format(course_id=instance.course_id, e=e))
+
+
+@receiver(post_save, sender=CourseEnrollment, dispatch_uid="plugin_active_learner_enrollment")
+def listen_for_enrollment(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Copy enrollment mode and status changes onto the learner's CourseActiveLearner row.
+    """
+    try:
+        record_enrollment(instance.course_id, instance.user_id, instance.mode, instance.is_active)
+    except Exception as e:  # noqa: B902
+        log.error("listen_for_enrollment() {course_id}: {e}".format(course_id=instance.course_id, e=e))
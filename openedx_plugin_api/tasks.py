@@ -0,0 +1,62 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          Celery tasks for openedx_plugin_api plugin
+"""
+# python stuff
+import json
+import logging
+
+# django stuff
+from django.utils import timezone
+
+# celery
+from celery import shared_task
+
+# our stuff
+from .enrollments import bulk_enrollment
+from .models import BulkEnrollmentJob
+
+log = logging.getLogger(__name__)
+
+
+@shared_task(bind=True)
+def bulk_enrollment_job(self, job_id: int) -> None:
+    """
+    run an asynchronous BulkEnrollmentJob, recording its progress
+    and the result of each item on the job record.
+    """
+    job = BulkEnrollmentJob.objects.filter(id=job_id).first()
+    if not job:
+        log.warning("bulk_enrollment_job() job not found: {job_id}".format(job_id=job_id))
+        return
+
+    job.status = BulkEnrollmentJob.RUNNING
+    job.started_at = timezone.now()
+    job.save()
+
+    def progress(processed, total):
+        BulkEnrollmentJob.objects.filter(id=job.id).update(processed=processed, modified=timezone.now())
+
+    try:
+        results = bulk_enrollment(job.operation, json.loads(job.items), progress=progress)
+    except Exception as e:  # noqa: B902
+        BulkEnrollmentJob.objects.filter(id=job.id).update(
+            status=BulkEnrollmentJob.FAILED, finished_at=timezone.now(), message=str(e), modified=timezone.now()
+        )
+        raise
+
+    succeeded = sum(1 for result in results if result["success"])
+    BulkEnrollmentJob.objects.filter(id=job.id).update(
+        status=BulkEnrollmentJob.SUCCEEDED,
+        results=json.dumps(results),
+        processed=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        finished_at=timezone.now(),
+        modified=timezone.now(),
+    )
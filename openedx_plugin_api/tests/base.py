@@ -0,0 +1,52 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Shared fixtures of the openedx_plugin_api tests
+"""
+import importlib
+from unittest import mock
+
+# django stuff
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# open edx stuff
+from common.djangoapps.student.tests.factories import UserFactory
+
+# this repo
+from openedx_plugin_api import urls
+from openedx_plugin_api.waffle import waffle_switches
+
+
+@override_settings(ROOT_URLCONF="openedx_plugin_api.tests.urls")
+class PluginAPITestCase(APITestCase):
+    """
+    Requests are sent through the plugin's url routes by an authenticated
+    staff user.
+
+    The routes of urls.py are gated on waffle switches that are read once at
+    import, so urls.py is reloaded here with every switch turned on.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with mock.patch.dict(waffle_switches, dict.fromkeys(waffle_switches, True)):
+            importlib.reload(urls)
+
+    def setUp(self):
+        super().setUp()
+        self.staff = UserFactory(is_staff=True)
+        self.client.force_authenticate(user=self.staff)
+
+    def url(self, name, **kwargs):
+        return reverse("openedx_plugin_api:{name}".format(name=name), kwargs=kwargs)
+
+    def get(self, name, params=None, **kwargs):
+        return self.client.get(self.url(name, **kwargs), params)
+
+    def post(self, name, data, query_string="", **kwargs):
+        return self.client.post(self.url(name, **kwargs) + query_string, data, format="json")
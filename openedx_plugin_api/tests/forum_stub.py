@@ -0,0 +1,157 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          a local stand-in for the forum service (cs_comments_service),
+                used by the forum export tests and the forum_export_benchmark
+                management command.
+
+                It serves the two endpoints that the discussion export calls,
+                GET /api/v1/threads and GET /api/v1/threads/<id>, from
+                generated threads, and waits ´latency´ seconds before each
+                response to simulate the round trip to a real forum service.
+"""
+# python stuff
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+log = logging.getLogger(__name__)
+
+
+class StubForum:
+    """
+    generated threads and responses of one course.
+    """
+
+    def __init__(self, course_id: str, threads: int, responses: int, user_ids: list):
+        self.course_id = course_id
+        self.threads = threads
+        self.responses = responses
+        self.user_ids = user_ids or [None]
+
+    def get_user_id(self, i: int):
+        user_id = self.user_ids[i % len(self.user_ids)]
+        return str(user_id) if user_id is not None else None
+
+    def get_thread_summary(self, i: int) -> dict:
+        return {
+            "id": "thread{i}".format(i=i),
+            "type": "thread",
+            "course_id": self.course_id,
+            "commentable_id": "course",
+            "title": "Stub thread {i}".format(i=i),
+            "body": "Body of stub thread {i}. ".format(i=i) * 10,
+            "pinned": i % 50 == 0,
+            "user_id": self.get_user_id(i),
+            "votes": {"count": i % 7},
+            "comments_count": self.responses,
+            "created_at": "2026-10-01T00:00:00Z",
+        }
+
+    def get_thread(self, thread_id: str) -> dict:
+        i = int(thread_id.replace("thread", ""))
+        thread = self.get_thread_summary(i)
+        thread["children"] = [
+            {
+                "id": "comment{i}_{j}".format(i=i, j=j),
+                "type": "comment",
+                "thread_id": thread_id,
+                "course_id": self.course_id,
+                "body": "Response {j} to stub thread {i}.".format(i=i, j=j),
+                "user_id": self.get_user_id(i + j + 1),
+                "votes": {"count": j % 3},
+                "created_at": "2026-10-02T00:00:00Z",
+                "children": [],
+            }
+            for j in range(self.responses)
+        ]
+        return thread
+
+    def search(self, page: int, per_page: int) -> dict:
+        num_pages = max((self.threads + per_page - 1) // per_page, 1)
+        start = (page - 1) * per_page
+        return {
+            "collection": [self.get_thread_summary(i) for i in range(start, min(start + per_page, self.threads))],
+            "page": page,
+            "num_pages": num_pages,
+            "thread_count": self.threads,
+        }
+
+
+class StubForumServer:
+    """
+    serve a StubForum over http on localhost, from a background thread.
+
+    with StubForumServer(forum, latency=0.05) as server:
+        ... server.url ...
+    """
+
+    def __init__(self, forum: StubForum, latency: float = 0.05, port: int = 0):
+        self.forum = forum
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), self.get_handler())
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        return "http://127.0.0.1:{port}".format(port=self.httpd.server_address[1])
+
+    def get_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                log.debug(format, *args)
+
+            def send_json(self, status: int, data):
+                body = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):  # noqa: N802
+                with server._lock:
+                    server.requests += 1
+                time.sleep(server.latency)
+
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                parts = url.path.strip("/").split("/")
+                if parts[:3] != ["api", "v1", "threads"]:
+                    return self.send_json(404, {"error": "not found"})
+                if len(parts) == 3:
+                    page = int(params.get("page", ["1"])[0])
+                    per_page = int(params.get("per_page", ["20"])[0])
+                    return self.send_json(200, server.forum.search(page, per_page))
+                try:
+                    return self.send_json(200, server.forum.get_thread(parts[3]))
+                except ValueError:
+                    return self.send_json(404, {"error": "not found"})
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
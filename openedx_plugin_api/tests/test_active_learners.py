@@ -0,0 +1,110 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the CourseActiveLearner index and the active learners endpoint
+"""
+from datetime import datetime
+from unittest import mock
+from pytz import UTC
+
+# django stuff
+from django.core.cache import cache
+from django.db import OperationalError
+
+# open edx stuff
+from opaque_keys.edx.keys import CourseKey
+from common.djangoapps.student.models import CourseEnrollment
+from common.djangoapps.student.tests.factories import UserFactory
+from lms.djangoapps.courseware.models import StudentModule
+from lms.djangoapps.courseware.tests.factories import StudentModuleFactory
+
+# this repo
+from openedx_plugin_api import active_learners
+from openedx_plugin_api.active_learners import get_active_learner_count, rebuild_course, record_activity
+from openedx_plugin_api.models import CourseActiveLearner
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+COURSE_KEY = CourseKey.from_string("course-v1:edX+Active+2026")
+ACTIVITY_DATE = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+class TestActiveLearners(PluginAPITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.learners = [UserFactory() for _ in range(3)]
+        for learner in self.learners:
+            CourseEnrollment.objects.create(user=learner, course_id=COURSE_KEY, mode="honor", is_active=True)
+
+    def get(self, course_key=str(COURSE_KEY), **params):
+        return super().get("openedx_plugin_api_active_student_count", params, course_key=course_key)
+
+    def test_student_module_save_indexes_the_learner(self):
+        StudentModuleFactory(student=self.learners[0], course_id=COURSE_KEY)
+        row = CourseActiveLearner.objects.get(course_id=COURSE_KEY, user=self.learners[0])
+        assert (row.mode, row.is_active) == ("honor", True)
+
+    def test_activity_is_throttled(self):
+        record_activity(COURSE_KEY, self.learners[0].id, ACTIVITY_DATE)
+        record_activity(COURSE_KEY, self.learners[0].id, datetime(2026, 10, 2, tzinfo=UTC))
+        row = CourseActiveLearner.objects.get(course_id=COURSE_KEY, user=self.learners[0])
+        assert row.last_activity == ACTIVITY_DATE
+
+    def test_failed_write_releases_the_throttle(self):
+        with mock.patch.object(active_learners, "upsert_activity", side_effect=OperationalError("gone away")):
+            with self.assertRaises(OperationalError):
+                record_activity(COURSE_KEY, self.learners[0].id, ACTIVITY_DATE)
+
+        record_activity(COURSE_KEY, self.learners[0].id, ACTIVITY_DATE)
+        assert CourseActiveLearner.objects.filter(course_id=COURSE_KEY, user=self.learners[0]).exists()
+
+    def test_enrollment_changes_are_copied(self):
+        record_activity(COURSE_KEY, self.learners[0].id, ACTIVITY_DATE)
+        CourseEnrollment.objects.filter(user=self.learners[0], course_id=COURSE_KEY).get().update_enrollment(
+            is_active=False
+        )
+        assert not CourseActiveLearner.objects.get(course_id=COURSE_KEY, user=self.learners[0]).is_active
+
+    def test_rebuild_course(self):
+        for learner in self.learners[:2]:
+            StudentModule.objects.create(
+                student=learner,
+                course_id=COURSE_KEY,
+                module_state_key=COURSE_KEY.make_usage_key("problem", learner.username),
+            )
+        CourseActiveLearner.objects.all().delete()
+
+        assert rebuild_course(COURSE_KEY) == 2
+        assert set(CourseActiveLearner.objects.values_list("user_id", flat=True)) == {
+            learner.id for learner in self.learners[:2]
+        }
+
+    def test_endpoint(self):
+        for learner in self.learners:
+            record_activity(COURSE_KEY, learner.id, ACTIVITY_DATE)
+        CourseActiveLearner.objects.filter(user=self.learners[2]).update(is_active=False)
+
+        response = self.get(page_size="1")
+        assert response.status_code == 200
+        assert response.data["total"] == 2
+        assert response.data["users"] == [
+            {"id": self.learners[0].id, "email": self.learners[0].email, "username": self.learners[0].username}
+        ]
+        assert response.data["next"]
+
+        response = self.get(after=str(self.learners[0].id))
+        assert [user["id"] for user in response.data["users"]] == [self.learners[1].id]
+        assert response.data["next"] is None
+
+        response = self.get(exclude_removed="false")
+        assert response.data["total"] == 3
+
+    def test_count_is_cached(self):
+        assert get_active_learner_count(COURSE_KEY) == 0
+        record_activity(COURSE_KEY, self.learners[0].id, ACTIVITY_DATE)
+        assert get_active_learner_count(COURSE_KEY) == 0
+
+    def test_invalid_course_key(self):
+        assert self.get(course_key="not a course key").status_code == 400
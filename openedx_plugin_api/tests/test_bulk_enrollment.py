@@ -0,0 +1,160 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the bulk enrollment and unenrollment endpoints
+"""
+import json
+from unittest import mock
+
+# django stuff
+from django.db import IntegrityError
+
+# open edx stuff
+from common.djangoapps.course_modes.models import CourseMode
+from common.djangoapps.student.models import CourseEnrollment
+from common.djangoapps.student.tests.factories import UserFactory
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+try:
+    # for olive and later
+    from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
+    from xmodule.modulestore.tests.factories import CourseFactory
+except ImportError:
+    # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.modulestore.tests.django_utils import (
+        SharedModuleStoreTestCase,
+    )
+    from common.lib.xmodule.xmodule.modulestore.tests.factories import CourseFactory
+
+# this repo
+from openedx_plugin_api import api
+from openedx_plugin_api.models import BulkEnrollmentJob
+from openedx_plugin_api.tasks import bulk_enrollment_job
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+ENROLL = "openedx_plugin_api_enroll_bulk"
+UNENROLL = "openedx_plugin_api_unenroll_bulk"
+
+
+class TestBulkEnrollment(SharedModuleStoreTestCase, PluginAPITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.course = CourseFactory.create()
+
+    def setUp(self):
+        super().setUp()
+        CourseOverview.get_from_id(self.course.id)
+        self.learner = UserFactory()
+        self.other_learner = UserFactory()
+
+    def item(self, user, mode=None, course_id=None):
+        item = {"username": user.username, "course_id": course_id or str(self.course.id)}
+        if mode:
+            item["mode"] = mode
+        return item
+
+    def test_results_per_item(self):
+        items = [
+            self.item(self.learner, mode="audit"),
+            {"username": "no-such-user", "course_id": str(self.course.id)},
+            self.item(self.learner, course_id="course-v1:edX+NoSuchCourse+run"),
+            self.item(self.learner, course_id="not a course key"),
+            {"course_id": str(self.course.id)},
+            self.item(self.other_learner, mode="new-mode"),
+        ]
+        response = self.post(ENROLL, {"items": items})
+        assert response.status_code == 200
+
+        results = response.data["response"]["results"]
+        assert [result["status"] for result in results] == [
+            "enrolled",
+            "error",
+            "error",
+            "invalid",
+            "invalid",
+            "enrolled",
+        ]
+        assert results[1]["error"] == "user not found"
+        assert results[2]["error"] == "course not found"
+        assert response.data["response"]["succeeded"] == 2
+        assert response.data["response"]["failed"] == 4
+
+        assert CourseEnrollment.is_enrolled(self.learner, self.course.id)
+        # a missing course mode is created, as the single enrollment endpoint does.
+        assert CourseMode.objects.filter(course_id=self.course.id, mode_slug="new-mode").exists()
+
+    def test_unchanged(self):
+        items = [self.item(self.learner, mode="audit")]
+        self.post(ENROLL, {"items": items})
+        response = self.post(ENROLL, {"items": items})
+        assert response.data["response"]["results"][0]["status"] == "unchanged"
+
+        response = self.post(UNENROLL, {"items": items})
+        assert response.data["response"]["results"][0]["status"] == "unenrolled"
+        response = self.post(UNENROLL, {"items": items})
+        assert response.data["response"]["results"][0]["status"] == "unchanged"
+        assert not CourseEnrollment.is_enrolled(self.learner, self.course.id)
+
+    def test_failing_item_is_rolled_back_alone(self):
+        enroll = CourseEnrollment.enroll
+
+        def failing_enroll(user, course_key, **kwargs):
+            enrollment = enroll(user, course_key, **kwargs)
+            if user == self.learner:
+                raise IntegrityError("enrollment failed")
+            return enrollment
+
+        items = [self.item(self.learner), self.item(self.other_learner)]
+        with mock.patch.object(CourseEnrollment, "enroll", side_effect=failing_enroll):
+            response = self.post(ENROLL, {"items": items})
+
+        results = response.data["response"]["results"]
+        assert results[0]["status"] == "error"
+        assert results[1]["status"] == "enrolled"
+        # the failed item's own write was rolled back to its savepoint.
+        assert not CourseEnrollment.is_enrolled(self.learner, self.course.id)
+        assert CourseEnrollment.is_enrolled(self.other_learner, self.course.id)
+
+    def test_items_must_be_a_list(self):
+        response = self.post(ENROLL, {"items": "nope"})
+        assert response.status_code == 400
+
+    def test_large_batches_are_queued(self):
+        items = [self.item(self.learner), self.item(self.other_learner)]
+        with mock.patch.object(api, "BULK_MAX_SYNC_ITEMS", 1), mock.patch.object(bulk_enrollment_job, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                response = self.post(ENROLL, {"items": items})
+            # nothing is queued until the job is committed.
+            delay.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        assert response.status_code == 202
+        job = BulkEnrollmentJob.objects.get(id=response.data["response"]["job_id"])
+        assert job.status == BulkEnrollmentJob.QUEUED
+        assert job.total == 2
+        delay.assert_called_once_with(job.id)
+        assert not CourseEnrollment.is_enrolled(self.learner, self.course.id)
+
+    def test_async_flag_queues_small_batches(self):
+        with mock.patch.object(bulk_enrollment_job, "delay"):
+            response = self.post(ENROLL, {"items": [self.item(self.learner)], "async": True})
+        assert response.status_code == 202
+
+    def test_job_endpoint(self):
+        items = [self.item(self.learner), {"username": "no-such-user", "course_id": str(self.course.id)}]
+        job = BulkEnrollmentJob.objects.create(operation="enroll", items=json.dumps(items), total=len(items))
+        bulk_enrollment_job(job.id)
+
+        response = self.get("openedx_plugin_api_enroll_job", job_id=job.id)
+        assert response.status_code == 200
+        data = response.data["response"]
+        assert data["status"] == "succeeded"
+        assert (data["processed"], data["succeeded"], data["failed"]) == (2, 1, 1)
+        assert [result["status"] for result in data["results"]] == ["enrolled", "error"]
+
+        response = self.get("openedx_plugin_api_enroll_job", job_id=job.id + 1)
+        assert response.status_code == 404
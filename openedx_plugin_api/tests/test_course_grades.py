@@ -0,0 +1,97 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the batch course grades endpoint
+"""
+from datetime import datetime, timedelta
+from unittest import mock
+from pytz import UTC
+
+# open edx stuff
+from opaque_keys.edx.keys import CourseKey
+from common.djangoapps.student.tests.factories import UserFactory
+from lms.djangoapps.grades.models import PersistentCourseGrade
+
+# this repo
+from openedx_plugin_api.api import StudentCourseGradesAPIView
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+COURSE_KEY = CourseKey.from_string("course-v1:edX+Grades+2026")
+OTHER_COURSE_KEY = CourseKey.from_string("course-v1:edX+Grades+2027")
+URL_NAME = "openedx_plugin_api_student_course_grades"
+
+
+class TestStudentCourseGradesAPIView(PluginAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.learners = [UserFactory() for _ in range(2)]
+        self.passed_timestamp = datetime(2026, 10, 1, tzinfo=UTC)
+        self.grades = {
+            (learner.id, course_key): PersistentCourseGrade.objects.create(
+                user_id=learner.id,
+                course_id=course_key,
+                percent_grade=0.9 if course_key == COURSE_KEY else 0.2,
+                letter_grade="Pass" if course_key == COURSE_KEY else "",
+                passed_timestamp=self.passed_timestamp if course_key == COURSE_KEY else None,
+                grading_policy_hash="hash",
+            )
+            for learner in self.learners
+            for course_key in (COURSE_KEY, OTHER_COURSE_KEY)
+        }
+
+    def test_get_by_username_and_course(self):
+        # the query string is url encoded, so each + of the course id is sent as %2B.
+        response = self.get(URL_NAME, {"usernames": self.learners[0].username, "course_ids": str(COURSE_KEY)})
+        assert response.status_code == 200
+        grade = self.grades[(self.learners[0].id, COURSE_KEY)]
+        assert response.data["results"] == [
+            {
+                "username": self.learners[0].username,
+                "user_id": self.learners[0].id,
+                "course_id": str(COURSE_KEY),
+                "percent_grade": 0.9,
+                "letter_grade": "Pass",
+                "passed": True,
+                "passed_timestamp": self.passed_timestamp,
+                "modified": grade.modified,
+            }
+        ]
+
+    def test_unencoded_plus_is_rejected(self):
+        response = self.client.get(self.url(URL_NAME) + "?course_ids={course_id}".format(course_id=COURSE_KEY))
+        assert response.status_code == 400
+
+    def test_post_many_courses(self):
+        response = self.post(URL_NAME, {"course_ids": [str(COURSE_KEY), str(OTHER_COURSE_KEY)]})
+        assert len(response.data["results"]) == 4
+        assert [row["passed"] for row in response.data["results"]] == [True, False, True, False]
+
+    def test_modified_since(self):
+        PersistentCourseGrade.objects.filter(user_id=self.learners[1].id).update(
+            modified=datetime.now(UTC) - timedelta(days=30)
+        )
+        since = (datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d")
+        response = self.post(URL_NAME, {"modified_since": since})
+        assert {row["user_id"] for row in response.data["results"]} == {self.learners[0].id}
+
+    def test_post_pages_follow_the_cursor(self):
+        course_ids = [str(COURSE_KEY), str(OTHER_COURSE_KEY)]
+        response = self.post(URL_NAME, {"course_ids": course_ids}, query_string="?page_size=3")
+        assert len(response.data["results"]) == 3
+        assert "after=" in response.data["next"]
+        after = response.data["results"][-1]
+        cursor = self.grades[(after["user_id"], CourseKey.from_string(after["course_id"]))].id
+        response = self.post(
+            URL_NAME, {"course_ids": course_ids}, query_string="?page_size=3&after={n}".format(n=cursor)
+        )
+        assert len(response.data["results"]) == 1
+        assert response.data["next"] is None
+
+    def test_errors(self):
+        assert self.post(URL_NAME, {}).status_code == 400
+        assert self.post(URL_NAME, {"course_ids": ["not a course key"]}).status_code == 400
+        with mock.patch.object(StudentCourseGradesAPIView, "MAX_KEYS", 1):
+            usernames = [learner.username for learner in self.learners]
+            assert self.post(URL_NAME, {"usernames": usernames}).status_code == 400
@@ -0,0 +1,108 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the course info snapshots and the course info endpoints
+"""
+from unittest import mock
+
+# django stuff
+from django.core.cache import cache
+
+# open edx stuff
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+try:
+    # for olive and later
+    from xmodule.modulestore import ModuleStoreEnum
+    from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+    from xmodule.modulestore.tests.factories import CourseFactory
+except ImportError:
+    # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.modulestore import ModuleStoreEnum
+    from common.lib.xmodule.xmodule.modulestore.tests.django_utils import (
+        ModuleStoreTestCase,
+    )
+    from common.lib.xmodule.xmodule.modulestore.tests.factories import CourseFactory
+
+# this repo
+from openedx_plugin_api import course_info
+from openedx_plugin_api.course_info import get_course_info_snapshot, get_course_infos, get_course_versions
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+BATCH_URL_NAME = "openedx_plugin_api_course_info_batch"
+
+
+class TestCourseInfo(ModuleStoreTestCase, PluginAPITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.course = CourseFactory.create()
+        CourseOverview.get_from_id(self.course.id)
+
+        get_course_info = course_info.get_course_info
+        patcher = mock.patch.object(course_info, "get_course_info", side_effect=get_course_info)
+        self.get_course_info = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_snapshot_is_cached(self):
+        first = get_course_info_snapshot(self.course.id)
+        second = get_course_info_snapshot(self.course.id)
+        assert first == second
+        assert first["id"] == str(self.course.location)
+        assert self.get_course_info.call_count == 1
+
+    def test_draft_edit_invalidates_the_snapshot(self):
+        version = get_course_versions([self.course.id])[self.course.id]
+        get_course_info_snapshot(self.course.id)
+
+        self.store.create_child(ModuleStoreEnum.UserID.test, self.course.location, "chapter", "draft_chapter")
+
+        assert get_course_versions([self.course.id])[self.course.id] != version
+        assert get_course_info_snapshot(self.course.id)["has_changes"]
+        assert self.get_course_info.call_count == 2
+
+    def test_publish_invalidates_the_snapshot(self):
+        chapter = self.store.create_child(ModuleStoreEnum.UserID.test, self.course.location, "chapter", "chapter")
+        assert get_course_info_snapshot(self.course.id)["has_changes"]
+
+        self.store.publish(chapter.location, ModuleStoreEnum.UserID.test)
+        assert not get_course_info_snapshot(self.course.id)["has_changes"]
+
+    def test_batch(self):
+        other_course = CourseFactory.create()
+        CourseOverview.get_from_id(other_course.id)
+        get_course_info_snapshot(self.course.id)
+        self.get_course_info.reset_mock()
+
+        missing_course_key = self.course.id.replace(run="missing")
+        get_course_versions = course_info.get_course_versions
+        with mock.patch.object(course_info, "get_course_versions", side_effect=get_course_versions) as versions:
+            infos = get_course_infos([self.course.id, other_course.id, missing_course_key])
+
+        # the snapshot is served in full, the other course from CourseOverview.
+        assert "has_changes" in infos[str(self.course.id)]
+        assert "has_changes" not in infos[str(other_course.id)]
+        assert infos[str(other_course.id)]["display_name"] == other_course.display_name
+        assert infos[str(other_course.id)]["id"] == str(other_course.location)
+        # only the course with a snapshot is version checked in bulk, and the
+        # course without a CourseOverview when its snapshot is built.
+        assert [call.args[0] for call in versions.call_args_list] == [[self.course.id], [missing_course_key]]
+        assert "error" in infos[str(missing_course_key)]
+        self.get_course_info.assert_called_once_with(missing_course_key)
+
+    def test_endpoints(self):
+        response = self.get("openedx_plugin_api_course_info", course_key=str(self.course.id))
+        assert response.data["response"]["id"] == str(self.course.location)
+
+        # the query string is url encoded, so each + of the course id is sent as %2B.
+        response = self.get(BATCH_URL_NAME, {"course_ids": str(self.course.id)})
+        assert list(response.data["response"]["courses"]) == [str(self.course.id)]
+
+        response = self.post(BATCH_URL_NAME, {"course_ids": [str(self.course.id)]})
+        assert list(response.data["response"]["courses"]) == [str(self.course.id)]
+
+    def test_batch_errors(self):
+        for course_ids in ([], ["not a course key"]):
+            assert self.post(BATCH_URL_NAME, {"course_ids": course_ids}).status_code == 400
@@ -0,0 +1,68 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the discussion forum export
+"""
+import json
+from unittest import mock
+
+# open edx stuff
+from common.djangoapps.student.tests.factories import UserFactory
+
+# this repo
+from openedx_plugin_api import forum_export
+from openedx_plugin_api.tests.forum_stub import StubForum
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+COURSE_ID = "course-v1:edX+Forum+2026"
+
+
+class TestForumExport(PluginAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.learner = UserFactory()
+        self.forum = StubForum(COURSE_ID, threads=5, responses=2, user_ids=[self.learner.id])
+
+        def get_discussion_page(course_id, page):
+            result = self.forum.search(page, per_page=2)
+            return result["collection"], result["num_pages"]
+
+        def get_thread(thread_id):
+            if thread_id == "thread3":
+                raise ValueError("forum service unavailable")
+            return self.forum.get_thread(thread_id)
+
+        for name, side_effect in (("get_discussion_page", get_discussion_page), ("get_thread", get_thread)):
+            patcher = mock.patch.object(forum_export, name, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get(self, **params):
+        return super().get("openedx_plugin_api_discussion", params, course_id=COURSE_ID)
+
+    def test_rows(self):
+        rows = list(forum_export.get_discussion_rows(COURSE_ID, workers=4))
+        # 4 threads with 2 responses each, and one error row.
+        assert len(rows) == 13
+        assert {row["email"] for row in rows if row["post_type"] != "error"} == {self.learner.email}
+
+        errors = [row for row in rows if row["post_type"] == "error"]
+        assert len(errors) == 1
+        assert errors[0]["title"] == "Stub thread 3"
+        assert "forum service unavailable" in errors[0]["content"]
+
+    def test_json_export(self):
+        response = self.get()
+        assert response["Content-Type"] == "application/json"
+        rows = json.loads(b"".join(response.streaming_content))
+        assert len(rows) == 13
+
+    def test_csv_export(self):
+        response = self.get(export="csv")
+        assert response["Content-Type"] == "text/csv"
+        assert "attachment" in response["Content-Disposition"]
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0] == ",".join(forum_export.FIELDS)
+        assert len(lines) == 14
@@ -0,0 +1,100 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the student history endpoint
+"""
+from datetime import datetime, timedelta
+from pytz import UTC
+
+# django stuff
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# open edx stuff
+from opaque_keys.edx.keys import CourseKey
+from common.djangoapps.student.tests.factories import UserFactory
+from lms.djangoapps.courseware.models import StudentModule
+
+# this repo
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+COURSE_KEY = CourseKey.from_string("course-v1:edX+History+2026")
+
+
+class TestStudentHistoryAPIView(PluginAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.learner = UserFactory()
+        self.modules = [
+            StudentModule.objects.create(
+                student=self.learner,
+                course_id=COURSE_KEY,
+                module_type=module_type,
+                module_state_key=COURSE_KEY.make_usage_key(
+                    module_type, "{module_type}{i}".format(module_type=module_type, i=i)
+                ),
+                state='{"attempts": 1}',
+                grade=i,
+                max_grade=5,
+            )
+            for i, module_type in enumerate(["problem", "video", "problem", "html"])
+        ]
+        StudentModule.objects.filter(id__in=[module.id for module in self.modules[:2]]).update(
+            modified=datetime.now(UTC) - timedelta(days=30)
+        )
+
+    def get(self, username=None, course_key=str(COURSE_KEY), **params):
+        return super().get(
+            "openedx_plugin_api_student_modules",
+            params,
+            username=username or self.learner.username,
+            course_key=course_key,
+        )
+
+    def test_default_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get()
+        assert response.status_code == 200
+        assert response.data["results"][0] == {
+            "id": self.modules[0].id,
+            "grade": 0,
+            "max_grade": 5,
+            "done": "na",
+            "module_type": "problem",
+        }
+        assert len(response.data["results"]) == 4
+        # the state json is never read.
+        assert not any("`state`" in query["sql"] or '"state"' in query["sql"] for query in queries.captured_queries)
+
+    def test_selected_fields(self):
+        response = self.get(fields="id,module_id")
+        assert response.data["results"][1] == {
+            "id": self.modules[1].id,
+            "module_id": str(self.modules[1].module_state_key),
+        }
+
+    def test_filters(self):
+        response = self.get(module_type="problem,html")
+        assert [row["id"] for row in response.data["results"]] == [
+            self.modules[0].id,
+            self.modules[2].id,
+            self.modules[3].id,
+        ]
+
+        response = self.get(modified_since=(datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d"))
+        assert [row["id"] for row in response.data["results"]] == [self.modules[2].id, self.modules[3].id]
+
+    def test_pages_follow_the_cursor(self):
+        response = self.get(page_size="3")
+        assert len(response.data["results"]) == 3
+        response = self.get(page_size="3", after=str(response.data["results"][-1]["id"]))
+        assert [row["id"] for row in response.data["results"]] == [self.modules[3].id]
+        assert response.data["next"] is None
+
+    def test_errors(self):
+        assert self.get(username="no-such-user").status_code == 404
+        assert self.get(course_key="not a course key").status_code == 400
+        assert self.get(fields="state").status_code == 400
+        assert self.get(modified_since="last week").status_code == 400
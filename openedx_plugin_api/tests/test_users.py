@@ -0,0 +1,97 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the paginated users endpoint
+"""
+import json
+from datetime import datetime, timedelta
+from pytz import UTC
+
+# django stuff
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+
+# open edx stuff
+from common.djangoapps.student.tests.factories import UserFactory
+
+# this repo
+from openedx_plugin_api.pagination import parse_cursor, parse_fields, parse_page_size
+from openedx_plugin_api.tests.base import PluginAPITestCase
+
+User = get_user_model()
+
+
+class TestUsersAPIView(PluginAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = [UserFactory() for _ in range(5)]
+
+    def get(self, **params):
+        return super().get("openedx_plugin_api_users", params)
+
+    def test_default_fields(self):
+        response = self.get()
+        assert response.status_code == 200
+        results = response.data["results"]
+        assert results[0] == {"id": self.staff.id, "name": self.staff.username}
+        assert len(results) == User.objects.count()
+        assert response.data["next"] is None
+
+    def test_selected_fields(self):
+        response = self.get(fields="id,email,is_active")
+        assert set(response.data["results"][0]) == {"id", "email", "is_active"}
+
+    def test_invalid_parameters(self):
+        assert self.get(fields="id,password").status_code == 400
+        assert self.get(page_size="0").status_code == 400
+        assert self.get(after="-1").status_code == 400
+        assert self.get(updated_since="yesterday").status_code == 400
+
+    def test_pages_follow_the_cursor(self):
+        ids = []
+        params = {"page_size": "2"}
+        while True:
+            response = self.get(**params)
+            ids += [row["id"] for row in response.data["results"]]
+            if not response.data["next"]:
+                break
+            assert "after=" in response.data["next"]
+            params["after"] = str(ids[-1])
+        assert ids == list(User.objects.order_by("id").values_list("id", flat=True))
+
+    def test_updated_since(self):
+        since = datetime.now(UTC) - timedelta(days=1)
+        User.objects.update(date_joined=since - timedelta(days=30), last_login=None)
+        User.objects.filter(id=self.users[0].id).update(last_login=since + timedelta(hours=1))
+        User.objects.filter(id=self.users[1].id).update(date_joined=since + timedelta(hours=1))
+
+        response = self.get(updated_since=since.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        assert [row["id"] for row in response.data["results"]] == [self.users[0].id, self.users[1].id]
+
+    def test_streamed_page_matches_buffered_page(self):
+        buffered = self.get(page_size="2", fields="id,username")
+        streamed = self.get(page_size="2", fields="id,username", stream="true")
+        assert streamed.streaming
+        assert json.loads(b"".join(streamed.streaming_content)) == json.loads(json.dumps(buffered.data))
+
+
+class TestPagination(APITestCase):
+    def test_parse_cursor(self):
+        assert parse_cursor(None) is None
+        assert parse_cursor("42") == 42
+        with self.assertRaises(ValueError):
+            parse_cursor("abc")
+
+    def test_parse_page_size(self):
+        assert parse_page_size(None) == 100
+        assert parse_page_size("50000") == 10000
+        with self.assertRaises(ValueError):
+            parse_page_size("0")
+
+    def test_parse_fields(self):
+        assert parse_fields(None, {"id": "id"}, ("id",)) == ["id"]
+        assert parse_fields(" id ,name", {"id": "id", "name": "username"}, ("id",)) == ["id", "name"]
+        with self.assertRaises(ValueError):
+            parse_fields("id,password", {"id": "id"}, ("id",))
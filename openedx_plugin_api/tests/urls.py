@@ -0,0 +1,15 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+The plugin's urls, mounted the way the plugin framework mounts them in lms/urls.py
+"""
+from django.urls import include, re_path
+
+urlpatterns = [
+    re_path(
+        r"^openedx_plugin/api/",
+        include(("openedx_plugin_api.urls", "openedx_plugin_api"), namespace="openedx_plugin_api"),
+    ),
+]
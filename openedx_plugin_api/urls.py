@@ -49,6 +49,17 @@ if waffle_switches[API_ENROLLMENT]:
             name="openedx_plugin_api_unenroll",
         ),
         path("enroll/", api.EnrollUserAPIView.as_view(), name="openedx_plugin_api_enroll"),
+        path("enroll/bulk/", api.BulkEnrollUserAPIView.as_view(), name="openedx_plugin_api_enroll_bulk"),
+        path(
+            "unenroll/bulk/",
+            api.BulkUnenrollUserAPIView.as_view(),
+            name="openedx_plugin_api_unenroll_bulk",
+        ),
+        path(
+            "enroll/jobs/<int:job_id>/",
+            api.BulkEnrollmentJobAPIView.as_view(),
+            name="openedx_plugin_api_enroll_job",
+        ),
     ]
 
 if waffle_switches[API_ASSOCIATE]:
@@ -96,6 +107,11 @@ if waffle_switches[API_COURSE]:
             api.CourseInfoAPIView.as_view(),
             name="openedx_plugin_api_course_info",
         ),
+        path(
+            "courses/info/",
+            api.CourseInfoBatchAPIView.as_view(),
+            name="openedx_plugin_api_course_info_batch",
+        ),
         path(
             "course/<str:course_key>/points/",
             api.CoursePointsAPIView.as_view(),
@@ -130,4 +146,9 @@ if waffle_switches[API_STUDENT]:
             api.StudentCourseGradeAPIView.as_view(),
             name="openedx_plugin_api_student_course_grade",
         ),
+        path(
+            "student/grades/",
+            api.StudentCourseGradesAPIView.as_view(),
+            name="openedx_plugin_api_student_course_grades",
+        ),
     ]
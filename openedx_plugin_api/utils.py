@@ -14,6 +14,8 @@ from pytz import UTC
 import re
 
 # django stuff
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import is_naive, make_aware
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
 
@@ -36,6 +38,25 @@ except ImportError:
     )  # lint-amnesty, pylint: disable=wrong-import-order
 
 
+def parse_since(value) -> datetime:
+    """
+    parse an ISO 8601 date or datetime query parameter, such as
+    ?updated_since=2026-10-01 or ?modified_since=2026-10-01T12:00:00Z.
+    Naive values are taken to be UTC.
+
+    returns None if value is empty, and raises ValueError if it is malformed.
+    """
+    if not value:
+        return None
+    since = parse_datetime(value)
+    if since is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError("{value} is not an ISO 8601 date or datetime".format(value=value))
+        since = datetime(date.year, date.month, date.day)
+    return make_aware(since, UTC) if is_naive(since) else since
+
+
 def get_course_info(course_key: CourseKey):
     """
     Generate a verbose json object of course
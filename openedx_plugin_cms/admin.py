@@ -9,7 +9,7 @@ Admin registration for openedx_plugin_cms
 
 from django.contrib import admin
 
-from .models import CourseChangeLog, CourseAudit
+from .models import CourseChangeLog, CourseAudit, CourseAuditJob
 
 
 class CourseAuditAdmin(admin.ModelAdmin):
@@ -51,6 +51,32 @@ class CourseAuditAdmin(admin.ModelAdmin):
         return False
 
 
+class CourseAuditJobAdmin(admin.ModelAdmin):
+    """Admin for Audit Report refresh jobs"""
+
+    ordering = ("-id",)
+    search_fields = ["course_id", "task_id", "requested_by__username"]
+    list_filter = ("status",)
+    list_display = (
+        "id",
+        "course_id",
+        "status",
+        "incremental",
+        "requested_by",
+        "rows_persisted",
+        "rows_total",
+        "created",
+        "started_at",
+        "finished_at",
+    )
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 class CourseChangeLogAdmin(admin.ModelAdmin):
     """Admin for course email."""
 
@@ -61,3 +87,4 @@ class CourseChangeLogAdmin(admin.ModelAdmin):
 
 admin.site.register(CourseChangeLog, CourseChangeLogAdmin)
 admin.site.register(CourseAudit, CourseAuditAdmin)
+admin.site.register(CourseAuditJob, CourseAuditJobAdmin)
@@ -13,17 +13,16 @@ import logging
 # django stuff
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
 # open edx common libs
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from xblock.core import XBlock
 
 # open edx stuff
-from cms.djangoapps.contentstore.utils import (
-    get_lms_link_for_item,
-    is_currently_visible_to_students,
-)
-from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from cms.djangoapps.contentstore.utils import is_currently_visible_to_students
 
 try:
     # for olive and later
@@ -40,17 +39,57 @@ except ImportError:
 from .utils import (
     round_seconds,
     get_user,
-    get_parent_location,
-    is_dirty,
+    get_parent_block,
+    get_dirty_blocks,
+    get_lms_jump_url,
     xblock_publication_date,
     make_url,
     get_ordinal_position,
 )
 from .models import CourseChangeLog
+from .course_snapshot import CourseSnapshot, normalize_usage_key
 
 log = logging.getLogger(__name__)
 User = get_user_model()
 
+BULK_WRITE_BATCH_SIZE = 500
+
+# every CourseChangeLog field that populate_log() sets, plus the bookkeeping
+# fields that bulk_update() would otherwise leave untouched.
+BULK_WRITE_FIELDS = [
+    "operation",
+    "modified",
+    "url",
+    "display_name",
+    "visible",
+    "category",
+    "course_id",
+    "ordinal_position",
+    "parent_location",
+    "parent_url",
+    "parent_display_name",
+    "chapter_location",
+    "chapter_url",
+    "chapter_display_name",
+    "sequential_location",
+    "sequential_url",
+    "sequential_display_name",
+    "vertical_location",
+    "vertical_url",
+    "vertical_display_name",
+    "edit_info",
+    "source_version",
+    "update_version",
+    "previous_version",
+    "original_usage",
+    "original_usage_version",
+    "release_date",
+    "published_by",
+    "published_on",
+    "edited_by",
+    "edited_on",
+]
+
 
 def write_log_delete_course(course_key: CourseKey, user_id: User) -> None:
     """
@@ -63,41 +102,67 @@ def write_log_delete_course(course_key: CourseKey, user_id: User) -> None:
     course_change_log.save()
 
 
-def write_log(course_change_log: CourseChangeLog, usage_key: UsageKey, user: User, xblock=None):
-    course_key = usage_key.course_key
-    if not xblock:
-        xblock = modulestore().get_item(usage_key)
+def populate_log(
+    course_change_log: CourseChangeLog,
+    xblock: XBlock,
+    user: User,
+    snapshot: CourseSnapshot = None,
+    users: dict = None,
+) -> CourseChangeLog:
+    """
+    Set all of the block meta data fields of course_change_log from xblock,
+    without saving it.
+
+    If a CourseSnapshot is provided then the block's parent and its
+    chapter / sequential / vertical ancestors are resolved from the
+    snapshot rather than from the modulestore. If a dict of pre-fetched
+    users (keyed on id) is provided then published_by and edited_by are
+    resolved from it rather than from one query each.
+    """
+    course_key = xblock.location.course_key
+
+    parent = snapshot.get_parent(xblock.location) if snapshot else xblock.get_parent()
+    chapter = get_parent_block("chapter", xblock.location, snapshot)
+    sequential = get_parent_block("sequential", xblock.location, snapshot)
+    vertical = get_parent_block("vertical", xblock.location, snapshot)
+    chapter_location = chapter.location if chapter else None
+    sequential_location = sequential.location if sequential else None
+    vertical_location = vertical.location if vertical else None
+    display_name = xblock.display_name if len(str(xblock.display_name)) > 1 else "MISSING"
 
-    # for building misc url's
-    # ----------------------
-    scheme = "https" if settings.HTTPS == "on" else "http"
-    # ----------------------
+    def get_display_name(block):
+        # denormalized onto the log record so that reports never
+        # need to go back to the modulestore for these.
+        return str(block.display_name or "")[:255] if block else ""
 
-    parent = xblock.get_parent()
-    chapter_location = get_parent_location("chapter", xblock.location)
-    sequential_location = get_parent_location("sequential", xblock.location)
-    vertical_location = get_parent_location("vertical", xblock.location)
-    display_name = xblock.display_name if len(str(xblock.display_name)) > 1 else "MISSING"
+    def resolve_user(user_id):
+        if users is not None:
+            return users.get(user_id)
+        return get_user(user_id) or None
 
     # add the log data
     # ----------------------
-    course_change_log.url = scheme + ":" + get_lms_link_for_item(xblock.location)
+    course_change_log.url = get_lms_jump_url(xblock.location)
     course_change_log.display_name = display_name
     course_change_log.visible = is_currently_visible_to_students(xblock)
     course_change_log.category = xblock.category
-    course_change_log.course_id = xblock.location.course_key or course_key
+    course_change_log.course_id = course_key or course_change_log.course_id
 
     if parent:
-        course_change_log.ordinal_position = get_ordinal_position(xblock.location, parent.location)
+        course_change_log.ordinal_position = get_ordinal_position(xblock.location, parent.location, snapshot)
         course_change_log.parent_location = parent.location
         course_change_log.parent_url = make_url(parent.location, parent.category)
+    course_change_log.parent_display_name = get_display_name(parent)
 
     course_change_log.chapter_location = chapter_location
     course_change_log.chapter_url = make_url(chapter_location)
+    course_change_log.chapter_display_name = get_display_name(chapter)
     course_change_log.sequential_location = sequential_location
     course_change_log.sequential_url = make_url(sequential_location)
+    course_change_log.sequential_display_name = get_display_name(sequential)
     course_change_log.vertical_location = vertical_location
     course_change_log.vertical_url = make_url(vertical_location)
+    course_change_log.vertical_display_name = get_display_name(vertical)
 
     course_change_log.edit_info = json.dumps({})
     course_change_log.source_version = None
@@ -107,13 +172,33 @@ def write_log(course_change_log: CourseChangeLog, usage_key: UsageKey, user: Use
     course_change_log.original_usage_version = None
 
     course_change_log.release_date = xblock.start
-    course_change_log.published_by = get_user(xblock.published_by) if xblock.published_by > 0 else None
+    course_change_log.published_by = resolve_user(xblock.published_by) if xblock.published_by > 0 else None
     course_change_log.published_on = round_seconds(xblock.published_on)
-    course_change_log.edited_by = get_user(xblock.edited_by) if xblock.edited_by > 0 else user
+    course_change_log.edited_by = (resolve_user(xblock.edited_by) if xblock.edited_by > 0 else None) or user
     course_change_log.edited_on = round_seconds(xblock.edited_on) or round_seconds(datetime.now())
-    course_change_log.save()
     # ----------------------
 
+    return course_change_log
+
+
+def write_log(
+    course_change_log: CourseChangeLog,
+    usage_key: UsageKey,
+    user: User,
+    xblock=None,
+    snapshot: CourseSnapshot = None,
+):
+    """
+    Populate and save a CourseChangeLog record for the block at usage_key.
+    """
+    if not xblock and snapshot:
+        xblock = snapshot.get_block(usage_key)
+    if not xblock:
+        xblock = modulestore().get_item(usage_key)
+
+    populate_log(course_change_log, xblock, user, snapshot)
+    course_change_log.save()
+
     log.info("write_log() logged block: {location}".format(location=xblock.location))
 
 
@@ -133,7 +218,7 @@ def write_log_delete_item(usage_key: UsageKey, user: User) -> None:
     write_log(course_change_log, usage_key, user)
 
 
-def write_log_upsert(xblock: XBlock, user: User) -> None:
+def write_log_upsert(xblock: XBlock, user: User, snapshot: CourseSnapshot = None) -> None:
     """
     xblock_info: either an XBlockWithMixins or a dict
 
@@ -157,7 +242,74 @@ def write_log_upsert(xblock: XBlock, user: User) -> None:
         publication_date=publication_date,
         operation=CourseChangeLog.DB_UPSERT,
     )
-    write_log(course_change_log, xblock.location, user, xblock)
+    write_log(course_change_log, xblock.location, user, xblock, snapshot)
+
+
+def write_log_bulk(course_key: CourseKey, xblocks, user: User, snapshot: CourseSnapshot = None) -> int:
+    """
+    Batched equivalent of write_log_upsert() for all of the changed blocks
+    of one course evaluation.
+
+    The publishing / editing users of every block are resolved in a single
+    query, existing log records are matched on the model's unique key
+    (location, publication_date) with one query per batch, and all records are then
+    persisted with bulk_create / bulk_update inside one transaction.
+
+    Returns the number of records written.
+    """
+    xblocks = [xblock for xblock in xblocks if xblock_publication_date(xblock)]
+    if not xblocks:
+        return 0
+
+    user_ids = set()
+    for xblock in xblocks:
+        for user_id in (xblock.published_by, xblock.edited_by):
+            if user_id and user_id > 0:
+                user_ids.add(user_id)
+    users = {user.id: user for user in User.objects.filter(id__in=user_ids)} if user_ids else {}
+
+    # match only the exact (location, publication_date) pairs being written,
+    # rather than every logged version of these locations.
+    existing = {}
+    for i in range(0, len(xblocks), BULK_WRITE_BATCH_SIZE):
+        query = Q()
+        for xblock in xblocks[i : i + BULK_WRITE_BATCH_SIZE]:  # noqa: E203
+            query |= Q(location=xblock.location, publication_date=xblock_publication_date(xblock))
+        for course_change_log in CourseChangeLog.objects.filter(query):
+            key = (normalize_usage_key(course_change_log.location), course_change_log.publication_date)
+            existing[key] = course_change_log
+
+    to_create = []
+    to_update = []
+    now = timezone.now()
+    for xblock in xblocks:
+        publication_date = xblock_publication_date(xblock)
+        key = (normalize_usage_key(xblock.location), publication_date)
+        course_change_log = existing.get(key)
+        if course_change_log:
+            course_change_log.modified = now
+            to_update.append(course_change_log)
+        else:
+            course_change_log = CourseChangeLog(location=xblock.location, publication_date=publication_date)
+            to_create.append(course_change_log)
+            # guard against duplicate blocks within this batch.
+            existing[key] = course_change_log
+
+        course_change_log.operation = CourseChangeLog.DB_UPSERT
+        populate_log(course_change_log, xblock, user, snapshot, users)
+
+    with transaction.atomic():
+        if to_create:
+            CourseChangeLog.objects.bulk_create(to_create, batch_size=BULK_WRITE_BATCH_SIZE)
+        if to_update:
+            CourseChangeLog.objects.bulk_update(to_update, BULK_WRITE_FIELDS, batch_size=BULK_WRITE_BATCH_SIZE)
+
+    log.info(
+        "write_log_bulk() logged {created} new and {updated} existing blocks for {course_key}".format(
+            created=len(to_create), updated=len(to_update), course_key=course_key
+        )
+    )
+    return len(to_create) + len(to_update)
 
 
 def eval_course_block_changes(course_key: CourseKey, user: User) -> None:
@@ -170,26 +322,26 @@ def eval_course_block_changes(course_key: CourseKey, user: User) -> None:
                     example course-v1:edX+DemoX+Demo_Course
     """
 
-    store = modulestore()
-    has_changes = store.has_changes(modulestore().get_course(course_key, depth=None))
-    if has_changes:
-        log.info("{course_key} has changes.".format(course_key=course_key))
-
-    # BlockStructureBlockData
-    collected_block_structure = get_course_in_cache(course_key)
+    # load the entire course structure exactly once. every subsequent
+    # parent, ancestor and ordinal position lookup is resolved from this
+    # snapshot in O(1), with no further modulestore reads.
+    snapshot = CourseSnapshot(course_key)
+    if not snapshot.course:
+        log.warning("eval_course_block_changes() course not found: {course_key}".format(course_key=course_key))
+        return
 
     # see https://en.wikipedia.org/wiki/Topological_sorting
-    # topological_traversal() iterator returns all blocks
-    # in the course structure, following the rules of a
+    # iterating the snapshot returns all blocks in the course
+    # structure in order of presentation, which is also a valid
     # topological tree traversal.
     #
-    # block_key is opaque_keys.edx.locator.BlockUsageLocator
-    for block_key in collected_block_structure.topological_traversal():
-        # xblock is also a BlockUsageLocator, but it's fully
-        # initialized (the data contents at the block location are also initialized)
-        xblock = store.get_item(block_key)
-
-        log.debug("auditing {location}.".format(location=xblock.location))
-
-        if is_dirty(xblock):
-            write_log_upsert(xblock, user)
+    # xblock is fully initialized (the data contents at the
+    # block location are also initialized)
+    #
+    # dirty-checking is done in bulk for the entire course: one read of
+    # the published structure, and a batched change log query for just
+    # the published locations.
+    #
+    # all changed blocks are then written to the change log in one batch.
+    dirty_blocks = get_dirty_blocks(course_key, snapshot, snapshot.store)
+    write_log_bulk(course_key, dirty_blocks, user, snapshot)
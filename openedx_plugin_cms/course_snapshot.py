@@ -0,0 +1,176 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+An indexed, in-memory snapshot of a course structure.
+
+The course is loaded from the modulestore exactly once, with depth=None, so
+that every descendant block is prefetched. The tree is then walked a single
+time to build lookup tables for each block's parent, its chapter / sequential /
+vertical ancestors and its ordinal position within its parent. After that,
+every one of these lookups is a dict access and costs no further modulestore
+reads.
+"""
+# python stuff
+import logging
+
+# open edx common libs
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+try:
+    # for olive and later
+    from xmodule.modulestore.django import (
+        modulestore,
+    )  # lint-amnesty, pylint: disable=wrong-import-order
+except ImportError:
+    # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.modulestore.django import (
+        modulestore,
+    )  # lint-amnesty, pylint: disable=wrong-import-order
+
+log = logging.getLogger(__name__)
+
+# the block categories that we track as ancestors.
+# These equate to:
+#     course: CourseSummary
+#     chapter is a "Section"
+#     sequential is a "Subsection"
+#     vertical is a "Unit"
+ANCESTOR_CATEGORIES = ("course", "chapter", "sequential", "vertical")
+
+
+def normalize_usage_key(usage_key: UsageKey) -> UsageKey:
+    """
+    strip any branch and version information from a usage key so that
+    keys from the modulestore and from Django signals index identically.
+    """
+    if usage_key is None:
+        return None
+    try:
+        return usage_key.for_branch(None).version_agnostic()
+    except AttributeError:
+        return usage_key
+
+
+class CourseSnapshot:
+    """
+    A single-pass, indexed view of a course structure.
+
+    Iterating a snapshot yields every block of the course in the order of
+    presentation, as you'd see it on the Course Outline page in Studio. This
+    is a valid topological ordering of the course tree.
+    """
+
+    def __init__(self, course_key: CourseKey, store=None, depth=None):
+        self.course_key = course_key
+        self.store = store or modulestore()
+        self.course = self.store.get_course(course_key, depth=depth)
+
+        self._blocks = {}
+        self._parents = {}
+        self._ordinals = {}
+        self._ancestors = {}
+        self._children = {}
+
+        if self.course:
+            self._index(self.course)
+
+        log.debug(
+            "CourseSnapshot() indexed {n} blocks for {course_key}".format(n=len(self._blocks), course_key=course_key)
+        )
+
+    def _index(self, course):
+        """
+        iterative pre-order walk of the course tree.
+        """
+        course_location = normalize_usage_key(course.location)
+        self._blocks[course_location] = course
+        self._ancestors[course_location] = {course.category: course_location}
+
+        stack = [course]
+        while stack:
+            xblock = stack.pop()
+            location = normalize_usage_key(xblock.location)
+            children = xblock.get_children() if xblock.has_children else []
+            self._children[location] = [normalize_usage_key(child.location) for child in children]
+
+            for i, child in enumerate(children, start=1):
+                child_location = normalize_usage_key(child.location)
+                ancestors = dict(self._ancestors[location])
+                ancestors[child.category] = child_location
+
+                self._blocks[child_location] = child
+                self._parents[child_location] = location
+                self._ordinals[child_location] = i
+                self._ancestors[child_location] = ancestors
+
+            # push in reverse so that children pop in order of presentation.
+            stack.extend(reversed(children))
+
+    def __contains__(self, usage_key: UsageKey) -> bool:
+        return normalize_usage_key(usage_key) in self._blocks
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __iter__(self):
+        """
+        yield all blocks, in order of presentation.
+        """
+        if not self.course:
+            return
+        stack = [normalize_usage_key(self.course.location)]
+        while stack:
+            location = stack.pop()
+            yield self._blocks[location]
+            stack.extend(reversed(self._children.get(location, [])))
+
+    def get_block(self, usage_key: UsageKey):
+        """
+        Returns the XBlock at usage_key, or None if it is not part of this course.
+        """
+        return self._blocks.get(normalize_usage_key(usage_key))
+
+    def get_parent_location(self, usage_key: UsageKey) -> UsageKey:
+        """
+        Returns the UsageKey of the immediate parent of usage_key, or None.
+        """
+        return self._parents.get(normalize_usage_key(usage_key))
+
+    def get_parent(self, usage_key: UsageKey):
+        """
+        Returns the XBlock of the immediate parent of usage_key, or None.
+        """
+        return self._blocks.get(self.get_parent_location(usage_key))
+
+    def get_children_locations(self, usage_key: UsageKey) -> list:
+        """
+        Returns the UsageKeys of the children of usage_key, in order of presentation.
+        """
+        return self._children.get(normalize_usage_key(usage_key), [])
+
+    def get_ancestor_location(self, category: str, usage_key: UsageKey) -> UsageKey:
+        """
+        Returns the UsageKey of the nearest block of type ´category´ (course, chapter,
+        sequential, vertical) that contains usage_key, including usage_key itself.
+
+        Returns None if nothing is found.
+        """
+        category = (category or "").lower()
+        ancestors = self._ancestors.get(normalize_usage_key(usage_key), {})
+        return ancestors.get(category)
+
+    def get_ancestor(self, category: str, usage_key: UsageKey):
+        """
+        Returns the XBlock for the nearest block of type ´category´ that contains
+        usage_key, including usage_key itself.
+        """
+        return self._blocks.get(self.get_ancestor_location(category, usage_key))
+
+    def get_ordinal_position(self, usage_key: UsageKey) -> int:
+        """
+        returns the 1-based ordinal position of usage_key within its parent.
+        returns -1 if the block has no parent in this course.
+        """
+        return self._ordinals.get(normalize_usage_key(usage_key), -1)
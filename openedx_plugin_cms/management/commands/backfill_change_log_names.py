@@ -0,0 +1,109 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Management command to backfill the denormalized ancestor display names of
+CourseChangeLog records written before these were stored.
+"""
+# python
+import logging
+
+# django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+# open edx
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+# this repo
+from openedx_plugin_cms.course_snapshot import CourseSnapshot
+from openedx_plugin_cms.models import CourseChangeLog
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+# display name field: location field
+NAME_FIELDS = {
+    "parent_display_name": "parent_location",
+    "chapter_display_name": "chapter_location",
+    "sequential_display_name": "sequential_location",
+    "vertical_display_name": "vertical_location",
+}
+
+
+class Command(BaseCommand):
+    """
+        Backfill the parent, chapter, sequential and vertical display names of
+        legacy CourseChangeLog records, reading each course from the modulestore
+        once. Blocks that no longer exist get an empty name, so that no record
+        is left for the change log reports to look up in the modulestore.
+
+    Example usage:
+    ./manage.py cms backfill_change_log_names
+    ./manage.py cms backfill_change_log_names -c course-v1:edX+DemoX+Demo_Course
+    """
+
+    help = "backfill the ancestor display names of legacy CourseChangeLog records."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c",
+            "--course-key",
+            metavar="COURSE_KEY",
+            dest="course_key",
+            help="course run key. example: course-v1:edX+DemoX+Demo_Course",
+        )
+
+    def legacy_rows(self):
+        query = Q()
+        for name_field in NAME_FIELDS:
+            query |= Q(**{"{field}__isnull".format(field=name_field): True})
+        return CourseChangeLog.objects.filter(query)
+
+    def backfill_course(self, course_key: CourseKey) -> int:
+        snapshot = CourseSnapshot(course_key)
+
+        def get_display_name(location):
+            block = snapshot.get_block(location) if location else None
+            return str(block.display_name or "")[:255] if block else ""
+
+        rows = self.legacy_rows().filter(course_id=course_key).order_by("id")
+        columns = ["id"] + list(NAME_FIELDS.values())
+        n = 0
+        last_id = 0
+        while True:
+            batch = list(rows.filter(id__gt=last_id).values_list(*columns)[:BATCH_SIZE])
+            if not batch:
+                break
+            records = []
+            for row in batch:
+                record = CourseChangeLog(id=row[0])
+                for name_field, location in zip(NAME_FIELDS, row[1:]):
+                    setattr(record, name_field, get_display_name(location))
+                records.append(record)
+            with transaction.atomic():
+                CourseChangeLog.objects.bulk_update(records, list(NAME_FIELDS), batch_size=BATCH_SIZE)
+            n += len(records)
+            last_id = batch[-1][0]
+        return n
+
+    def handle(self, *args, **options):
+        course_key = options.get("course_key")
+        if course_key:
+            try:
+                course_keys = [CourseKey.from_string(course_key)]
+            except InvalidKeyError as e:
+                raise CommandError("You must specify a valid course-key") from e
+        else:
+            course_keys = list(self.legacy_rows().order_by().values_list("course_id", flat=True).distinct())
+
+        total = 0
+        for course_key in course_keys:
+            n = self.backfill_course(course_key)
+            total += n
+            self.stdout.write("{course_key}: backfilled {n} records".format(course_key=course_key, n=n))
+        self.stdout.write("backfilled {total} records in {n} courses".format(total=total, n=len(course_keys)))
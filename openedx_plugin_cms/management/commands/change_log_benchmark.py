@@ -0,0 +1,211 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Management command to benchmark the hot CourseChangeLog queries against a
+seeded table of several million rows.
+
+The seeded rows are written, and the queries timed, inside one transaction
+that is always rolled back, so nothing is ever left in CourseChangeLog.
+"""
+# python
+import logging
+import statistics
+import time
+from datetime import timedelta
+
+# django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+# open edx
+from opaque_keys.edx.keys import CourseKey
+
+# this repo
+from openedx_plugin_cms.models import CourseChangeLog
+
+log = logging.getLogger(__name__)
+
+BENCHMARK_ORG = "plugin_cms_benchmark"
+SEED_BATCH_SIZE = 10000
+PAGE_SIZE = 50
+
+
+def get_course_key(i: int) -> CourseKey:
+    return CourseKey.from_string("course-v1:{org}+C{i}+run".format(org=BENCHMARK_ORG, i=i))
+
+
+class Command(BaseCommand):
+    """
+        Management command to benchmark the hot CourseChangeLog queries.
+
+        Seeded rows all belong to courses of the org plugin_cms_benchmark.
+        They are seeded afresh on every run and rolled back when it ends,
+        whether it completes, fails or is interrupted.
+
+    Example usage:
+    ./manage.py cms change_log_benchmark --rows 3000000 --courses 1000
+    """
+
+    help = """
+    seed CourseChangeLog and print query plans and timings of its hot queries.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            metavar="N",
+            dest="rows",
+            type=int,
+            default=3000000,
+            help="total number of benchmark rows to seed.",
+        )
+        parser.add_argument(
+            "--courses",
+            metavar="N",
+            dest="courses",
+            type=int,
+            default=1000,
+            help="number of benchmark courses over which the rows are spread.",
+        )
+        parser.add_argument(
+            "--repeat",
+            metavar="N",
+            dest="repeat",
+            type=int,
+            default=5,
+            help="number of timed runs of each query.",
+        )
+
+    def benchmark_rows(self):
+        return CourseChangeLog.objects.filter(course_id__startswith="course-v1:{org}+".format(org=BENCHMARK_ORG))
+
+    def seed(self, rows: int, courses: int):
+        """
+        bulk insert ´rows´ benchmark rows. Callers are responsible for the transaction.
+        """
+        if self.benchmark_rows().exists():
+            raise CommandError(
+                "CourseChangeLog already holds rows of the {org} org. Delete them first.".format(org=BENCHMARK_ORG)
+            )
+
+        now = timezone.now()
+        course_keys = [get_course_key(i) for i in range(courses)]
+        start = time.monotonic()
+        for offset in range(0, rows, SEED_BATCH_SIZE):
+            batch = []
+            for i in range(offset, min(offset + SEED_BATCH_SIZE, rows)):
+                course_key = course_keys[i % courses]
+                location = course_key.make_usage_key("html", "block_{i}".format(i=i // courses))
+                batch.append(
+                    CourseChangeLog(
+                        operation=CourseChangeLog.DB_UPSERT,
+                        location=location,
+                        publication_date=now - timedelta(seconds=i),
+                        display_name="block {i}".format(i=i),
+                        category="html",
+                        course_id=course_key,
+                    )
+                )
+            CourseChangeLog.objects.bulk_create(batch, batch_size=SEED_BATCH_SIZE)
+            self.stdout.write("seeded {n} of {rows} rows".format(n=offset + len(batch), rows=rows))
+        self.stdout.write("seeded in {elapsed:.1f}s".format(elapsed=time.monotonic() - start))
+
+    def time_query(self, name: str, queryset, repeat: int):
+        """
+        print the query plan of queryset, and the median time to fully
+        evaluate it over ´repeat´ runs.
+        """
+        self.stdout.write("")
+        self.stdout.write("=" * 80)
+        self.stdout.write(name)
+        self.stdout.write("-" * 80)
+        self.stdout.write(str(queryset.query))
+        self.stdout.write("-" * 80)
+        self.stdout.write(queryset.explain())
+
+        timings = []
+        for _ in range(repeat):
+            start = time.monotonic()
+            n = len(list(queryset.all()))
+            timings.append(time.monotonic() - start)
+        self.stdout.write(
+            "{n} rows. median {median:.2f}ms, min {min:.2f}ms, max {max:.2f}ms".format(
+                n=n,
+                median=statistics.median(timings) * 1000,
+                min=min(timings) * 1000,
+                max=max(timings) * 1000,
+            )
+        )
+
+    def handle(self, *args, **options):
+        rows = options.get("rows")
+        courses = options.get("courses")
+        repeat = options.get("repeat")
+        if rows < 1 or courses < 1 or repeat < 1:
+            raise CommandError("--rows, --courses and --repeat must be 1 or more")
+
+        with transaction.atomic():
+            try:
+                self.seed(rows, courses)
+                self.benchmark(rows, courses, repeat)
+            finally:
+                transaction.set_rollback(True)
+                self.stdout.write("rolled back the benchmark rows")
+
+    def benchmark(self, rows: int, courses: int, repeat: int):
+        """
+        time the hot queries against the seeded rows.
+        """
+        course_key = get_course_key(courses // 2)
+        course_log = CourseChangeLog.objects.filter(course_id=course_key).select_related("published_by", "edited_by")
+        ids = list(CourseChangeLog.objects.filter(course_id=course_key).order_by("-id").values_list("id", flat=True))
+        if not ids:
+            raise CommandError("no benchmark rows found for {course_key}".format(course_key=course_key))
+        deep_id = ids[len(ids) * 9 // 10]
+        global_deep_id = self.benchmark_rows().order_by("id").values_list("id", flat=True)[rows // 10]
+        logged = list(
+            CourseChangeLog.objects.filter(course_id=course_key).values_list("location", "publication_date")[:500]
+        )
+        locations = [location for location, _ in logged]
+        versions = Q()
+        for location, publication_date in logged:
+            versions |= Q(location=location, publication_date=publication_date)
+
+        self.time_query(
+            "course change log, first page",
+            course_log.order_by("-id")[:PAGE_SIZE],
+            repeat,
+        )
+        self.time_query(
+            "course change log, deep page (keyset)",
+            course_log.filter(id__lt=deep_id).order_by("-id")[:PAGE_SIZE],
+            repeat,
+        )
+        self.time_query(
+            "all change logs, first page",
+            CourseChangeLog.objects.select_related("published_by", "edited_by").order_by("-id")[:PAGE_SIZE],
+            repeat,
+        )
+        self.time_query(
+            "all change logs, deep page (keyset)",
+            CourseChangeLog.objects.select_related("published_by", "edited_by")
+            .filter(id__lt=global_deep_id)
+            .order_by("-id")[:PAGE_SIZE],
+            repeat,
+        )
+        self.time_query(
+            "dirty check: logged versions of 500 blocks",
+            CourseChangeLog.objects.filter(course_id=course_key, location__in=locations).values_list(
+                "location", "publication_date"
+            ),
+            repeat,
+        )
+        self.time_query(
+            "bulk write: existing records of 500 block versions",
+            CourseChangeLog.objects.filter(versions),
+            repeat,
+        )
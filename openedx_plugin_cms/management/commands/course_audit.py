@@ -7,9 +7,16 @@ Management command to generate and persist Course Audit records.
 """
 # python
 import logging
+import multiprocessing
+import time
+import traceback
+from dateutil.parser import parse, ParserError
 
 # django
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max
+from django.utils import timezone
 
 # open edx
 from opaque_keys import InvalidKeyError
@@ -18,10 +25,43 @@ from openedx.core.djangoapps.content.course_overviews.models import CourseOvervi
 
 
 # this repo
-from openedx_plugin_cms.views.course_audit import persist_analyzed_course
+from openedx_plugin_cms.models import CourseAudit, CourseAuditJob
+from openedx_plugin_cms.views.course_audit import (
+    persist_analyzed_course,
+    start_audit_job,
+    _plugin_cms_course_audit_refresh,
+)
 
 log = logging.getLogger(__name__)
 
+SINCE_LAST_AUDIT = "last-audit"
+
+
+def _init_worker():
+    """
+    process pool initializer. each worker process opens its own
+    database connections rather than sharing the parent's sockets.
+    """
+    connections.close_all()
+
+
+def _audit_course(course_id: str, incremental: bool):
+    """
+    process pool worker. audits one course and reports the outcome
+    rather than raising, so that one failed course doesn't abort the run.
+
+    returns (course_id, succeeded, message, elapsed seconds)
+    """
+    start = time.monotonic()
+    try:
+        persist_analyzed_course(CourseKey.from_string(course_id), incremental=incremental)
+        return course_id, True, "", time.monotonic() - start
+    except Exception as e:  # noqa: B902
+        log.error("course_audit failed for {course_id}: {err}".format(course_id=course_id, err=traceback.format_exc()))
+        return course_id, False, str(e), time.monotonic() - start
+    finally:
+        connections.close_all()
+
 
 class Command(BaseCommand):
     """
@@ -29,6 +69,9 @@ class Command(BaseCommand):
 
     Example usage:
     ./manage.py cms audit_course -c course-v1:edX+DemoX+Demo_Course
+    ./manage.py cms audit_course --incremental
+    ./manage.py cms audit_course --workers 4 --since
+    ./manage.py cms audit_course --celery --since 2026-10-01
     """
 
     help = """
@@ -43,9 +86,181 @@ class Command(BaseCommand):
             dest="course_key",
             help="course run key. example: course-v1:edX+DemoX+Demo_Course",
         )
+        parser.add_argument(
+            "-i",
+            "--incremental",
+            action="store_true",
+            dest="incremental",
+            default=False,
+            help="only recompute the audit rows of blocks that changed since the last refresh.",
+        )
+        parser.add_argument(
+            "-w",
+            "--workers",
+            metavar="N",
+            dest="workers",
+            type=int,
+            default=1,
+            help="audit all courses using a pool of N worker processes.",
+        )
+        parser.add_argument(
+            "--celery",
+            action="store_true",
+            dest="celery",
+            default=False,
+            help="audit all courses by fanning out one Celery task per course.",
+        )
+        parser.add_argument(
+            "--since",
+            metavar="DATE",
+            dest="since",
+            nargs="?",
+            const=SINCE_LAST_AUDIT,
+            default=None,
+            help=(
+                "skip courses that have not been modified since DATE. If DATE is omitted then skip courses"
+                " that have not been modified since their own last audit."
+            ),
+        )
+
+    def progress(self, course_key):
+        """
+        returns a progress callback for persist_analyzed_course()
+        """
+
+        def callback(persisted, total):
+            self.stdout.write(
+                "{course_key}: persisted {persisted}{of_total} rows".format(
+                    course_key=course_key,
+                    persisted=persisted,
+                    of_total=" of {total}".format(total=total) if total is not None else "",
+                )
+            )
+
+        return callback
+
+    def get_course_ids(self, since=None) -> list:
+        """
+        returns the string course ids of all courses that need to be audited.
+        """
+        courses = CourseOverview.objects.all().values_list("id", "modified")
+        if not since:
+            return [str(course_id) for course_id, _ in courses]
+
+        if since == SINCE_LAST_AUDIT:
+            last_audits = {
+                str(row["course_id"]): row["last_audit"]
+                for row in CourseAudit.objects.values("course_id").annotate(last_audit=Max("modified"))
+            }
+        else:
+            try:
+                since_date = parse(since)
+            except (ParserError, ValueError, OverflowError) as e:
+                raise CommandError("--since must be a date. example: 2026-10-01") from e
+            if timezone.is_naive(since_date):
+                since_date = timezone.make_aware(since_date, timezone.utc)
+            last_audits = None
+
+        retval = []
+        for course_id, modified in courses:
+            course_id = str(course_id)
+            threshold = last_audits.get(course_id) if last_audits is not None else since_date
+            if threshold and modified and modified < threshold:
+                log.debug("course_audit skipping unmodified course {course_id}".format(course_id=course_id))
+                continue
+            retval.append(course_id)
+        return retval
+
+    def run_serial(self, course_ids: list, incremental: bool) -> list:
+        results = []
+        for course_id in course_ids:
+            self.stdout.write("Analyzing course {course_id}".format(course_id=course_id))
+            start = time.monotonic()
+            try:
+                persist_analyzed_course(
+                    CourseKey.from_string(course_id), incremental=incremental, progress=self.progress(course_id)
+                )
+                results.append((course_id, True, "", time.monotonic() - start))
+            except Exception as e:  # noqa: B902
+                log.error("course_audit failed for {course_id}: {err}".format(course_id=course_id, err=e))
+                results.append((course_id, False, str(e), time.monotonic() - start))
+        return results
+
+    def run_pool(self, course_ids: list, incremental: bool, workers: int) -> list:
+        # don't let the worker processes inherit our open database sockets.
+        connections.close_all()
+        with multiprocessing.get_context("fork").Pool(processes=workers, initializer=_init_worker) as pool:
+            pending = [pool.apply_async(_audit_course, (course_id, incremental)) for course_id in course_ids]
+            results = []
+            for async_result in pending:
+                result = async_result.get()
+                self.stdout.write(
+                    "{course_id}: {status}".format(course_id=result[0], status="ok" if result[1] else "FAILED")
+                )
+                results.append(result)
+        return results
+
+    def run_celery(self, course_ids: list, incremental: bool) -> list:
+        """
+        queue a CourseAuditJob per course, exactly as a Studio refresh does, so
+        that a course that already has an active job is skipped rather than
+        being audited twice at the same time.
+
+        the result of a skipped course has succeeded=None.
+        """
+        results = []
+        pending = []
+        for course_id in course_ids:
+            job, created = start_audit_job(CourseKey.from_string(course_id), incremental=incremental)
+            if not created:
+                message = "skipped: job {job_id} is already active".format(job_id=job.id) if job else "skipped: locked"
+                results.append((course_id, None, message, 0))
+            elif job.status == CourseAuditJob.FAILED:
+                results.append((course_id, False, job.message, 0))
+            else:
+                pending.append((course_id, _plugin_cms_course_audit_refresh.AsyncResult(job.task_id)))
+        self.stdout.write(
+            "queued {n} course audit jobs, skipped {skipped}".format(
+                n=len(pending), skipped=sum(1 for result in results if result[1] is None)
+            )
+        )
+
+        for course_id, async_result in pending:
+            start = time.monotonic()
+            try:
+                async_result.get(propagate=True, disable_sync_subtasks=False)
+                results.append((course_id, True, "", time.monotonic() - start))
+            except NotImplementedError:
+                # no Celery result backend is configured, so the outcome
+                # of the task cannot be collected.
+                results.append((course_id, True, "queued: {task_id}".format(task_id=async_result.id), 0))
+            except Exception as e:  # noqa: B902
+                results.append((course_id, False, str(e), time.monotonic() - start))
+        return results
+
+    def report(self, results: list):
+        failed = [result for result in results if result[1] is False]
+        skipped = [result for result in results if result[1] is None]
+        for course_id, succeeded, message, elapsed in results:
+            self.stdout.write(
+                "{status:7} {course_id} {elapsed:.1f}s {message}".format(
+                    status="skipped" if succeeded is None else "ok" if succeeded else "FAILED",
+                    course_id=course_id,
+                    elapsed=elapsed,
+                    message=message,
+                )
+            )
+        self.stdout.write(
+            "course_audit: {succeeded} succeeded, {failed} failed, {skipped} skipped".format(
+                succeeded=len(results) - len(failed) - len(skipped), failed=len(failed), skipped=len(skipped)
+            )
+        )
+        if failed:
+            raise CommandError("{n} course audits failed".format(n=len(failed)))
 
     def handle(self, *args, **options):
         course_key = options.get("course_key")
+        incremental = options.get("incremental")
         if course_key:
             # Parse the serialized course key into a CourseKey
             try:
@@ -53,10 +268,21 @@ class Command(BaseCommand):
             except InvalidKeyError as e:
                 raise CommandError("You must specify a valid course-key") from e
 
-            persist_analyzed_course(course_key)
+            persist_analyzed_course(course_key, incremental=incremental, progress=self.progress(course_key))
+            return
+
+        workers = options.get("workers") or 1
+        if workers < 1:
+            raise CommandError("--workers must be 1 or more")
+
+        course_ids = self.get_course_ids(since=options.get("since"))
+        self.stdout.write("auditing {n} courses".format(n=len(course_ids)))
+
+        if options.get("celery"):
+            results = self.run_celery(course_ids, incremental)
+        elif workers > 1:
+            results = self.run_pool(course_ids, incremental, workers)
         else:
-            courses = CourseOverview.objects.all()
-            for course in courses:
-                course_key = CourseKey.from_string(str(course))
-                print("Analyzing course {course_key}".format(course_key=course_key))
-                persist_analyzed_course(course_key)
+            results = self.run_serial(course_ids, incremental)
+
+        self.report(results)
@@ -0,0 +1,29 @@
+# coding=utf-8
+# Generated by Django 3.2.20 on 2026-10-17 10:12
+
+from django.db import migrations
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_cms", "0004_auto_20211215_1645"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="courseaudit",
+            name="location",
+            field=opaque_keys.edx.django.models.UsageKeyField(
+                blank=True,
+                db_index=True,
+                help_text=(  # noqa: B950
+                    "The block that this row describes. Used to incrementally refresh the audit. Example:"
+                    " block-v1:edX+DemoX+Demo_Course+type@vertical+block@vertical_1fef54c2b23b"
+                ),
+                max_length=255,
+                null=True,
+                verbose_name="Location Usage Key",
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# coding=utf-8
+# Generated by Django 3.2.20 on 2026-10-17 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_cms", "0005_courseaudit_location"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="coursechangelog",
+            name="parent_display_name",
+            field=models.CharField(
+                blank=True,
+                help_text="The display name of the Parent of this block, as of this change.",
+                max_length=255,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="coursechangelog",
+            name="chapter_display_name",
+            field=models.CharField(
+                blank=True,
+                help_text="The display name of the Chapter in which this block is contained, as of this change.",
+                max_length=255,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="coursechangelog",
+            name="sequential_display_name",
+            field=models.CharField(
+                blank=True,
+                help_text="The display name of the Section in which this block is contained, as of this change.",
+                max_length=255,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="coursechangelog",
+            name="vertical_display_name",
+            field=models.CharField(
+                blank=True,
+                help_text="The display name of the Vertical in which this block is contained, as of this change.",
+                max_length=255,
+                null=True,
+            ),
+        ),
+    ]
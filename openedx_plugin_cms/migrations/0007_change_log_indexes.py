@@ -0,0 +1,27 @@
+# coding=utf-8
+# Generated by Django 3.2.20 on 2026-10-17 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("openedx_plugin_cms", "0006_coursechangelog_display_names"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="courseaudit",
+            index=models.Index(fields=["course_id", "a_order"], name="plugin_cms_audit_order_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="coursechangelog",
+            index=models.Index(fields=["course_id", "-id"], name="plugin_cms_ccl_course_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="coursechangelog",
+            index=models.Index(
+                fields=["course_id", "location", "publication_date"], name="plugin_cms_ccl_course_loc_idx"
+            ),
+        ),
+    ]
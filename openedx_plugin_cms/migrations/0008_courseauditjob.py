@@ -0,0 +1,95 @@
+# coding=utf-8
+# Generated by Django 3.2.20 on 2026-10-17 14:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("openedx_plugin_cms", "0007_change_log_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseAuditJob",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "course_id",
+                    opaque_keys.edx.django.models.CourseKeyField(
+                        db_index=True,
+                        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+                        max_length=255,
+                        verbose_name="course_id Course Key",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("q", "Queued"), ("r", "Running"), ("s", "Succeeded"), ("f", "Failed")],
+                        db_index=True,
+                        default="q",
+                        max_length=1,
+                    ),
+                ),
+                (
+                    "incremental",
+                    models.BooleanField(
+                        default=True, help_text="True if only the rows of changed blocks are recomputed."
+                    ),
+                ),
+                (
+                    "task_id",
+                    models.CharField(
+                        blank=True,
+                        help_text="The id of the Celery task that runs this job.",
+                        max_length=255,
+                        null=True,
+                    ),
+                ),
+                (
+                    "rows_total",
+                    models.IntegerField(default=0, help_text="The number of Course Audit rows to be written."),
+                ),
+                (
+                    "rows_persisted",
+                    models.IntegerField(default=0, help_text="The number of Course Audit rows written so far."),
+                ),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("message", models.TextField(blank=True, default="")),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Requested By",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="courseauditjob",
+            index=models.Index(fields=["course_id", "-id"], name="plugin_cms_audit_job_idx"),
+        ),
+    ]
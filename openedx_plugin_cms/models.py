@@ -8,6 +8,7 @@ Course Management Studio App Models
 from django.db import models
 from model_utils.models import TimeStampedModel
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from opaque_keys.edx.django.models import CourseKeyField, UsageKeyField
 
@@ -15,6 +16,12 @@ User = get_user_model()
 
 
 class CourseAudit(TimeStampedModel):
+    class Meta:
+        indexes = [
+            # course audit pages: keyset pagination on a_order within a course.
+            models.Index(fields=["course_id", "a_order"], name="plugin_cms_audit_order_idx"),
+        ]
+
     def __str__(self):
         return f"{self.a_order}"
 
@@ -24,6 +31,17 @@ class CourseAudit(TimeStampedModel):
         verbose_name="course_id Course Key",
         help_text="Example: course-v1:edX+DemoX+Demo_Course",
     )
+    location = UsageKeyField(
+        max_length=255,
+        db_index=True,
+        verbose_name="Location Usage Key",
+        help_text=(  # noqa: B950
+            "The block that this row describes. Used to incrementally refresh the audit. Example:"
+            " block-v1:edX+DemoX+Demo_Course+type@vertical+block@vertical_1fef54c2b23b"
+        ),
+        blank=True,
+        null=True,
+    )
 
     a_order = models.IntegerField(
         verbose_name="Order",
@@ -190,9 +208,106 @@ class CourseAudit(TimeStampedModel):
     )
 
 
+class CourseAuditJob(TimeStampedModel):
+    """
+    One background refresh of the Course Audit report of a course.
+
+    The job record is created when a refresh is requested and is updated by
+    the Celery task as it runs, so that the Course Audit page can poll for
+    its progress. A course has at most one queued or running job at a time.
+    """
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["course_id", "-id"], name="plugin_cms_audit_job_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.course_id}: {self.get_status_display()}"
+
+    QUEUED = "q"
+    RUNNING = "r"
+    SUCCEEDED = "s"
+    FAILED = "f"
+    STATUSES = [(QUEUED, "Queued"), (RUNNING, "Running"), (SUCCEEDED, "Succeeded"), (FAILED, "Failed")]
+    ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+    course_id = CourseKeyField(
+        max_length=255,
+        db_index=True,
+        verbose_name="course_id Course Key",
+        help_text="Example: course-v1:edX+DemoX+Demo_Course",
+    )
+    status = models.CharField(max_length=1, choices=STATUSES, default=QUEUED, db_index=True)
+    incremental = models.BooleanField(
+        default=True,
+        help_text="True if only the rows of changed blocks are recomputed.",
+    )
+    task_id = models.CharField(
+        max_length=255,
+        help_text="The id of the Celery task that runs this job.",
+        blank=True,
+        null=True,
+    )
+    requested_by = models.ForeignKey(
+        User,
+        verbose_name="Requested By",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+    rows_total = models.IntegerField(
+        default=0,
+        help_text="The number of Course Audit rows to be written.",
+    )
+    rows_persisted = models.IntegerField(
+        default=0,
+        help_text="The number of Course Audit rows written so far.",
+    )
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    message = models.TextField(blank=True, default="")
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in self.ACTIVE_STATUSES
+
+    @property
+    def elapsed(self):
+        """
+        run time in seconds, or None if the job has not started.
+        """
+        if not self.started_at:
+            return None
+        return ((self.finished_at or timezone.now()) - self.started_at).total_seconds()
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "course_id": str(self.course_id),
+            "status": self.get_status_display().lower(),
+            "is_active": self.is_active,
+            "incremental": self.incremental,
+            "rows_total": self.rows_total,
+            "rows_persisted": self.rows_persisted,
+            "created": self.created.isoformat() if self.created else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "elapsed": self.elapsed,
+            "message": self.message,
+        }
+
+
 class CourseChangeLog(TimeStampedModel):
     class Meta:
         unique_together = ("location", "publication_date")
+        indexes = [
+            # change log pages: filter on course_id, newest first.
+            models.Index(fields=["course_id", "-id"], name="plugin_cms_ccl_course_id_idx"),
+            # dirty check: every (location, publication_date) of a course,
+            # read from the index alone.
+            models.Index(fields=["course_id", "location", "publication_date"], name="plugin_cms_ccl_course_loc_idx"),
+        ]
 
     def __str__(self):
         return f"{self.course_id}: {self.location}"
@@ -249,6 +364,12 @@ class CourseChangeLog(TimeStampedModel):
         blank=True,
         null=True,
     )
+    parent_display_name = models.CharField(
+        max_length=255,
+        help_text="The display name of the Parent of this block, as of this change.",
+        blank=True,
+        null=True,
+    )
     chapter_location = UsageKeyField(max_length=255, db_index=True, blank=True, null=True)
     chapter_url = models.URLField(
         max_length=255,
@@ -259,6 +380,12 @@ class CourseChangeLog(TimeStampedModel):
         blank=True,
         null=True,
     )
+    chapter_display_name = models.CharField(
+        max_length=255,
+        help_text="The display name of the Chapter in which this block is contained, as of this change.",
+        blank=True,
+        null=True,
+    )
     sequential_location = UsageKeyField(max_length=255, db_index=True, blank=True, null=True)
     sequential_url = models.URLField(
         max_length=255,
@@ -269,6 +396,12 @@ class CourseChangeLog(TimeStampedModel):
         blank=True,
         null=True,
     )
+    sequential_display_name = models.CharField(
+        max_length=255,
+        help_text="The display name of the Section in which this block is contained, as of this change.",
+        blank=True,
+        null=True,
+    )
     vertical_location = UsageKeyField(max_length=255, db_index=True, blank=True, null=True)
     vertical_url = models.URLField(
         max_length=255,
@@ -279,6 +412,12 @@ class CourseChangeLog(TimeStampedModel):
         blank=True,
         null=True,
     )
+    vertical_display_name = models.CharField(
+        max_length=255,
+        help_text="The display name of the Vertical in which this block is contained, as of this change.",
+        blank=True,
+        null=True,
+    )
 
     #
     # edit_info
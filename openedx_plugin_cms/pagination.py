@@ -0,0 +1,122 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Keyset (cursor) pagination for the change log and course audit pages.
+
+Django's Paginator issues a COUNT(*) for every page and then reads the page
+with LIMIT / OFFSET, which scans and discards every row before the
+requested page. Instead, we page on the primary key: each page is read with
+WHERE id > cursor ORDER BY id LIMIT n, which costs the same on page 1000 as
+it does on page 1. The total row count is optional and, when requested, is
+cached rather than recounted on every request.
+"""
+# python stuff
+import logging
+
+# django stuff
+from django.core.cache import cache
+
+log = logging.getLogger(__name__)
+
+COUNT_CACHE_NAMESPACE = "plugin.cms.pagination.count."
+COUNT_CACHE_TIMEOUT = 60 * 5
+
+
+def get_cached_count(queryset, cache_key: str, timeout: int = COUNT_CACHE_TIMEOUT) -> int:
+    """
+    returns the row count of queryset, cached under cache_key so that
+    COUNT(*) runs at most once per timeout rather than once per page.
+    """
+    cache_key = COUNT_CACHE_NAMESPACE + cache_key
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.order_by().count()
+        cache.set(cache_key, count, timeout)
+    return count
+
+
+class KeysetPage:
+    """
+    One page of rows plus the cursor tokens for the pages on either side.
+
+    Iterating a page yields its rows in display order.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None, count=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.count = count
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Page a queryset on a unique, indexed integer key (the primary key by default).
+
+    queryset:       any queryset. Its own ordering is replaced with the key.
+    per_page:       rows per page
+    descending:     True to page newest-first (ORDER BY key DESC)
+    """
+
+    def __init__(self, queryset, per_page: int, key: str = "id", descending: bool = False):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.key = key
+        self.descending = descending
+
+    def _get_key(self, row) -> int:
+        # rows are model instances, or dicts from a values() queryset.
+        return row[self.key] if isinstance(row, dict) else getattr(row, self.key)
+
+    def _filter(self, cursor: int, forward: bool):
+        # going forward through a descending list means smaller keys, and so on.
+        lookup = "lt" if forward == self.descending else "gt"
+        ordering = ("-" if forward == self.descending else "") + self.key
+        queryset = self.queryset
+        if cursor is not None:
+            queryset = queryset.filter(**{"{key}__{lookup}".format(key=self.key, lookup=lookup): cursor})
+        return queryset.order_by(ordering)
+
+    def get_page(self, after: int = None, before: int = None, count: int = None) -> KeysetPage:
+        """
+        returns the page of rows that immediately follow the row keyed on
+        ´after´, or that immediately precede the row keyed on ´before´.
+        With neither, returns the first page.
+
+        One extra row is read to learn whether there is a further page in
+        the direction of travel, so this never needs a COUNT(*).
+        """
+        forward = before is None
+        cursor = after if forward else before
+        rows = list(self._filter(cursor, forward)[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if not forward:
+            rows.reverse()
+
+        first_key = self._get_key(rows[0]) if rows else None
+        last_key = self._get_key(rows[-1]) if rows else None
+        if forward:
+            next_cursor = last_key if has_more else None
+            previous_cursor = first_key if after is not None else None
+        else:
+            next_cursor = last_key
+            previous_cursor = first_key if has_more else None
+
+        return KeysetPage(rows, next_cursor=next_cursor, previous_cursor=previous_cursor, count=count)
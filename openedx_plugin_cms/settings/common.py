@@ -19,3 +19,8 @@ def plugin_settings(settings):
     # Add the template directory for this package to
     # to the search path for Mako.
     settings.MAKO_TEMPLATE_DIRS_BASE.extend([TEMPLATES_DIR])
+
+    # number of seconds to wait after a course publish signal before evaluating
+    # the course for changes. Repeated publishes of the same course during
+    # this window are coalesced into a single evaluation.
+    settings.OPENEDX_PLUGIN_CMS_COURSE_PUBLISH_DELAY = 30
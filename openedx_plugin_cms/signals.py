@@ -12,10 +12,14 @@ Also see: https://docs.djangoproject.com/en/3.2/topics/signals/
 """
 # Python stuff
 import logging
+from uuid import uuid4
 
 # Django stuff
+from django.conf import settings
+from django.core.cache import cache
 from django.dispatch import receiver
 from celery import shared_task
+from celery.exceptions import MaxRetriesExceededError
 from edx_django_utils.monitoring import set_code_owner_attribute
 
 # Open edX stuff
@@ -47,23 +51,112 @@ log = logging.getLogger(__name__)
 log.info("openedx_plugin_cms.signals loaded")
 
 
-@shared_task()
+# Course publish coalescing.
+#
+# Studio emits course_published for every save of every unit, so a burst of
+# authoring activity can produce dozens of signals for the same course within
+# a few seconds. Each of these would otherwise trigger a full-course scan.
+# Instead, the first signal schedules a single evaluation to run after
+# COURSE_PUBLISH_DELAY seconds; any further signals that arrive before that
+# evaluation starts are folded into it. At most one evaluation per course is
+# ever running at a time.
+COURSE_PUBLISH_DELAY = getattr(settings, "OPENEDX_PLUGIN_CMS_COURSE_PUBLISH_DELAY", 30)
+COURSE_PUBLISH_TIME_LIMIT = 60 * 60
+# the worker is killed at COURSE_PUBLISH_TIME_LIMIT, so an evaluation
+# can never outlive its lock.
+COURSE_PUBLISH_LOCK_EXPIRE = COURSE_PUBLISH_TIME_LIMIT + 60
+COURSE_PUBLISH_RETRY_DELAY = COURSE_PUBLISH_DELAY or 30
+COURSE_PUBLISH_MAX_RETRIES = int(COURSE_PUBLISH_LOCK_EXPIRE / COURSE_PUBLISH_RETRY_DELAY) + 1
+COURSE_PUBLISH_CACHE_NAMESPACE = "plugin.cms.CourseChangeLog.publish."
+
+
+def _publish_cache_key(course_key_str: str, suffix: str) -> str:
+    return "{namespace}{suffix}.{course_key}".format(
+        namespace=COURSE_PUBLISH_CACHE_NAMESPACE, suffix=suffix, course_key=course_key_str
+    )
+
+
+@shared_task(bind=True, max_retries=COURSE_PUBLISH_MAX_RETRIES, time_limit=COURSE_PUBLISH_TIME_LIMIT)
 @set_code_owner_attribute
-def _course_publisher_hander(course_key_str):
+def _course_publisher_hander(self, course_key_str, user_id=None):
     """
     asynchronous task launcher
+
+    Evaluate a course for changes and log them. Serialized per course: if an
+    evaluation of this course is already running then this task reschedules
+    itself rather than running concurrently.
     """
-    course_key = CourseKey.from_string(course_key_str)
-    eval_course_block_changes(course_key)
+    pending_key = _publish_cache_key(course_key_str, "pending")
+    running_key = _publish_cache_key(course_key_str, "running")
+    user_key = _publish_cache_key(course_key_str, "user")
+
+    # cache.add fails if the key already exists
+    lock_id = self.request.id or uuid4().hex
+    if not cache.add(running_key, lock_id, COURSE_PUBLISH_LOCK_EXPIRE):
+        log.info(
+            "_course_publisher_hander() evaluation already running for {course_key}. rescheduling.".format(
+                course_key=course_key_str
+            )
+        )
+        try:
+            raise self.retry(countdown=COURSE_PUBLISH_RETRY_DELAY)
+        except MaxRetriesExceededError:
+            # don't drop the publish: start over with a fresh retry budget.
+            log.error(
+                "_course_publisher_hander() retries exhausted for {course_key}. requeueing.".format(
+                    course_key=course_key_str
+                )
+            )
+            _course_publisher_hander.apply_async(args=[course_key_str, user_id], countdown=COURSE_PUBLISH_RETRY_DELAY)
+            return
+
+    try:
+        # from this point forward any new publish signal needs to schedule
+        # a new evaluation, because this one might not see its changes.
+        cache.delete(pending_key)
+        user_id = cache.get(user_key, user_id)
+        cache.delete(user_key)
+
+        course_key = CourseKey.from_string(course_key_str)
+        user = get_user(user_id) if user_id else None
+        eval_course_block_changes(course_key, user or None)
+    finally:
+        # only release the lock if it is still ours.
+        if cache.get(running_key) == lock_id:
+            cache.delete(running_key)
 
 
 @receiver(SignalHandler.course_published, dispatch_uid="plugin_course_publish")
 def _plugin_listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
     """
-    Receives publishing signal and logs block meta data and the user
+    Receives publishing signal and queues a deduplicated, asynchronous
+    evaluation of the course that logs block meta data and the user.
     """
     user_id = kwargs.get("user_id")
-    eval_course_block_changes(course_key, get_user(user_id))
+    course_key_str = str(course_key)
+    pending_key = _publish_cache_key(course_key_str, "pending")
+    user_key = _publish_cache_key(course_key_str, "user")
+
+    # remember the most recent publisher so that the coalesced
+    # evaluation attributes its changes to them.
+    if user_id:
+        cache.set(user_key, user_id, COURSE_PUBLISH_DELAY + COURSE_PUBLISH_LOCK_EXPIRE)
+
+    # cache.add fails if the key already exists, meaning that an
+    # evaluation of this course is already queued and has not yet started.
+    if cache.add(pending_key, True, COURSE_PUBLISH_DELAY + COURSE_PUBLISH_LOCK_EXPIRE):
+        try:
+            _course_publisher_hander.apply_async(args=[course_key_str, user_id], countdown=COURSE_PUBLISH_DELAY)
+            log.info("queued change log evaluation for {course_key}".format(course_key=course_key_str))
+        except Exception as e:  # noqa: B902
+            # don't leave a stale marker behind that would suppress the
+            # next publish signal for this course.
+            cache.delete(pending_key)
+            log.error(
+                "unable to queue change log evaluation for {course_key}: {err}".format(course_key=course_key_str, err=e)
+            )
+    else:
+        log.debug("change log evaluation already queued for {course_key}".format(course_key=course_key_str))
     return
 
 
@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Shared fixtures of the openedx_plugin_cms tests
+"""
+# open edx stuff
+try:
+    # for olive and later
+    from xmodule.modulestore import ModuleStoreEnum
+    from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+    from xmodule.modulestore.tests.factories import CourseFactory
+
+    try:
+        from xmodule.modulestore.tests.factories import BlockFactory
+    except ImportError:
+        from xmodule.modulestore.tests.factories import ItemFactory as BlockFactory
+except ImportError:
+    # for backward compatibility with nutmeg and earlier
+    from common.lib.xmodule.xmodule.modulestore import ModuleStoreEnum
+    from common.lib.xmodule.xmodule.modulestore.tests.django_utils import (
+        ModuleStoreTestCase,
+    )
+    from common.lib.xmodule.xmodule.modulestore.tests.factories import (
+        CourseFactory,
+        ItemFactory as BlockFactory,
+    )
+
+
+class CourseTestCase(ModuleStoreTestCase):
+    """
+    a published course of one chapter, one graded sequence, one vertical
+    and one problem.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.course = CourseFactory.create()
+        self.chapter = self.create_block("chapter", self.course, display_name="Chapter")
+        self.sequence = self.create_block(
+            "sequential", self.chapter, display_name="Sequence", graded=True, format="Homework"
+        )
+        self.vertical = self.create_block("vertical", self.sequence, display_name="Vertical")
+        self.problem = self.create_block("problem", self.vertical, display_name="Problem")
+
+    def create_block(self, category, parent, publish=True, **fields):
+        return BlockFactory.create(
+            category=category, parent_location=parent.location, user_id=self.user.id, publish_item=publish, **fields
+        )
+
+    def get_course(self):
+        return self.store.get_course(self.course.id, depth=None)
+
+    def update_block(self, location, publish=True, **fields):
+        """
+        set fields of the draft of a block, and publish it.
+        """
+        with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred, self.course.id):
+            block = self.store.get_item(location)
+            for name, value in fields.items():
+                setattr(block, name, value)
+            block = self.store.update_item(block, self.user.id)
+            if publish:
+                self.store.publish(location, self.user.id)
+        return block
+
+    def move_block(self, block, parent, new_parent):
+        """
+        move block from the end of parent to the end of new_parent, and publish both.
+        """
+        with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred, self.course.id):
+            children = [child for child in self.store.get_item(parent.location).children if child != block.location]
+            new_children = self.store.get_item(new_parent.location).children + [block.location]
+        self.update_block(parent.location, children=children)
+        self.update_block(new_parent.location, children=new_children)
+
+    def delete_block(self, block, parent):
+        """
+        delete block from the draft and publish its parent.
+        """
+        with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred, self.course.id):
+            self.store.delete_item(block.location, self.user.id)
+            self.store.publish(parent.location, self.user.id)
@@ -0,0 +1,129 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the course audit analyzer and its persistence
+"""
+# python stuff
+from datetime import datetime, timedelta
+from pytz import UTC
+
+# 3rd party
+from freezegun import freeze_time
+
+# this repo
+from openedx_plugin_cms.course_snapshot import normalize_usage_key
+from openedx_plugin_cms.models import CourseAudit
+from openedx_plugin_cms.tests.base import CourseTestCase
+from openedx_plugin_cms.views.course_audit import (
+    CourseAnalysisContext,
+    get_analyzed_course,
+    persist_analyzed_course,
+    refresh_analyzed_course,
+)
+
+
+class TestGradeWeight(CourseTestCase):
+    def test_format_in_grading_policy(self):
+        context = CourseAnalysisContext(self.get_course())
+        grader = [grader for grader in self.get_course().raw_grader if grader["type"] == "Homework"][0]
+        assert context.get_grade_weight(self.sequence) == (grader["weight"], grader["min_count"])
+
+    def test_format_not_in_grading_policy(self):
+        sequence = self.create_block("sequential", self.chapter, graded=True, format="Not In The Policy")
+        vertical = self.create_block("vertical", sequence)
+        problem = self.create_block("problem", vertical)
+
+        context = CourseAnalysisContext(self.get_course())
+        assert context.get_grade_weight(sequence) == (None, None)
+
+        # the row is persisted, with no weight, rather than failing the whole refresh.
+        persist_analyzed_course(self.course.id)
+        rows = {row.location: row for row in CourseAudit.objects.filter(course_id=self.course.id)}
+        row = rows[normalize_usage_key(problem.location)]
+        assert row.g_section_weight is None
+        assert row.h_number_graded_sections is None
+        assert rows[normalize_usage_key(self.problem.location)].g_section_weight
+
+
+class TestIncrementalRefresh(CourseTestCase):
+    """
+    an incremental refresh must leave the same rows as a full refresh.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.html = self.create_block("html", self.vertical, display_name="Html")
+        persist_analyzed_course(self.course.id)
+        self.row_ids = self.get_row_ids()
+
+    def later(self):
+        # block dates are stored to the second, so edits are made an hour
+        # after the blocks were created for them to be seen as changes.
+        return freeze_time(datetime.now(UTC) + timedelta(hours=1))
+
+    def get_row_ids(self) -> dict:
+        return {
+            normalize_usage_key(location): row_id
+            for row_id, location in CourseAudit.objects.filter(course_id=self.course.id).values_list("id", "location")
+        }
+
+    def assert_matches_full_refresh(self):
+        def key(row):
+            return (normalize_usage_key(row.location), row.a_order, row.c_module, row.d_section, row.e_unit)
+
+        expected = sorted(key(row) for row in get_analyzed_course(self.course.id))
+        stored = sorted(key(row) for row in CourseAudit.objects.filter(course_id=self.course.id))
+        assert stored == expected
+
+    def test_edit(self):
+        with self.later():
+            self.update_block(self.problem.location, display_name="Edited problem")
+
+        assert refresh_analyzed_course(self.course.id)
+        self.assert_matches_full_refresh()
+
+        row_ids = self.get_row_ids()
+        problem_location = normalize_usage_key(self.problem.location)
+        assert row_ids[problem_location] != self.row_ids[problem_location]
+        # the rows of unchanged blocks are kept.
+        for block in (self.chapter, self.sequence, self.vertical, self.html):
+            location = normalize_usage_key(block.location)
+            assert row_ids[location] == self.row_ids[location]
+
+    def test_move(self):
+        with self.later():
+            new_vertical = self.create_block("vertical", self.sequence, display_name="New vertical")
+            self.move_block(self.problem, self.vertical, new_vertical)
+
+        assert refresh_analyzed_course(self.course.id)
+        self.assert_matches_full_refresh()
+        problem = CourseAudit.objects.get(id=self.get_row_ids()[normalize_usage_key(self.problem.location)])
+        assert problem.e_unit == "New vertical"
+
+    def test_delete(self):
+        with self.later():
+            self.delete_block(self.problem, self.vertical)
+
+        assert refresh_analyzed_course(self.course.id)
+        self.assert_matches_full_refresh()
+        assert normalize_usage_key(self.problem.location) not in self.get_row_ids()
+
+    def test_course_block_change(self):
+        with self.later():
+            self.update_block(self.course.location, display_name="Renamed course")
+
+        # the course block's fields are repeated on every row, so this needs a full refresh.
+        assert not refresh_analyzed_course(self.course.id)
+        assert self.get_row_ids() == self.row_ids
+
+        persist_analyzed_course(self.course.id, incremental=True)
+        self.assert_matches_full_refresh()
+        assert set(CourseAudit.objects.filter(course_id=self.course.id).values_list("b_course", flat=True)) == {
+            "Renamed course"
+        }
+
+    def test_unchanged(self):
+        assert refresh_analyzed_course(self.course.id)
+        assert self.get_row_ids() == self.row_ids
@@ -0,0 +1,125 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of CourseSnapshot and of the change log evaluation and writes that use it
+"""
+# python stuff
+from datetime import datetime
+from pytz import UTC
+
+# this repo
+from openedx_plugin_cms.auditor import eval_course_block_changes, write_log_bulk
+from openedx_plugin_cms.course_snapshot import CourseSnapshot, normalize_usage_key
+from openedx_plugin_cms.models import CourseChangeLog
+from openedx_plugin_cms.tests.base import CourseTestCase
+from openedx_plugin_cms.utils import xblock_publication_date
+
+
+class TestCourseSnapshot(CourseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.html = self.create_block("html", self.vertical, display_name="Html")
+        self.other_vertical = self.create_block("vertical", self.sequence, display_name="Other vertical")
+        self.other_problem = self.create_block("problem", self.other_vertical, display_name="Other problem")
+        self.snapshot = CourseSnapshot(self.course.id, store=self.store)
+
+    def test_order_of_presentation(self):
+        expected = [
+            self.course,
+            self.chapter,
+            self.sequence,
+            self.vertical,
+            self.problem,
+            self.html,
+            self.other_vertical,
+            self.other_problem,
+        ]
+        assert [normalize_usage_key(block.location) for block in self.snapshot] == [
+            normalize_usage_key(block.location) for block in expected
+        ]
+        assert len(self.snapshot) == len(expected)
+
+    def test_parents_and_ordinals_match_the_modulestore(self):
+        for block in self.snapshot:
+            location = normalize_usage_key(block.location)
+            parent_location = self.store.get_parent_location(block.location)
+            assert self.snapshot.get_parent_location(location) == normalize_usage_key(parent_location)
+            if parent_location:
+                siblings = [normalize_usage_key(child) for child in self.store.get_item(parent_location).children]
+                assert self.snapshot.get_ordinal_position(location) == siblings.index(location) + 1
+            else:
+                assert self.snapshot.get_ordinal_position(location) == -1
+
+    def test_ancestors(self):
+        for category, ancestor in (
+            ("course", self.course),
+            ("chapter", self.chapter),
+            ("sequential", self.sequence),
+            ("vertical", self.other_vertical),
+            ("problem", self.other_problem),
+        ):
+            assert self.snapshot.get_ancestor_location(category, self.other_problem.location) == normalize_usage_key(
+                ancestor.location
+            )
+        assert self.snapshot.get_ancestor_location("vertical", self.chapter.location) is None
+        assert self.snapshot.get_block(self.course.id.make_usage_key("problem", "missing")) is None
+
+
+class TestEvalCourseBlockChanges(CourseTestCase):
+    def get_logged_locations(self) -> list:
+        return [
+            normalize_usage_key(location)
+            for location in CourseChangeLog.objects.filter(course_id=self.course.id).values_list("location", flat=True)
+        ]
+
+    def test_unpublished_blocks_are_not_logged(self):
+        draft = self.create_block("problem", self.vertical, publish=False, display_name="Draft problem")
+
+        eval_course_block_changes(self.course.id, self.user)
+
+        logged = self.get_logged_locations()
+        assert normalize_usage_key(self.problem.location) in logged
+        assert normalize_usage_key(draft.location) not in logged
+
+    def test_logged_blocks_are_not_logged_again(self):
+        eval_course_block_changes(self.course.id, self.user)
+        logged = self.get_logged_locations()
+
+        eval_course_block_changes(self.course.id, self.user)
+        assert self.get_logged_locations() == logged
+
+
+class TestWriteLogBulk(CourseTestCase):
+    def create_log(self, xblock, publication_date):
+        return CourseChangeLog.objects.create(
+            course_id=self.course.id,
+            location=xblock.location,
+            display_name="Logged",
+            category=xblock.category,
+            publication_date=publication_date,
+        )
+
+    def test_existing_records_are_matched_on_location_and_publication_date(self):
+        snapshot = CourseSnapshot(self.course.id, store=self.store)
+        problem = snapshot.get_block(self.problem.location)
+        vertical = snapshot.get_block(self.vertical.location)
+        older = self.create_log(problem, datetime(2020, 1, 1, tzinfo=UTC))
+        current = self.create_log(vertical, xblock_publication_date(vertical))
+
+        assert write_log_bulk(self.course.id, [problem, vertical], self.user, snapshot) == 2
+
+        # an older version of the problem is left alone and its current version is added.
+        older.refresh_from_db()
+        assert older.display_name == "Logged"
+        assert CourseChangeLog.objects.filter(location=problem.location).count() == 2
+        created = CourseChangeLog.objects.get(
+            location=problem.location, publication_date=xblock_publication_date(problem)
+        )
+        assert created.display_name == problem.display_name
+
+        # the record of the vertical's current version is updated in place.
+        current.refresh_from_db()
+        assert current.display_name == vertical.display_name
+        assert CourseChangeLog.objects.filter(location=vertical.location).count() == 1
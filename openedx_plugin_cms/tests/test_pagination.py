@@ -0,0 +1,80 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the keyset pagination of the change log and course audit pages
+"""
+# django stuff
+from django.test import TestCase
+
+# open edx stuff
+from opaque_keys.edx.keys import CourseKey
+
+# this repo
+from openedx_plugin_api.pagination import parse_cursor
+from openedx_plugin_cms.models import CourseAudit
+from openedx_plugin_cms.pagination import KeysetPaginator
+
+COURSE_KEY = CourseKey.from_string("course-v1:edX+Pages+2026")
+
+
+class TestKeysetPaginator(TestCase):
+    def setUp(self):
+        super().setUp()
+        # ten rows, keyed 1..10 on a_order, created out of order.
+        for a_order in (4, 9, 1, 7, 2, 10, 5, 3, 8, 6):
+            CourseAudit.objects.create(course_id=COURSE_KEY, a_order=a_order)
+        self.queryset = CourseAudit.objects.filter(course_id=COURSE_KEY)
+
+    def get_page(self, descending=False, values=False, **kwargs):
+        queryset = self.queryset.values("a_order") if values else self.queryset
+        paginator = KeysetPaginator(queryset, per_page=3, key="a_order", descending=descending)
+        page = paginator.get_page(**kwargs)
+        keys = [row["a_order"] if values else row.a_order for row in page]
+        return keys, page.previous_cursor, page.next_cursor
+
+    def test_forward(self):
+        assert self.get_page() == ([1, 2, 3], None, 3)
+        assert self.get_page(after=3) == ([4, 5, 6], 4, 6)
+        assert self.get_page(after=9) == ([10], 10, None)
+        assert self.get_page(after=10) == ([], None, None)
+
+    def test_backward(self):
+        assert self.get_page(before=10) == ([7, 8, 9], 7, 9)
+        assert self.get_page(before=4) == ([1, 2, 3], None, 3)
+        assert self.get_page(before=2) == ([1], None, 1)
+
+    def test_descending(self):
+        assert self.get_page(descending=True) == ([10, 9, 8], None, 8)
+        assert self.get_page(descending=True, after=8) == ([7, 6, 5], 7, 5)
+        assert self.get_page(descending=True, after=2) == ([1], 1, None)
+        assert self.get_page(descending=True, before=1) == ([4, 3, 2], 4, 2)
+        assert self.get_page(descending=True, before=9) == ([10], None, 10)
+
+    def test_cursors_walk_every_row_once(self):
+        keys, _, next_cursor = self.get_page()
+        while next_cursor is not None:
+            page_keys, previous_cursor, next_cursor = self.get_page(after=next_cursor)
+            # the previous cursor of a page leads back to the page before it.
+            assert self.get_page(before=previous_cursor)[0] == keys[-3:]
+            keys += page_keys
+        assert keys == list(range(1, 11))
+
+    def test_values_rows(self):
+        assert self.get_page(values=True, after=3) == ([4, 5, 6], 4, 6)
+
+    def test_page(self):
+        page = KeysetPaginator(self.queryset, per_page=3, key="a_order").get_page(count=10)
+        assert len(page) == 3
+        assert page.count == 10
+        assert page.has_next
+        assert not page.has_previous
+
+    def test_malformed_cursor(self):
+        assert parse_cursor("7") == 7
+        assert parse_cursor(None) is None
+        assert parse_cursor("") is None
+        for value in ("abc", "1.5", "-1", [3]):
+            with self.assertRaises(ValueError):
+                parse_cursor(value)
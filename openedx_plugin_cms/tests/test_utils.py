@@ -0,0 +1,63 @@
+# coding=utf-8
+"""
+Lawrence McDaniel - https://lawrencemcdaniel.com
+Oct-2026
+
+Tests of the bulk dirty check of the change log
+"""
+# python stuff
+from datetime import datetime, timedelta
+from pytz import UTC
+
+# 3rd party
+from freezegun import freeze_time
+
+# this repo
+from openedx_plugin_cms.course_snapshot import CourseSnapshot, normalize_usage_key
+from openedx_plugin_cms.models import CourseChangeLog
+from openedx_plugin_cms.tests.base import CourseTestCase
+from openedx_plugin_cms.utils import get_dirty_blocks, xblock_publication_date
+
+
+class TestGetDirtyBlocks(CourseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.draft = self.create_block("problem", self.vertical, publish=False, display_name="Draft problem")
+
+    def get_dirty_locations(self) -> set:
+        snapshot = CourseSnapshot(self.course.id, store=self.store)
+        return {
+            normalize_usage_key(xblock.location) for xblock in get_dirty_blocks(self.course.id, snapshot, self.store)
+        }
+
+    def log(self, xblock, publication_date=None):
+        CourseChangeLog.objects.create(
+            course_id=self.course.id,
+            location=xblock.location,
+            display_name=xblock.display_name,
+            category=xblock.category,
+            publication_date=publication_date or xblock_publication_date(xblock),
+        )
+
+    def test_published_blocks_are_dirty(self):
+        dirty = self.get_dirty_locations()
+        for xblock in (self.chapter, self.sequence, self.vertical, self.problem):
+            assert normalize_usage_key(xblock.location) in dirty
+
+    def test_unpublished_blocks_are_not_dirty(self):
+        assert normalize_usage_key(self.draft.location) not in self.get_dirty_locations()
+
+    def test_logged_blocks_are_not_dirty(self):
+        snapshot = CourseSnapshot(self.course.id, store=self.store)
+        self.log(snapshot.get_block(self.problem.location))
+        # a row for an older version of a block does not count as logged.
+        self.log(self.chapter, publication_date=datetime(2020, 1, 1, tzinfo=UTC))
+
+        dirty = self.get_dirty_locations()
+        assert normalize_usage_key(self.problem.location) not in dirty
+        assert normalize_usage_key(self.chapter.location) in dirty
+
+        # once it is edited and published again, the block is dirty again.
+        with freeze_time(datetime.now(UTC) + timedelta(hours=1)):
+            self.update_block(self.problem.location, display_name="Edited problem")
+        assert normalize_usage_key(self.problem.location) in self.get_dirty_locations()
@@ -13,6 +13,7 @@ from .views.course_audit import (
     plugin_cms_course_audit,
     plugin_cms_course_audit_csv,
     plugin_cms_course_audit_refresh,
+    plugin_cms_course_audit_status,
 )
 from .views.course_audit_html import (
     plugin_cms_course_audit_html,
@@ -54,6 +55,12 @@ if waffle_switches[AUDIT_REPORT]:
             plugin_cms_course_audit_refresh,
             name="plugin_cms_course_audit_refresh",
         ),
+        # Course Audit - refresh job status
+        url(
+            rf"^courses/{settings.COURSE_ID_PATTERN}/audit/status/$",
+            plugin_cms_course_audit_status,
+            name="plugin_cms_course_audit_status",
+        ),
         # Course Audit paginated UI
         url(
             rf"^courses/{settings.COURSE_ID_PATTERN}/audit/$",
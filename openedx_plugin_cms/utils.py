@@ -9,6 +9,7 @@ App Models
 # python stuff
 import datetime as dt
 import logging
+from hashlib import sha256
 from re import X
 from lxml.html import fromstring
 from os.path import basename
@@ -17,16 +18,14 @@ from urllib.parse import urlparse
 # django stuff
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 # open edx common libs
 from xblock.fields import Boolean, String
 from xblock.core import XBlock
-from opaque_keys.edx.keys import UsageKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
 
 
-# open edx stuff
-from cms.djangoapps.contentstore.utils import get_lms_link_for_item
-
 try:
     # for olive and later
     from xmodule.modulestore.django import modulestore
@@ -42,30 +41,74 @@ except ImportError:
 
 # our stuff
 from .models import CourseChangeLog
+from .course_snapshot import CourseSnapshot, normalize_usage_key
 
 User = get_user_model()
 log = logging.getLogger(__name__)
 
 
-def link_extractor(html: str):
+EXTRACTOR_CACHE_NAMESPACE = "plugin.cms.extractor.cache."
+EXTRACTOR_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def html_extractor(html: str):
     """
     receives ´html´ from xblock.data
-    finds and returns a list of all external urls.
+    parses the document once and returns a tuple of
+    (external links, Studio CMS assets), each formatted
+    as a comma-delimited string.
+
+    results are cached on a hash of the html content so that
+    unchanged blocks are never re-parsed across audit refreshes.
     """
+    if not html:
+        return "", ""
+
+    cache_key = EXTRACTOR_CACHE_NAMESPACE + sha256(html.encode("utf-8")).hexdigest()
+    retval = cache.get(cache_key)
+    if retval is not None:
+        return retval
+
     try:
         doc = fromstring(html)
     except Exception:  # noqa: B902
-        return ""
+        retval = ("", "")
+        cache.set(cache_key, retval, EXTRACTOR_CACHE_TIMEOUT)
+        return retval
 
-    retval = []
+    site_name = settings.SITE_NAME.lower()
+    links = []
+    seen = set()
     for _, _, link, _ in doc.iterlinks():
         url = str(link).lower()
+        if url in seen:
+            continue
         parsed_url = urlparse(url)
         domain = str(parsed_url.netloc).lower()
-        if domain != "" and domain != settings.SITE_NAME.lower() and url not in retval:
-            retval.append(url)
+        if domain != "" and domain != site_name:
+            seen.add(url)
+            links.append(url)
+
+    assets = []
+    for img in doc.xpath("//img"):
+        filename_and_path = img.attrib.get("src")
+        if filename_and_path is None:
+            continue
+        filename = basename(filename_and_path)
+        assets.append(filename)
 
-    return ",\r\n".join(retval)
+    retval = (",\r\n".join(links), ",\r\n".join(assets))
+    cache.set(cache_key, retval, EXTRACTOR_CACHE_TIMEOUT)
+    return retval
+
+
+def link_extractor(html: str):
+    """
+    receives ´html´ from xblock.data
+    finds and returns a list of all external urls.
+    """
+    links, _ = html_extractor(html)
+    return links
 
 
 def asset_extractor(html: str):
@@ -73,17 +116,8 @@ def asset_extractor(html: str):
     receives ´html´ from xblock.data
     finds and returns a list of Studio CMS assets.
     """
-    try:
-        doc = fromstring(html)
-    except Exception:  # noqa: B902
-        return ""
-
-    retval = []
-    for img in doc.xpath("//img"):
-        filename_and_path = img.attrib["src"]
-        filename = basename(filename_and_path)
-        retval.append(filename)
-    return ",\r\n".join(retval)
+    _, assets = html_extractor(html)
+    return assets
 
 
 def get_grade_weight(xblock: XBlock, course: CourseBlock):
@@ -105,16 +139,22 @@ def get_grade_weight(xblock: XBlock, course: CourseBlock):
             return grade_type_dict["weight"], grade_type_dict["min_count"]
 
 
-def get_ordinal_position(block_key: UsageKey, parent_key: UsageKey) -> int:
+def get_ordinal_position(block_key: UsageKey, parent_key: UsageKey, snapshot: CourseSnapshot = None) -> int:
     """
     returns the ordinal position of the  chile block_key within the parent parent_key.
     returns -1 if not found within the parent_key xblock.
+
+    if a CourseSnapshot is provided then the position is resolved from its index,
+    without any modulestore reads.
     """
     log.debug(
         "get_ordinal_position() block_key: {block_key}, parent_key: {parent_key}".format(
             block_key=block_key, parent_key=parent_key
         )
     )
+    if snapshot and block_key in snapshot:
+        return snapshot.get_ordinal_position(block_key)
+
     i = 0
     xblock_parent = modulestore().get_item(parent_key)
     if xblock_parent:
@@ -126,7 +166,7 @@ def get_ordinal_position(block_key: UsageKey, parent_key: UsageKey) -> int:
     return -1
 
 
-def get_parent_block(category: String, block_key: UsageKey) -> UsageKey:
+def get_parent_block(category: String, block_key: UsageKey, snapshot: CourseSnapshot = None) -> UsageKey:
     """
     Returns the XBlock for one of the following: course, chapter, sequential, vertical.
     These equate to:
@@ -140,6 +180,9 @@ def get_parent_block(category: String, block_key: UsageKey) -> UsageKey:
     category = category or ""
     category = category.lower()
 
+    if snapshot and block_key in snapshot:
+        return snapshot.get_ancestor(category, block_key)
+
     while True:
         xblock = modulestore().get_item(block_key)
 
@@ -153,7 +196,7 @@ def get_parent_block(category: String, block_key: UsageKey) -> UsageKey:
         block_key = parent.location
 
 
-def get_parent_location(category: String, block_key: UsageKey) -> UsageKey:
+def get_parent_location(category: String, block_key: UsageKey, snapshot: CourseSnapshot = None) -> UsageKey:
     """
     Returns the UsageKey (location) for one of the following: course, chapter, sequential, vertical.
     These equate to:
@@ -164,6 +207,9 @@ def get_parent_location(category: String, block_key: UsageKey) -> UsageKey:
 
     Returns None if nothing is found.
     """
+    if snapshot and block_key in snapshot:
+        return snapshot.get_ancestor_location(category, block_key)
+
     parent = get_parent_block(category, block_key)
     return parent.location if parent else None
 
@@ -220,15 +266,31 @@ def get_xml_filename(xblock: XBlock) -> str:
     return ""
 
 
-def get_url(xblock: XBlock, app="cms") -> str:
+def get_lms_jump_url(usage_key: UsageKey, host_url=None) -> str:
+    """
+    returns the LMS "jump to" url for a block, formatted directly from its
+    usage key.
+    https://dev.engineplatform.co.uk/courses/course-v1:edX+DemoX+Demo_Course/jump_to/block-v1:edX+DemoX+Demo_Course+type@vertical+block@vertical_1fef54c2b23b
+    """
+    host_url = host_url or get_host_url("lms")
+    return "{host_url}/courses/{course_key}/jump_to/{usage_key}".format(
+        host_url=host_url, course_key=str(usage_key.course_key), usage_key=str(usage_key)
+    )
+
+
+def get_url(xblock: XBlock, app="cms", host_url=None, parent: XBlock = None) -> str:
     """
     returns the application url to the corresponding
     page in the LMS/CMS for the xblock.
+
+    pass the xblock's parent if it's already at hand, to avoid
+    re-fetching it from the modulestore.
     """
-    parent = modulestore().get_item(xblock.parent)
-    host_url = get_host_url(app)
+    host_url = host_url or get_host_url(app)
     course_key = str(xblock.location.course_key)
     if app == "cms":
+        if parent is None:
+            parent = modulestore().get_item(xblock.parent)
         if parent.category == "vertical":
             # https://cms.dev.engineplatform.co.uk/container/block-v1:edX+DemoX+Demo_Course+type@vertical+block@867dddb6f55d410caaa9c1eb9c6743ec
             return host_url + "/container/" + str(parent.location)
@@ -236,7 +298,7 @@ def get_url(xblock: XBlock, app="cms") -> str:
             # https://cms.dev.engineplatform.co.uk/course/course-v1:edX+DemoX+Demo_Course
             return host_url + "/course/" + course_key
     if app == "lms":
-        return "https:" + get_lms_link_for_item(xblock.location)
+        return get_lms_jump_url(xblock.location, host_url)
 
 
 def make_url(location, category=""):
@@ -259,6 +321,24 @@ def make_url(location, category=""):
     return None
 
 
+CSV_CHUNK_SIZE = 2000
+
+
+def chunked(iterable, size: int):
+    """
+    yield lists of up to size items from iterable, without
+    materializing the whole iterable.
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 def is_xblock(obj) -> Boolean:
     """
     Returns True if the object instance if of type XBlock
@@ -306,6 +386,71 @@ def is_dirty(xblock: XBlock) -> Boolean:
     # return len(xblock._dirty_fields.keys()) > 0
 
 
+DIRTY_CHECK_BATCH_SIZE = 500
+
+
+def get_logged_block_versions(course_key: CourseKey, locations) -> set:
+    """
+    Returns the set of (location, publication_date) pairs that have already
+    been logged for ´locations´, read in batches from the
+    (course_id, location, publication_date) index.
+    """
+    logged = set()
+    for chunk in chunked(locations, DIRTY_CHECK_BATCH_SIZE):
+        rows = CourseChangeLog.objects.filter(course_id=course_key, location__in=chunk).values_list(
+            "location", "publication_date"
+        )
+        logged.update((normalize_usage_key(location), publication_date) for location, publication_date in rows)
+    return logged
+
+
+def get_published_locations(course_key: CourseKey, xblocks, store=None) -> set:
+    """
+    Returns the set of locations of those of ´xblocks´ that have a published
+    version. Inside a bulk operation the published structure is fetched
+    once, and each check is a lookup of the block key in that structure.
+    """
+    store = store or modulestore()
+    with store.bulk_operations(course_key):
+        return {normalize_usage_key(xblock.location) for xblock in xblocks if store.has_published_version(xblock)}
+
+
+def get_dirty_blocks(course_key: CourseKey, xblocks, store=None) -> list:
+    """
+    Bulk equivalent of is_dirty(). Evaluates all of ´xblocks´ against one
+    read of the published structure and a batched query of the change log
+    for just these locations, and returns only those blocks that are
+    published and whose current state has not yet been logged.
+    """
+    candidates = []
+    for xblock in xblocks:
+        publication_date = xblock_publication_date(xblock)
+        location = normalize_usage_key(xblock.location)
+
+        if not publication_date:
+            log.debug("get_dirty_blocks() skipping. No publication date: {location}".format(location=location))
+            continue
+        candidates.append((xblock, location, publication_date))
+
+    published = get_published_locations(course_key, [xblock for xblock, _, _ in candidates], store)
+    logged = get_logged_block_versions(course_key, [location for _, location, _ in candidates if location in published])
+
+    retval = []
+    for xblock, location, publication_date in candidates:
+        if location not in published:
+            log.debug("get_dirty_blocks() skipping. not published: {location}".format(location=location))
+            continue
+
+        if (location, publication_date) in logged:
+            log.debug("get_dirty_blocks() skipping. already logged: {location}".format(location=location))
+            continue
+
+        log.debug("get_dirty_blocks() {location}".format(location=location))
+        retval.append(xblock)
+
+    return retval
+
+
 def log_date(log_record):
     """
     normalized business rules for generating the "log date"
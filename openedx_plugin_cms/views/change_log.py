@@ -7,33 +7,26 @@ View to dump log data to a simple row-column paginated layout.
 see: https://docs.djangoproject.com/en/2.2/topics/pagination/
 """
 # Python stuff
-import csv
-from typing import List
+from typing import Dict, List
 import logging
 
 # Django stuff
-from django.core.paginator import Paginator
 from django.contrib.auth.decorators import login_required
+from django.http import HttpResponseBadRequest
 from django.views.decorators.cache import cache_control
-from django.http import HttpResponse
-from six import StringIO
 
 
 # Open edX stuff
 from common.djangoapps.util.views import ensure_valid_course_key
 from common.djangoapps.edxmako.shortcuts import render_to_response
 from opaque_keys.edx.keys import CourseKey
-
-try:
-    # for olive and later
-    from xmodule.course_module import CourseSummary
-except ImportError:
-    # for backward compatibility with nutmeg and earlier
-    from common.lib.xmodule.xmodule.course_module import CourseSummary
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 
 # our stuff
+from openedx_plugin_api.pagination import csv_response, parse_cursor
 from openedx_plugin_cms.models import CourseChangeLog
-from openedx_plugin_cms.utils import get_xblock_attribute
+from openedx_plugin_cms.utils import get_xblock_attribute, CSV_CHUNK_SIZE
+from openedx_plugin_cms.pagination import KeysetPaginator, get_cached_count
 
 log = logging.getLogger(__name__)
 # Grade book: max students per page
@@ -52,33 +45,28 @@ def get_csv_url(course_id=None, page_number=None):
     return url
 
 
-def get_context(course_id=None, page_number=None):
+def get_context(course_id=None, after=None, before=None):
     """
     mcdaniel oct-2021
 
+    the change log is paged newest-first on its primary key. See pagination.py
     """
     if course_id:
         course_key = CourseKey.from_string(course_id)
-        change_log = CourseChangeLog.objects.filter(course_id=course_key).order_by("-id")
+        change_log = CourseChangeLog.objects.filter(course_id=course_key).select_related("published_by", "edited_by")
+        count_cache_key = "change_log.{course_id}".format(course_id=course_id)
     else:
-        change_log = CourseChangeLog.objects.all().select_related("published_by", "edited_by").order_by("-id")
-
-    paginator = Paginator(change_log, MAX_ROWS_PER_PAGE)
-    page = paginator.get_page(page_number)
+        change_log = CourseChangeLog.objects.all().select_related("published_by", "edited_by")
+        count_cache_key = "change_log"
 
-    # mcdaniel nov-2021
-    # this is a workaround to buggy behavior with the paginator object.
-    page_number = int(page_number or 1)
-    page_next = page_number + 1 if page_number < page.paginator.num_pages else -1
-    page_previous = page_number - 1 if page_number > 1 else -1
+    paginator = KeysetPaginator(change_log, MAX_ROWS_PER_PAGE, descending=True)
+    page = paginator.get_page(after=after, before=before, count=get_cached_count(change_log, count_cache_key))
 
     context = {
         "course_id": course_id,
         "page_obj": page,
-        "page_previous": page_previous,
-        "page_next": page_next,
         "uses_bootstrap": True,
-        "csv_url": get_csv_url(course_id, page_number),
+        "csv_url": get_csv_url(course_id),
     }
     return context
 
@@ -90,13 +78,137 @@ def plugin_cms_change_log(request, course_id=None, **kwargs):
     mcdaniel oct-2021
 
     """
-    page_number = request.GET.get("page")
+    try:
+        after = parse_cursor(request.GET.get("after", kwargs.get("offset")))
+        before = parse_cursor(request.GET.get("before"))
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
     template_name = "course_change_log.html"
-    context = get_context(course_id, page_number)
+    context = get_context(course_id, after=after, before=before)
 
     return render_to_response(template_name=template_name, dictionary=context, request=request)
 
 
+CSV_HEADER = [
+    "id",
+    "operation",
+    "location",
+    "category",
+    "course_id",
+    "course_display_name",
+    "parent_url",
+    "parent_display_name",
+    "chapter_url",
+    "chapter_display_name",
+    "sequential_url",
+    "sequential_display_name",
+    "vertical_url",
+    "vertical_display_name",
+    "display_name",
+    "ordinal_position",
+    "publication_date",
+    "published_by",
+]
+CSV_COLUMNS = [
+    "id",
+    "operation",
+    "location",
+    "category",
+    "course_id",
+    "parent_url",
+    "parent_location",
+    "parent_display_name",
+    "chapter_url",
+    "chapter_location",
+    "chapter_display_name",
+    "sequential_url",
+    "sequential_location",
+    "sequential_display_name",
+    "vertical_url",
+    "vertical_location",
+    "vertical_display_name",
+    "display_name",
+    "ordinal_position",
+    "publication_date",
+    "published_by__username",
+]
+
+
+def get_display_name(display_name, location):
+    """
+    the ancestor display names are denormalized onto the change log when it
+    is written. Records written before that have no stored name, so for
+    these we fall back to the modulestore.
+    """
+    if display_name is not None or location is None:
+        return display_name or ""
+    return get_xblock_attribute(location, "display_name")
+
+
+def get_course_display_names(change_log) -> Dict:
+    """
+    one query for the display names of every course in the export.
+    """
+    course_ids = change_log.order_by().values("course_id").distinct()
+    return {
+        str(course_id): display_name
+        for course_id, display_name in CourseOverview.objects.filter(id__in=course_ids).values_list(
+            "id", "display_name"
+        )
+    }
+
+
+def get_csv_rows(change_log):
+    """
+    lazily generate the csv rows of the change log, reading the
+    queryset in chunks rather than materializing it.
+    """
+    course_display_names = get_course_display_names(change_log)
+    for (
+        log_id,
+        operation,
+        location,
+        category,
+        course_id,
+        parent_url,
+        parent_location,
+        parent_display_name,
+        chapter_url,
+        chapter_location,
+        chapter_display_name,
+        sequential_url,
+        sequential_location,
+        sequential_display_name,
+        vertical_url,
+        vertical_location,
+        vertical_display_name,
+        display_name,
+        ordinal_position,
+        publication_date,
+        published_by,
+    ) in change_log.values_list(*CSV_COLUMNS).iterator(chunk_size=CSV_CHUNK_SIZE):
+        yield [
+            log_id,
+            operation,
+            location,
+            category,
+            course_id,
+            course_display_names.get(str(course_id)) or "",
+            parent_url,
+            get_display_name(parent_display_name, parent_location),
+            chapter_url,
+            get_display_name(chapter_display_name, chapter_location),
+            sequential_url,
+            get_display_name(sequential_display_name, sequential_location),
+            vertical_url,
+            get_display_name(vertical_display_name, vertical_location),
+            display_name,
+            ordinal_position,
+            publication_date,
+            published_by,
+        ]
+
+
 @login_required
 @ensure_valid_course_key
 @cache_control(no_cache=True, no_store=True, must_revalidate=True)
@@ -109,70 +221,12 @@ def plugin_cms_change_csv(request, course_id=None, **kwargs):
     if course_id:
         course_key = CourseKey.from_string(course_id)
         change_log = CourseChangeLog.objects.filter(course_id=course_key).order_by("-id")
-        course_display_name = CourseSummary(course_key).display_name
     else:
-        course_display_name = ""
-        change_log = CourseChangeLog.objects.all().select_related("published_by", "edited_by").order_by("-id")
+        change_log = CourseChangeLog.objects.all().order_by("-id")
 
     filename = "openedx_plugin_cms_change_log"
     if course_id:
         filename += "-{course_id}".format(course_id=course_id)
     filename += ".csv"
 
-    output = []
-
-    for log_entry in change_log:
-        output.append(
-            [
-                log_entry.id,
-                log_entry.operation,
-                log_entry.location,
-                log_entry.category,
-                log_entry.course_id,
-                str(course_display_name if course_id else CourseSummary(log_entry.course_id).display_name).replace(
-                    "Empty", ""
-                ),
-                log_entry.parent_url,
-                get_xblock_attribute(log_entry.parent_location, "display_name"),
-                log_entry.chapter_url,
-                get_xblock_attribute(log_entry.chapter_location, "display_name"),
-                log_entry.sequential_url,
-                get_xblock_attribute(log_entry.sequential_location, "display_name"),
-                log_entry.vertical_url,
-                get_xblock_attribute(log_entry.vertical_location, "display_name"),
-                log_entry.display_name,
-                log_entry.ordinal_position,
-                log_entry.publication_date,
-                log_entry.published_by,
-            ]
-        )
-
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = "attachment; filename={filename}".format(filename=filename)
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "id",
-            "operation",
-            "location",
-            "category",
-            "course_id",
-            "course_display_name",
-            "parent_url",
-            "parent_display_name",
-            "chapter_url",
-            "chapter_display_name",
-            "sequential_url",
-            "sequential_display_name",
-            "vertical_url",
-            "vertical_display_name",
-            "display_name",
-            "ordinal_position",
-            "publication_date",
-            "published_by",
-        ]
-    )
-    writer.writerows(output)
-
-    return response
+    return csv_response(filename, CSV_HEADER, get_csv_rows(change_log))
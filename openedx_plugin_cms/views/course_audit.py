@@ -9,23 +9,26 @@ also: https://docs.djangoproject.com/en/2.2/topics/pagination/
 """
 # Python stuff
 import time
-import csv
 import logging
-from datetime import datetime
+from datetime import timedelta
+from collections import namedtuple
 from typing import Dict, List
 from contextlib import contextmanager
+from functools import lru_cache
 from hashlib import md5
+from types import SimpleNamespace
 
 # Django stuff
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.http import HttpResponse, JsonResponse
-from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
 from django.db.utils import DatabaseError
 from django.core.exceptions import ValidationError
 from django.core.cache import cache
+from django.utils import timezone
 
 # Celery
 try:
@@ -40,7 +43,6 @@ from celery_utils.persist_on_failure import LoggedPersistOnFailureTask
 
 # Open edX stuff
 from common.djangoapps.util.views import ensure_valid_course_key
-from openedx.core.lib.cache_utils import request_cached
 from common.djangoapps.edxmako.shortcuts import render_to_response
 from cms.djangoapps.models.settings.course_grading import CourseGradingModel
 from opaque_keys.edx.keys import CourseKey
@@ -86,23 +88,61 @@ except ImportError:
     from common.lib.xmodule.xmodule.unit_block import UnitBlock  # Units are verticals.
 
 # This repo
-from openedx_plugin_cms.models import CourseAudit
+from openedx_plugin_api.pagination import csv_response, parse_cursor
+from openedx_plugin_cms.models import CourseAudit, CourseAuditJob
+from openedx_plugin_cms.course_snapshot import normalize_usage_key
+from openedx_plugin_cms.pagination import (
+    KeysetPaginator,
+    KeysetPage,
+    get_cached_count,
+)
 from openedx_plugin_cms.utils import (
-    get_user,
     xblock_edit_dates,
     get_url,
     get_problem_type,
     get_xml_filename,
-    get_grade_weight,
-    asset_extractor,
-    link_extractor,
+    get_host_url,
+    html_extractor,
+    chunked,
+    CSV_CHUNK_SIZE,
 )
 
 User = get_user_model()
 log = logging.getLogger(__name__)
 
 MAX_ROWS_PER_PAGE = 200
+PERSIST_BATCH_SIZE = 500
 CACHE_NAMESPACE = "plugin.cms.CourseAudit.cache."
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# the CourseAudit fields rendered by the course_audit.html and
+# course_audit_html.html templates. f_xblock_customized_html is left out, as
+# a page of raw html bodies can exceed the cache's item size limit. The html
+# audit view reads it separately for the rows of its page.
+PAGE_FIELDS = [
+    "a_order",
+    "b_course",
+    "c_module",
+    "d_section",
+    "e_unit",
+    "e2_block_type",
+    "f_graded",
+    "g_section_weight",
+    "h_number_graded_sections",
+    "i_component_type",
+    "j_non_standard_element",
+    "k_problem_weight",
+    "m_iframe_external_url",
+    "m_external_links",
+    "n_asset_type",
+    "o_unit_url",
+    "p_studio_url",
+    "q_xml_filename",
+    "r_publication_date",
+    "s_changed_by__username",
+    "t_change_made",
+    "created",
+]
 
 # Celery tasks constants
 LOCK_EXPIRE = 60 * 15
@@ -112,13 +152,15 @@ KNOWN_RETRY_ERRORS = (  # Errors we expect occasionally, should be resolved on r
     SoftTimeLimitExceeded,
 )
 RETRY_DELAY_SECONDS = 60
-TASK_TIME_LIMIT = LOCK_EXPIRE  # Task hard time limit in seconds. The worker
+TASK_TIME_LIMIT = 60 * 60  # Task hard time limit in seconds. The worker
 # processing the task will be killed and
 # replaced with a new one when this is
 # exceeded.
-TASK_SOFT_TIME_LIMIT = (
-    None  # https://docs.celeryproject.org/en/stable/userguide/configuration.html#std-setting-task_soft_time_limit
-)
+# https://docs.celeryproject.org/en/stable/userguide/configuration.html#std-setting-task_soft_time_limit
+TASK_SOFT_TIME_LIMIT = TASK_TIME_LIMIT - 60
+# the worker is killed at TASK_TIME_LIMIT, so a job that has shown no sign of
+# life for longer than this can't still be running.
+JOB_EXPIRE = TASK_TIME_LIMIT + 60
 MAX_RETRIES = 1
 
 
@@ -166,91 +208,192 @@ def get_refresh_url(course_key):
     return url
 
 
-def get_blank_dict() -> Dict:
-    """
-    doing this as a means of documenting what the final output looks
-    like which we'll send to the Mako template.
-    """
-    row = {}
-    row["a_order"] = ""
-    row["b_course"] = ""
-    row["c_module"] = ""
-    row["d_section"] = ""
-    row["e_unit"] = ""
-    row["e2_block_type"] = ""
-    row["f_graded"] = "False"
-    row["g_section_weight"] = ""
-    row["h_number_graded_sections"] = ""
-    row["i_component_type"] = ""
-    row["j_non_standard_element"] = ""
-    row["k_problem_weight"] = ""
-    row["m_iframe_external_url"] = ""
-    row["m_external_links"] = ""
-    row["n_asset_type"] = ""
-    row["o_unit_url"] = ""
-    row["p_studio_url"] = ""
-    row["q_xml_filename"] = ""
-    row["r_publication_date"] = ""
-    row["s_changed_by"] = ""
-    row["t_change_made"] = ""
+def get_status_url(course_key):
+    url = "/plugin/cms/courses/{course_id}/audit/status/".format(course_id=str(course_key))
+    return url
 
-    return row
 
+# the fields of an audit row that describe its place in the course outline.
+# These are computed once per chapter, sequence and vertical, and the
+# resulting tuple is shared by every row beneath it.
+OutlinePart = namedtuple("OutlinePart", ["b_course", "c_module", "d_section", "e_unit", "f_graded"])
 
-def get_chapter_dict(i: int, course: CourseBlock, chapter: SectionBlock) -> Dict:
-    row = get_blank_dict()
-    row["a_order"] = str(i)
-    row["b_course"] = course.display_name
-    row["c_module"] = chapter.display_name
-    row["e2_block_type"] = chapter.location.block_type
-    row["o_unit_url"] = get_url(chapter, "lms")
-    row["p_studio_url"] = get_url(chapter, "cms")
-    return row
 
+class AuditRow:
+    """
+    One row of the Course Audit report, as generated by the course analyzer
+    and consumed by persist_rows() and the Mako template.
 
-def get_sequence_dict(
-    i: int,
-    course: CourseBlock,
-    chapter: SectionBlock,
-    sequence: SequenceBlock,
-) -> Dict:
-    row = get_chapter_dict(i, course, chapter)
-    row["d_section"] = sequence.display_name
-    # e_unit -- skip. handled in get_vertical_dict()
-    row["e2_block_type"] = sequence.location.block_type
-    row["f_graded"] = sequence.graded if sequence.graded else ""
-    row["o_unit_url"] = get_url(sequence, "lms")
-    row["p_studio_url"] = get_url(sequence, "cms")
-    return row
+    Fields hold native values (int, float, datetime, None) that map directly
+    onto the CourseAudit model. The outline fields b_course .. f_graded are
+    read from the shared OutlinePart of the row's container.
+    """
 
+    __slots__ = (
+        "outline",
+        "location",
+        "a_order",
+        "e2_block_type",
+        "f_xblock_customized_html",
+        "g_section_weight",
+        "h_number_graded_sections",
+        "i_component_type",
+        "j_non_standard_element",
+        "k_problem_weight",
+        "m_iframe_external_url",
+        "m_external_links",
+        "n_asset_type",
+        "o_unit_url",
+        "p_studio_url",
+        "q_xml_filename",
+        "r_publication_date",
+        "s_changed_by_id",
+        "t_change_made",
+    )
 
-def get_vertical_dict(
-    i: int,
-    course: CourseBlock,
-    chapter: SectionBlock,
-    sequence: SequenceBlock,
-    vertical: VerticalBlock,
-) -> Dict:
-    row = get_sequence_dict(i, course, chapter, sequence)
-    row["e_unit"] = vertical.display_name
-    row["e2_block_type"] = vertical.location.block_type
-    row["f_graded"] = vertical.graded
-    # g_section_weight - skip. handled in parent loop, get_sequence_dict()
-    # h_number_graded_sections - skip. handled in parent loop, get_sequence_dict()
-    row["o_unit_url"] = get_url(vertical, "lms")
-    row["p_studio_url"] = get_url(vertical, "cms")
-    return row
+    def __init__(self, a_order: int, outline: OutlinePart, xblock: XBlock, o_unit_url: str, p_studio_url: str):
+        # the block's own publication and edit dates. These are what
+        # incremental refreshes compare against to detect changes.
+        edited_on, published_on = xblock_edit_dates(xblock)
+
+        self.outline = outline
+        self.location = xblock.location
+        self.a_order = a_order
+        self.e2_block_type = xblock.location.block_type
+        self.f_xblock_customized_html = ""
+        self.g_section_weight = None
+        self.h_number_graded_sections = None
+        self.i_component_type = ""
+        self.j_non_standard_element = None
+        self.k_problem_weight = None
+        self.m_iframe_external_url = ""
+        self.m_external_links = ""
+        self.n_asset_type = ""
+        self.o_unit_url = o_unit_url
+        self.p_studio_url = p_studio_url
+        self.q_xml_filename = ""
+        self.r_publication_date = published_on
+        self.s_changed_by_id = None
+        self.t_change_made = edited_on
+
+    @property
+    def b_course(self) -> str:
+        return self.outline.b_course
+
+    @property
+    def c_module(self) -> str:
+        return self.outline.c_module
+
+    @property
+    def d_section(self) -> str:
+        return self.outline.d_section
+
+    @property
+    def e_unit(self) -> str:
+        return self.outline.e_unit
+
+    @property
+    def f_graded(self):
+        return self.outline.f_graded
+
+
+STANDARD_COMPONENT_TYPES = [
+    "about",
+    "chapter",
+    "course",
+    "course_info",
+    "discussion",
+    "html",
+    "image",
+    "library",
+    "library_content",
+    "library_sourced",
+    "lti",
+    "lti_consumer",
+    "openassessment",
+    "sequential",
+    "unit",
+    "vertical",
+    "video",
+    "wrapper",
+]
+
+
+@lru_cache(maxsize=None)
+def get_installed_xblock_types() -> frozenset:
+    """
+    XBlock.load_classes() scans the entry points of every installed
+    XBlock, and these can't change while the process is running.
+    """
+    return frozenset(name for name, class_ in XBlock.load_classes())
+
+
+class CourseAnalysisContext:
+    """
+    Per-course constants, computed once per audit and shared by all
+    of the row builders.
+    """
 
+    def __init__(self, course: CourseBlock):
+        self.course = course
+        self.course_key = course.id
+        self.advanced_component_types = (
+            get_installed_xblock_types() - set(STANDARD_COMPONENT_TYPES) - set(course.advanced_modules)
+        )
 
-def get_vertical_child_dict(
+        # raw_grader: [
+        #         {'min_count': 3, 'weight': 0.75, 'type': 'Homework', 'drop_count': 1, 'short_label': 'Ex'},
+        #         {'short_label': '', 'min_count': 1, 'type': 'Exam', 'drop_count': 0, 'weight': 0.25}
+        #     ]
+        self.graders = {grader["type"]: (grader["weight"], grader["min_count"]) for grader in (course.raw_grader or [])}
+        self.lms_host_url = get_host_url("lms")
+        self.cms_host_url = get_host_url("cms")
+        self._outlines = {}
+
+    def get_grade_weight(self, xblock: XBlock):
+        """
+        retrieve the (weight, min_count) from the grading policy
+        based on Xblock type, or (None, None) if the grading policy
+        has no assignment type of this format.
+        """
+        return self.graders.get(getattr(xblock, "format", None), (None, None))
+
+    def get_outline(self, path: List) -> OutlinePart:
+        """
+        returns the OutlinePart of the chapter, sequence or vertical at the
+        end of path. Each is computed once, from its parent's OutlinePart.
+        """
+        container = path[-1]
+        outline = self._outlines.get(container.location)
+        if outline is None:
+            if len(path) == 1:
+                outline = OutlinePart(self.course.display_name, container.display_name, "", "", "False")
+            elif len(path) == 2:
+                outline = self.get_outline(path[:-1])._replace(
+                    d_section=container.display_name, f_graded=container.graded if container.graded else ""
+                )
+            else:
+                outline = self.get_outline(path[:-1])._replace(e_unit=container.display_name, f_graded=container.graded)
+            self._outlines[container.location] = outline
+        return outline
+
+    def get_url(self, xblock: XBlock, app: str, parent: XBlock) -> str:
+        """
+        returns the LMS / CMS url for xblock. The parent comes from
+        the course walk, so no modulestore reads are necessary.
+        """
+        host_url = self.cms_host_url if app == "cms" else self.lms_host_url
+        return get_url(xblock, app, host_url=host_url, parent=parent)
+
+
+def get_vertical_child_row(
     i: int,
-    course: CourseBlock,
+    context: CourseAnalysisContext,
     chapter: SectionBlock,
     sequence: SequenceBlock,
     vertical: VerticalBlock,
     child: XBlock,
-    advanced_component_types: list,
-) -> Dict:
+) -> AuditRow:
     """
     Note that all of these parameters are descendants of XBlock, including child.
 
@@ -258,43 +401,45 @@ def get_vertical_child_dict(
     Ideally we'd cast these after introspecting their type, but, we only need to extract a couple of pieces
     of data and so we'll defer that indefinitely until a real need arises.
     """
-    edited_on, published_on = xblock_edit_dates(child)
-    row = get_vertical_dict(i, course, chapter, sequence, vertical)
-    row["e2_block_type"] = child.location.block_type
+    row = AuditRow(
+        i,
+        context.get_outline([chapter, sequence, vertical]),
+        child,
+        context.get_url(child, "lms", vertical),
+        context.get_url(child, "cms", vertical),
+    )
 
     if hasattr(child, "data"):
-        row["f_xblock_customized_html"] = child.data
+        row.f_xblock_customized_html = child.data
 
     if child.location.block_type == "problem" and sequence.graded:
-        row["g_section_weight"], row["h_number_graded_sections"] = get_grade_weight(sequence, course)
-        row["k_problem_weight"] = str(child.weight or 1)
+        row.g_section_weight, row.h_number_graded_sections = context.get_grade_weight(sequence)
+        row.k_problem_weight = float(child.weight or 1)
 
         component_type = get_problem_type(child)
-        row["i_component_type"] = component_type
-        row["j_non_standard_element"] = component_type if component_type in advanced_component_types else ""
+        row.i_component_type = component_type
+        row.j_non_standard_element = component_type in context.advanced_component_types
 
     if child.location.block_type == "html" and hasattr(child, "data"):
-        row["n_asset_type"] = asset_extractor(child.data)
-        row["m_external_links"] = link_extractor(child.data)
+        row.m_external_links, row.n_asset_type = html_extractor(child.data)
 
     if hasattr(child, "html_file"):
-        row["m_iframe_external_url"] = child.html_file
+        row.m_iframe_external_url = child.html_file
 
-    row["o_unit_url"] = get_url(child, "lms")
-    row["p_studio_url"] = get_url(child, "cms")
-    row["q_xml_filename"] = get_xml_filename(child)
-    row["r_publication_date"] = published_on.strftime("%d-%b-%Y, %H:%M")
-    row["s_changed_by"] = get_user(child.edited_by) if child.edited_by > 0 else ""
-    row["t_change_made"] = edited_on.strftime("%d-%b-%Y, %H:%M")
+    row.q_xml_filename = get_xml_filename(child)
+    row.s_changed_by_id = child.edited_by if child.edited_by > 0 else None
 
     return row
 
 
-def get_analyzed_course(course_key: CourseKey) -> List:
+def walk_course(course: CourseBlock):
     """
     Iterate the course blocks, in order of presentation, as you'd see in the
     Course Outline page in CMS.
 
+    yields a tuple of (order, path) where path is the list of blocks from the
+    chapter down to and including the current block.
+
     The get_children() iterators in this def each return instantiated
     XBlock-derivative objects that vary in type depending on which level
     of the nested loop we're in.
@@ -304,11 +449,70 @@ def get_analyzed_course(course_key: CourseKey) -> List:
     authoring pattern for graded problems is to create a
     series of html, problem, and discussion objects.
     """
-    log.debug("get_context - Start: {course_key}".format(course_key=course_key))
+    i = 0
+    for chapter in course.get_children():
+        # chapter is a SectionBlock
+        i += 1
+        yield i, [chapter]
+        for sequence in chapter.get_children():
+            # sequence is a SequenceBlock
+            i += 1
+            yield i, [chapter, sequence]
+            for vertical in sequence.get_children():
+                # vertical is a VerticalBlock
+                i += 1
+                yield i, [chapter, sequence, vertical]
+                for child in vertical.get_children():
+                    # child is any of ProblemBlock, DiscussionXBlock, HtmlBlock
+                    # or an object that descends from one of these.
+                    #
+                    # it might also be something more esoteric like AnnotatableBlock, etc.
+                    i += 1
+                    yield i, [chapter, sequence, vertical, child]
+
+
+def get_row(i: int, context: CourseAnalysisContext, path: List) -> AuditRow:
+    """
+    build the report row for the last block in path.
+    """
+    if len(path) == 4:
+        return get_vertical_child_row(i, context, *path)
+
+    # a chapter, sequence or vertical.
+    xblock = path[-1]
+    parent = path[-2] if len(path) > 1 else context.course
+    return AuditRow(
+        i,
+        context.get_outline(path),
+        xblock,
+        context.get_url(xblock, "lms", parent),
+        context.get_url(xblock, "cms", parent),
+    )
+
+
+def analyze_course(course: CourseBlock):
+    """
+    Iterate the course blocks, in order of presentation, and yield
+    a report row for each one.
+
+    Rows are generated one at a time so that consumers can process them in
+    bounded chunks, rather than holding the rows of the entire course
+    (including the raw HTML of every block) in memory at once.
+    """
+    context = CourseAnalysisContext(course)
+    for i, path in walk_course(course):
+        log.debug("Analyzing content block: {course_key} - {i}".format(course_key=context.course_key, i=i))
+        yield get_row(i, context, path)
+
+
+def get_analyzed_course(course_key: CourseKey):
+    """
+    Yield a report row for each block of the published course, in order
+    of presentation.
+    """
+    log.debug("get_analyzed_course - Start: {course_key}".format(course_key=course_key))
 
     store = modulestore()
-    retval = []
-    i = 0
 
     # since we're auditing changes to published course content, we can
     # optimize the entire traversal by filtering for published content
@@ -317,176 +521,348 @@ def get_analyzed_course(course_key: CourseKey) -> List:
         # The optional param "depth=4" causes get_course() to prefetch all of the
         # xblock objects that we're going to inspect.
         course = store.get_course(course_key, depth=4)
-        STANDARD_COMPONENT_TYPES = [
-            "about",
-            "chapter",
-            "course",
-            "course_info",
-            "discussion",
-            "html",
-            "image",
-            "library",
-            "library_content",
-            "library_sourced",
-            "lti",
-            "lti_consumer",
-            "openassessment",
-            "sequential",
-            "unit",
-            "vertical",
-            "video",
-            "wrapper",
-        ]
-        ADVANCED_COMPONENT_TYPES = sorted(
-            {name for name, class_ in XBlock.load_classes()}
-            - set(STANDARD_COMPONENT_TYPES)
-            - set(course.advanced_modules)
-        )
+        yield from analyze_course(course)
 
-        for chapter in course.get_children():
-            # chapter is a SectionBlock
-            i += 1
-            row = get_chapter_dict(i, course, chapter)
-            retval.append(row)
-            for sequence in chapter.get_children():
-                # sequence is a SequenceBlock
-                i += 1
-                row = get_sequence_dict(i, course, chapter, sequence)
-                retval.append(row)
-                for vertical in sequence.get_children():
-                    # vertical is a VerticalBlock
-                    i += 1
-                    row = get_vertical_dict(i, course, chapter, sequence, vertical)
-                    retval.append(row)
-                    for child in vertical.get_children():
-                        # child is any of ProblemBlock, DiscussionXBlock, HtmlBlock
-                        # or an object that descends from one of these.
-                        #
-                        # it might also be something more esoteric like AnnotatableBlock, etc.
-                        i += 1
-                        print("Analyzing content block: {course_key} - {i}".format(course_key=course_key, i=i))
-                        row = get_vertical_child_dict(
-                            i,
-                            course,
-                            chapter,
-                            sequence,
-                            vertical,
-                            child,
-                            ADVANCED_COMPONENT_TYPES,
-                        )
-                        retval.append(row)
-
-    log.debug("get_context - End: {course_key}".format(course_key=course_key))
-
-    return retval
-
-
-def persist_analyzed_course(course_key: CourseKey) -> None:
+    log.debug("get_analyzed_course - End: {course_key}".format(course_key=course_key))
+
+
+def get_user_ids(rows: List) -> set:
+    """
+    resolve, in a single query, which of the user ids referenced
+    by a chunk of analyzed rows actually exist.
+    """
+    user_ids = {row.s_changed_by_id for row in rows if row.s_changed_by_id}
+    if not user_ids:
+        return set()
+    return set(User.objects.filter(id__in=user_ids).values_list("id", flat=True))
+
+
+def truncate(value, max_length: int = 255):
+    return value[-max_length:] if isinstance(value, str) else value
+
+
+def get_course_audit_record(course_key: CourseKey, row: AuditRow, user_ids: set) -> CourseAudit:
+    """
+    convert an analyzed row into an unsaved CourseAudit instance.
+
+    user_ids:   the set of valid user ids, from get_user_ids()
+    """
+
+    return CourseAudit(
+        course_id=course_key,
+        location=row.location,
+        a_order=row.a_order,
+        b_course=truncate(row.b_course),
+        c_module=truncate(row.c_module),
+        d_section=truncate(row.d_section),
+        e_unit=truncate(row.e_unit),
+        e2_block_type=truncate(row.e2_block_type),
+        f_xblock_customized_html=row.f_xblock_customized_html,
+        f_graded=row.f_graded,
+        g_section_weight=row.g_section_weight,
+        h_number_graded_sections=row.h_number_graded_sections,
+        i_component_type=truncate(row.i_component_type),
+        j_non_standard_element=row.j_non_standard_element,
+        k_problem_weight=row.k_problem_weight,
+        m_iframe_external_url=row.m_iframe_external_url,
+        m_external_links=row.m_external_links,
+        n_asset_type=row.n_asset_type,
+        o_unit_url=row.o_unit_url,
+        p_studio_url=row.p_studio_url,
+        q_xml_filename=truncate(row.q_xml_filename),
+        r_publication_date=row.r_publication_date,
+        s_changed_by_id=row.s_changed_by_id if row.s_changed_by_id in user_ids else None,
+        t_change_made=row.t_change_made,
+    )
+
+
+def persist_rows(course_key: CourseKey, rows, progress=None, total=None) -> int:
+    """
+    bulk insert the rows of an analyzed course in chunks of
+    PERSIST_BATCH_SIZE. Callers are responsible for the transaction.
+
+    rows:       any iterable of rows. Only one chunk is held in memory
+                at a time.
+    progress:   optional callable, called as progress(persisted, total)
+                after each chunk is written. total is None if it isn't known.
+    """
+    if total is None and hasattr(rows, "__len__"):
+        total = len(rows)
+    persisted = 0
+    for chunk in chunked(rows, PERSIST_BATCH_SIZE):
+        user_ids = get_user_ids(chunk)
+        CourseAudit.objects.bulk_create([get_course_audit_record(course_key, row, user_ids) for row in chunk])
+        persisted += len(chunk)
+        if progress:
+            progress(persisted, total)
+    return persisted
+
+
+def persist_analyzed_course(course_key: CourseKey, incremental=False, progress=None) -> None:
     """
     write all records of an analyzed course to the database.
+
+    incremental:    only recompute the rows of blocks that changed since
+                    the last refresh. see refresh_analyzed_course()
+    progress:       optional callable, called as progress(persisted, total)
+                    as rows are written.
     """
-    try:
-        CourseAudit.objects.filter(course_id=course_key).delete()
-    except ObjectDoesNotExist:
-        log.info("No persisted records to replace for course_key: {course_key}".format(course_key=course_key))
-
-    course_audit = get_analyzed_course(course_key)
-    for row in course_audit:
-        user = User.objects.get(username=row["s_changed_by"]) if row["s_changed_by"] != "" else None
-
-        rec = CourseAudit.objects.create(
-            course_id=course_key,
-            a_order=int(row["a_order"]),
-            b_course=row["b_course"][-255:] if row["b_course"] is not None else None,
-            c_module=row["c_module"][-255:] if row["c_module"] is not None else None,
-            d_section=row["d_section"][-255:] if row["d_section"] is not None else None,
-            e_unit=row["e_unit"][-255:] if row["e_unit"] is not None else None,
-            e2_block_type=row["e2_block_type"][-255:] if row["e2_block_type"] is not None else None,
-            f_graded=row["f_graded"],
-            g_section_weight=float(row["g_section_weight"]) if row["g_section_weight"] != "" else None,
-            h_number_graded_sections=int(row["h_number_graded_sections"])
-            if row["h_number_graded_sections"] != ""
-            else None,
-            i_component_type=row["i_component_type"][-255:] if row["i_component_type"] is not None else None,
-            j_non_standard_element=row["j_non_standard_element"][-255:]
-            if row["j_non_standard_element"] is not None
-            else None,
-            k_problem_weight=float(row["k_problem_weight"]) if row["k_problem_weight"] != "" else None,
-            m_iframe_external_url=row["m_iframe_external_url"],
-            n_asset_type=row["n_asset_type"],
-            o_unit_url=row["o_unit_url"],
-            p_studio_url=row["p_studio_url"],
-            q_xml_filename=row["q_xml_filename"][-255:] if row["q_xml_filename"] is not None else None,
-            r_publication_date=datetime.strptime(row["r_publication_date"], "%d-%b-%Y, %H:%M")
-            if row["r_publication_date"] != ""
-            else None,
-            s_changed_by=user,
-            t_change_made=datetime.strptime(row["t_change_made"], "%d-%b-%Y, %H:%M")
-            if row["t_change_made"] != ""
-            else None,
+    if not (incremental and refresh_analyzed_course(course_key, progress=progress)):
+        store = modulestore()
+        with store.branch_setting(ModuleStoreEnum.Branch.published_only, course_key):
+            course = store.get_course(course_key, depth=4)
+            # the tree is already in memory, so counting its blocks is cheap.
+            total = sum(1 for _ in walk_course(course))
+
+            # replace the old report in one transaction so that
+            # readers never see a partially written report.
+            with transaction.atomic():
+                CourseAudit.objects.filter(course_id=course_key).delete()
+                persist_rows(course_key, analyze_course(course), progress=progress, total=total)
+
+    # invalidate every cached page and count of the old report.
+    bump_audit_generation(course_key)
+
+
+def refresh_analyzed_course(course_key: CourseKey, progress=None) -> bool:
+    """
+    Incrementally refresh the persisted audit of a course.
+
+    Each block's edited_on / published_on dates are compared with the stored
+    t_change_made / r_publication_date of its row. Only the rows of changed
+    blocks are recomputed; when a chapter, sequence or vertical has changed
+    then its entire subtree is recomputed, since each descendant row repeats
+    its ancestors' display names. Rows of blocks that no longer exist are
+    deleted, and the a_order of unchanged rows is repaired in place.
+
+    Returns False, having changed nothing, if an incremental refresh is not
+    possible and a full refresh is required instead: the course has not yet
+    been audited, it was audited before rows recorded their block location,
+    or the course block itself (grading policy, display name) has changed
+    since the last refresh.
+    """
+    stored = {}
+    last_refresh = None
+    for rec in CourseAudit.objects.filter(course_id=course_key).only(
+        "id", "location", "a_order", "r_publication_date", "t_change_made", "modified"
+    ):
+        if rec.location is None:
+            log.info(
+                "refresh_analyzed_course() legacy rows found. full refresh required: {course_key}".format(
+                    course_key=course_key
+                )
+            )
+            return False
+        stored[normalize_usage_key(rec.location)] = rec
+        last_refresh = max(last_refresh, rec.modified) if last_refresh else rec.modified
+
+    if not stored:
+        return False
+
+    store = modulestore()
+    with store.branch_setting(ModuleStoreEnum.Branch.published_only, course_key):
+        course = store.get_course(course_key, depth=4)
+        course_edited_on, _ = xblock_edit_dates(course)
+        if course_edited_on and course_edited_on > last_refresh:
+            log.info(
+                "refresh_analyzed_course() course block changed. full refresh required: {course_key}".format(
+                    course_key=course_key
+                )
+            )
+            return False
+
+        context = CourseAnalysisContext(course)
+
+        seen = set()
+        changed_subtrees = set()
+        replaced_recs = []
+        reordered = []
+
+        def get_changed_rows():
+            for i, path in walk_course(course):
+                xblock = path[-1]
+                location = normalize_usage_key(xblock.location)
+                seen.add(location)
+                rec = stored.get(location)
+                edited_on, published_on = xblock_edit_dates(xblock)
+
+                is_changed = (
+                    rec is None
+                    or rec.t_change_made != edited_on
+                    or rec.r_publication_date != published_on
+                    or any(normalize_usage_key(ancestor.location) in changed_subtrees for ancestor in path[:-1])
+                )
+                if is_changed:
+                    if len(path) < 4:
+                        changed_subtrees.add(location)
+                    if rec is not None:
+                        replaced_recs.append(rec)
+                    yield get_row(i, context, path)
+                elif rec.a_order != i:
+                    rec.a_order = i
+                    reordered.append(rec)
+
+        # changed rows are persisted in chunks as the walk finds them. The
+        # rows that they replace were read before the walk began, so these
+        # are safe to delete afterwards, in the same transaction.
+        with transaction.atomic():
+            changed = persist_rows(course_key, get_changed_rows(), progress=progress)
+            gone = [rec.id for location, rec in stored.items() if location not in seen]
+            replaced = [rec.id for rec in replaced_recs]
+            if gone or replaced:
+                CourseAudit.objects.filter(id__in=gone + replaced).delete()
+            if reordered:
+                CourseAudit.objects.bulk_update(reordered, ["a_order"])
+
+    log.info(
+        "refresh_analyzed_course() {course_key}: {changed} rows recomputed, {gone} rows deleted,"
+        " {reordered} rows reordered".format(
+            course_key=course_key, changed=changed, gone=len(gone), reordered=len(reordered)
         )
-        rec.save()
-        print("persisted row: {i}".format(i=rec.a_order))
+    )
+    return True
+
 
+def get_generation_cache_key(course_key: CourseKey) -> str:
+    return CACHE_NAMESPACE + "generation.{course_id}".format(course_id=str(course_key))
 
-def get_context(course_key: CourseKey, page_number=None, cached=True, report_message="") -> Dict:
+
+def get_audit_generation(course_key: CourseKey) -> str:
+    """
+    returns the generation of the persisted audit of a course. Cached pages
+    and row counts are keyed on it, so that bumping the generation
+    invalidates all of them at once.
+    """
+    cache_key = get_generation_cache_key(course_key)
+    generation = cache.get(cache_key)
+    if generation is None:
+        generation = str(time.time_ns())
+        # cache.add fails if another request beat us to it.
+        cache.add(cache_key, generation, None)
+        generation = cache.get(cache_key) or generation
+    return generation
+
+
+def bump_audit_generation(course_key: CourseKey) -> None:
+    """
+    called whenever the persisted audit of a course is rewritten.
+
+    the generation is a timestamp rather than a counter so that it can never
+    repeat a value that might still be cached, even if the generation key
+    itself is evicted.
+    """
+    cache.set(get_generation_cache_key(course_key), str(time.time_ns()), None)
+
+
+def get_count_cache_key(course_key: CourseKey, generation: str = None) -> str:
+    return "course_audit.{course_id}.{generation}".format(
+        course_id=str(course_key), generation=generation or get_audit_generation(course_key)
+    )
+
+
+def get_audit_page(course_key: CourseKey, after=None, before=None) -> KeysetPage:
+    """
+    returns one page of the persisted audit of a course, paged on a_order,
+    which is the row's unique position in the course outline. See pagination.py
+
+    Pages are cached per (course, audit generation, cursor), so repeated views
+    of a report skip the database entirely until the report is next refreshed.
+    Rows are cached as plain attribute objects rather than as model
+    instances, with s_changed_by projected to the username.
+    """
+    generation = get_audit_generation(course_key)
+    cache_key = CACHE_NAMESPACE + "page.{course_id}.{generation}.{after}.{before}".format(
+        course_id=str(course_key), generation=generation, after=after, before=before
+    )
+    page = cache.get(cache_key)
+    if page is not None:
+        return page
+
+    course_audit = CourseAudit.objects.filter(course_id=course_key)
+    paginator = KeysetPaginator(course_audit.values(*PAGE_FIELDS), MAX_ROWS_PER_PAGE, key="a_order")
+    count = get_cached_count(course_audit, get_count_cache_key(course_key, generation), PAGE_CACHE_TIMEOUT)
+    page = paginator.get_page(after=after, before=before, count=count)
+
+    rows = []
+    for row in page.object_list:
+        row["s_changed_by"] = row.pop("s_changed_by__username")
+        rows.append(SimpleNamespace(**row))
+    page.object_list = rows
+
+    cache.set(cache_key, page, PAGE_CACHE_TIMEOUT)
+    return page
+
+
+def get_context(course_key: CourseKey, after=None, before=None, report_message="") -> Dict:
     """
     write all records of an analyzed course to the database.
     """
 
     report_as_of = ""
-    if cached:
-        course_audit = CourseAudit.objects.filter(course_id=course_key).order_by("id")
-        try:
-            report_as_of = course_audit[0].created.strftime("%d-%b-%Y, %H:%M")
-        except ObjectDoesNotExist:
-            pass
-    else:
-        course_audit = get_analyzed_course(course_key)
-        report_as_of = datetime.today().strftime("%d-%b-%Y, %H:%M")
-    paginator = Paginator(course_audit, MAX_ROWS_PER_PAGE)
-    page = paginator.get_page(page_number)
-
-    # mcdaniel nov-2021
-    # this is a workaround to buggy behavior with the paginator object.
-    page_number = int(page_number or 1)
-    page_next = page_number + 1 if page_number < page.paginator.num_pages else -1
-    page_previous = page_number - 1 if page_number > 1 else -1
+    page = get_audit_page(course_key, after=after, before=before)
+    if page.object_list:
+        report_as_of = page.object_list[0].created.strftime("%d-%b-%Y, %H:%M")
 
     context = {
         "course_id": str(course_key),
         "report_as_of": report_as_of,
         "page_obj": page,
-        "page_previous": page_previous,
-        "page_next": page_next,
         "uses_bootstrap": True,
-        "csv_url": get_csv_url(course_key, page_number),
+        "csv_url": get_csv_url(course_key),
         "refresh_url": get_refresh_url(course_key),
+        "status_url": get_status_url(course_key),
     }
 
     return context
 
 
 @login_required
-@request_cached(CACHE_NAMESPACE)
 @ensure_valid_course_key
 def plugin_cms_course_audit(request, course_id: str, **kwargs):
     """
     mcdaniel nov-2021
     """
-    page_number = request.GET.get("page")
+    try:
+        after = parse_cursor(request.GET.get("after", kwargs.get("offset")))
+        before = parse_cursor(request.GET.get("before"))
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
     template_name = "course_audit.html"
     course_key = CourseKey.from_string(course_id)
     report_message = kwargs.get("report_message")
 
-    context = get_context(course_key, page_number, cached=True, report_message=report_message)
+    context = get_context(course_key, after=after, before=before, report_message=report_message)
 
     return render_to_response(template_name=template_name, dictionary=context, request=request)
 
 
+CSV_FIELDS = [
+    "a_order",
+    "b_course",
+    "c_module",
+    "d_section",
+    "e_unit",
+    "e2_block_type",
+    "f_graded",
+    "g_section_weight",
+    "h_number_graded_sections",
+    "i_component_type",
+    "j_non_standard_element",
+    "k_problem_weight",
+    "m_iframe_external_url",
+    "m_external_links",
+    "n_asset_type",
+    "o_unit_url",
+    "p_studio_url",
+    "q_xml_filename",
+    "r_publication_date",
+    "s_changed_by",
+    "t_change_made",
+]
+
+
 @login_required
 @ensure_valid_course_key
-@request_cached(CACHE_NAMESPACE)
 def plugin_cms_course_audit_csv(request, course_id: str, **kwargs):
     """
     mcdaniel oct-2021
@@ -494,66 +870,141 @@ def plugin_cms_course_audit_csv(request, course_id: str, **kwargs):
     Generate a csv download of CMS change log data
     """
     course_key = CourseKey.from_string(course_id)
-    output = CourseAudit.objects.filter(course_id=course_key).order_by("id")
     filename = "openedx_plugin_cms_course_audit-{course_id}.csv".format(course_id=course_id)
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = "attachment; filename={filename}".format(filename=filename)
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "a_order",
-            "b_course",
-            "c_module",
-            "d_section",
-            "e_unit",
-            "e2_block_type",
-            "f_graded",
-            "g_section_weight",
-            "h_number_graded_sections",
-            "i_component_type",
-            "j_non_standard_element",
-            "k_problem_weight",
-            "m_iframe_external_url",
-            "m_external_links",
-            "n_asset_type",
-            "o_unit_url",
-            "p_studio_url",
-            "q_xml_filename",
-            "r_publication_date",
-            "s_changed_by",
-            "t_change_made",
-        ]
+    # s_changed_by is projected to the username, which is
+    # how the User instance would have rendered.
+    columns = [field if field != "s_changed_by" else "s_changed_by__username" for field in CSV_FIELDS]
+    output = (
+        CourseAudit.objects.filter(course_id=course_key)
+        .order_by("a_order")
+        .values_list(*columns)
+        .iterator(chunk_size=CSV_CHUNK_SIZE)
     )
-    for row in output:
-        writer.writerow(
-            [
-                row.a_order,
-                row.b_course,
-                row.c_module,
-                row.d_section,
-                row.e_unit,
-                row.e2_block_type,
-                row.f_graded,
-                row.g_section_weight,
-                row.h_number_graded_sections,
-                row.i_component_type,
-                row.j_non_standard_element,
-                row.k_problem_weight,
-                row.m_iframe_external_url,
-                row.m_external_links,
-                row.n_asset_type,
-                row.o_unit_url,
-                row.p_studio_url,
-                row.q_xml_filename,
-                row.r_publication_date,
-                row.s_changed_by,
-                row.t_change_made,
-            ]
+
+    return csv_response(filename, CSV_FIELDS, output)
+
+
+def get_active_job(course_key: CourseKey):
+    """
+    returns the queued or running CourseAuditJob of a course, or None.
+
+    a job that has shown no sign of life for longer than JOB_EXPIRE was lost
+    (the worker died or the message was dropped), so it is marked as failed
+    rather than locking out refreshes of the course forever. A job's last
+    sign of life is its claim or its most recent heartbeat, see job_progress().
+    Since the task's hard time limit is shorter than JOB_EXPIRE, a job that is
+    still running is never expired.
+    """
+    now = timezone.now()
+    expired = now - timedelta(seconds=JOB_EXPIRE)
+    active_jobs = CourseAuditJob.objects.filter(course_id=course_key, status__in=CourseAuditJob.ACTIVE_STATUSES)
+    job = active_jobs.order_by("-id").first()
+    if job and job.modified < expired and get_job_heartbeat(job) < expired:
+        # only write when there is something to expire, since the status page polls this.
+        active_jobs.filter(id=job.id, modified__lt=expired).update(
+            status=CourseAuditJob.FAILED, finished_at=now, message="timed out", modified=now
+        )
+        job = active_jobs.order_by("-id").first()
+    return job
+
+
+def start_audit_job(course_key: CourseKey, user=None, incremental=True):
+    """
+    queue a background refresh of the Course Audit of course_key.
+
+    the job record is the lock: at most one job per course is queued or
+    running at a time. The cache lock only serializes this check-then-insert
+    so that two concurrent requests can't both create a job.
+
+    returns (job, created). job is the newly queued job, or the job that is
+    already active, or None if the cache lock is held by a concurrent request.
+    """
+    job = None
+    created = False
+    with task_lock(oid="plugin_cms_course_audit_refresh", course_id=str(course_key)) as acquired:
+        if acquired:
+            job = get_active_job(course_key)
+            if not job:
+                job = CourseAuditJob.objects.create(
+                    course_id=course_key,
+                    incremental=incremental,
+                    requested_by=user if user and user.is_authenticated else None,
+                )
+                created = True
+
+    if created:
+        # the task looks the job up by id, so it mustn't be queued before the job is committed.
+        transaction.on_commit(lambda: queue_audit_job(job))
+
+    return job, created
+
+
+def queue_audit_job(job: CourseAuditJob):
+    """
+    send the refresh task of a newly created job to Celery.
+    """
+    try:
+        result = _plugin_cms_course_audit_refresh.delay(
+            course_id=str(job.course_id), incremental=job.incremental, job_id=job.id
         )
+    except Exception as e:  # noqa: B902
+        log.error("queue_audit_job() could not queue job {job_id}: {err}".format(job_id=job.id, err=e))
+        job.status = CourseAuditJob.FAILED
+        job.finished_at = timezone.now()
+        job.message = "could not queue the refresh task: {err}".format(err=e)
+        CourseAuditJob.objects.filter(id=job.id).update(
+            status=job.status, finished_at=job.finished_at, message=job.message, modified=job.finished_at
+        )
+        return
+    # update() rather than save() so that we can't overwrite the
+    # progress of a task that has already started.
+    CourseAuditJob.objects.filter(id=job.id).update(task_id=result.id)
+    job.task_id = result.id
+
+
+def get_job_progress_cache_key(job_id) -> str:
+    return CACHE_NAMESPACE + "job.{job_id}".format(job_id=job_id)
 
-    return response
+
+def job_progress(job: CourseAuditJob):
+    """
+    returns a progress callback for persist_analyzed_course() that
+    records the row counters of job, and the time of the call as the job's
+    heartbeat.
+
+    rows are persisted inside one transaction, so an update of the job
+    record would not be visible to anyone polling for it until the very
+    end. The running counters and the heartbeat are kept in the cache
+    instead, and the counters are written to the job record once the task
+    finishes.
+    """
+
+    def callback(persisted, total):
+        cache.set(get_job_progress_cache_key(job.id), (persisted, total, timezone.now()), JOB_EXPIRE)
+
+    return callback
+
+
+def get_job_heartbeat(job: CourseAuditJob):
+    """
+    returns the time of the job's last progress report, or its modified time if it hasn't reported any.
+    """
+    progress = cache.get(get_job_progress_cache_key(job.id))
+    return max(progress[2], job.modified) if progress else job.modified
+
+
+def get_job_status(job: CourseAuditJob) -> Dict:
+    """
+    returns job as a dict, with the running row counters of an active job.
+    """
+    if job.is_active:
+        progress = cache.get(get_job_progress_cache_key(job.id))
+        if progress:
+            persisted, total, _ = progress
+            job.rows_persisted = persisted
+            job.rows_total = total if total is not None else persisted
+    return job.to_dict()
 
 
 @login_required
@@ -562,25 +1013,43 @@ def plugin_cms_course_audit_refresh(request, course_id: str, **kwargs):
     """
     mcdaniel dec-2021.
 
-    wrapper method to force serialization of calls to persist_analyzed_course()
+    queue a background refresh of the report data. This returns as soon as
+    the job is queued; poll plugin_cms_course_audit_status for its progress.
     """
-    message = "An unknown error occurred."
-    status = 500
-    with task_lock(oid="plugin_cms_course_audit_refresh", course_id=course_id) as acquired:
-        if acquired:
-            _plugin_cms_course_audit_refresh(course_id=course_id)
-            message = "Report data refresh process was successfully initiated for course_key:" " {course_id}".format(
-                course_id=course_id
-            )
-            status = 204
-        else:
-            message = "Refresh process is currently locked for course_key: {course_id}".format(course_id=course_id)
-            status = 403
+    course_key = CourseKey.from_string(course_id)
+    job, created = start_audit_job(course_key, user=request.user)
+    if created:
+        message = "Report data refresh was queued for course_key: {course_id}".format(course_id=course_id)
+        status = 202
+    elif job:
+        message = "A report data refresh is already {status} for course_key: {course_id}".format(
+            status=job.get_status_display().lower(), course_id=course_id
+        )
+        status = 409
+    else:
+        message = "Refresh process is currently locked for course_key: {course_id}".format(course_id=course_id)
+        status = 409
 
-    content = {"description": message}
+    content = {
+        "description": message,
+        "job": get_job_status(job) if job else None,
+        "status_url": get_status_url(course_key),
+    }
     return JsonResponse(data=content, status=status)
 
 
+@login_required
+@ensure_valid_course_key
+def plugin_cms_course_audit_status(request, course_id: str, **kwargs):
+    """
+    returns the most recent report data refresh job of the course as json.
+    """
+    course_key = CourseKey.from_string(course_id)
+    job = get_active_job(course_key) or CourseAuditJob.objects.filter(course_id=course_key).order_by("-id").first()
+    content = {"job": get_job_status(job) if job else None}
+    return JsonResponse(data=content, status=200)
+
+
 @task(
     bind=True,
     base=LoggedPersistOnFailureTask,
@@ -588,16 +1057,59 @@ def plugin_cms_course_audit_refresh(request, course_id: str, **kwargs):
     default_retry_delay=RETRY_DELAY_SECONDS,
     routing_key=settings.DEFAULT_PRIORITY_QUEUE,  # 'edx.core.default'
     acks_late=True,
-    task_time_limit=TASK_TIME_LIMIT,
-    task_soft_time_limit=TASK_SOFT_TIME_LIMIT,
+    time_limit=TASK_TIME_LIMIT,
+    soft_time_limit=TASK_SOFT_TIME_LIMIT,
 )
-def _plugin_cms_course_audit_refresh(self, course_id: str) -> None:
+def _plugin_cms_course_audit_refresh(self, course_id: str, incremental=True, job_id=None) -> None:
     """
     mcdaniel dec-2021.
 
-    launch a background task to refresh report data for course_key
+    launch a background task to refresh report data for course_key.
+    If job_id is given then the CourseAuditJob records the task's progress.
     """
     course_key = CourseKey.from_string(course_id)
-    if course_key:
-        log.info("refreshing report data for course_key: {course_id}".format(course_id=course_id))
-        persist_analyzed_course(course_key)
+    if not course_key:
+        return
+
+    job = None
+    if job_id:
+        # claim the job. A job that get_active_job() has meanwhile expired
+        # may already have been replaced by another refresh of the course,
+        # so this task must not run it.
+        now = timezone.now()
+        claimed = (
+            CourseAuditJob.objects.filter(id=job_id)
+            .filter(Q(status=CourseAuditJob.QUEUED) | Q(status=CourseAuditJob.RUNNING, task_id=self.request.id))
+            .update(status=CourseAuditJob.RUNNING, started_at=now, task_id=self.request.id, modified=now)
+        )
+        if not claimed:
+            log.warning(
+                "_plugin_cms_course_audit_refresh() job {job_id} of {course_id} is no longer queued. aborting.".format(
+                    job_id=job_id, course_id=course_id
+                )
+            )
+            return
+        job = CourseAuditJob.objects.get(id=job_id)
+
+    log.info("refreshing report data for course_key: {course_id}".format(course_id=course_id))
+    # the job's final status is only written if this task still owns it.
+    running_job = CourseAuditJob.objects.filter(id=job_id, status=CourseAuditJob.RUNNING, task_id=self.request.id)
+    try:
+        persist_analyzed_course(course_key, incremental=incremental, progress=job_progress(job) if job else None)
+    except Exception as e:  # noqa: B902
+        if job:
+            running_job.update(
+                status=CourseAuditJob.FAILED, finished_at=timezone.now(), message=str(e), modified=timezone.now()
+            )
+        raise
+
+    if job:
+        persisted, total, _ = cache.get(get_job_progress_cache_key(job.id)) or (0, 0, None)
+        running_job.update(
+            status=CourseAuditJob.SUCCEEDED,
+            rows_persisted=persisted,
+            rows_total=total if total is not None else persisted,
+            finished_at=timezone.now(),
+            modified=timezone.now(),
+        )
+        cache.delete(get_job_progress_cache_key(job.id))
@@ -12,14 +12,12 @@ see: https://co-digitallearning.atlassian.net/browse/CODLT-383
 also: https://docs.djangoproject.com/en/2.2/topics/pagination/
 """
 # Python
-import csv
 import logging
 from typing import Dict
 
 # Django
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.http import HttpResponse
+from django.http import HttpResponseBadRequest
 
 # Open edX
 from common.djangoapps.util.views import ensure_valid_course_key
@@ -30,7 +28,10 @@ from opaque_keys.edx.keys import CourseKey
 from xblock.core import XBlock
 
 # This repo
+from openedx_plugin_api.pagination import csv_response, parse_cursor
 from openedx_plugin_cms.models import CourseAudit
+from openedx_plugin_cms.utils import CSV_CHUNK_SIZE
+from openedx_plugin_cms.views.course_audit import get_audit_page
 
 log = logging.getLogger(__name__)
 
@@ -44,29 +45,28 @@ def get_csv_url(course_key, page_number=None):
     return url
 
 
-def get_context(course_key: CourseKey, page_number=None) -> Dict:
+def get_context(course_key: CourseKey, after=None, before=None) -> Dict:
     """
     mcdaniel nov-2021
     """
 
-    course_audit = CourseAudit.objects.filter(course_id=course_key).order_by("id")
+    page = get_audit_page(course_key, after=after, before=before)
 
-    paginator = Paginator(course_audit, MAX_ROWS_PER_PAGE)
-    page = paginator.get_page(page_number)
-
-    # mcdaniel nov-2021
-    # this is a workaround to buggy behavior with the paginator object.
-    page_number = int(page_number or 1)
-    page_next = page_number + 1 if page_number < page.paginator.num_pages else -1
-    page_previous = page_number - 1 if page_number > 1 else -1
+    # the html bodies can be large, so they are left out of the cached
+    # page and read here for just the rows of this page.
+    html = dict(
+        CourseAudit.objects.filter(course_id=course_key, a_order__in=[row.a_order for row in page]).values_list(
+            "a_order", "f_xblock_customized_html"
+        )
+    )
+    for row in page:
+        row.f_xblock_customized_html = html.get(row.a_order, "")
 
     context = {
         "course_id": str(course_key),
         "page_obj": page,
-        "page_previous": page_previous,
-        "page_next": page_next,
         "uses_bootstrap": True,
-        "csv_url": get_csv_url(course_key, page_number),
+        "csv_url": get_csv_url(course_key),
     }
 
     return context
@@ -78,13 +78,32 @@ def plugin_cms_course_audit_html(request, course_id: str, **kwargs):
     """
     mcdaniel nov-2021
     """
-    page_number = request.GET.get("page")
+    try:
+        after = parse_cursor(request.GET.get("after", kwargs.get("offset")))
+        before = parse_cursor(request.GET.get("before"))
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
     template_name = "course_audit_html.html"
     course_key = CourseKey.from_string(course_id)
-    context = get_context(course_key, page_number)
+    context = get_context(course_key, after=after, before=before)
     return render_to_response(template_name=template_name, dictionary=context, request=request)
 
 
+CSV_FIELDS = [
+    "a_order",
+    "b_course",
+    "c_module",
+    "d_section",
+    "e_unit",
+    "f_xblock_customized_html",
+    "o_unit_url",
+    "p_studio_url",
+    "r_publication_date",
+    "s_changed_by",
+    "t_change_made",
+]
+
+
 @login_required
 @ensure_valid_course_key
 def plugin_cms_course_audit_html_csv(request, course_id: str, **kwargs):
@@ -94,43 +113,16 @@ def plugin_cms_course_audit_html_csv(request, course_id: str, **kwargs):
     Generate a csv download of CMS change log data
     """
     course_key = CourseKey.from_string(course_id)
-    output = CourseAudit.objects.filter(course_id=course_key).order_by("id")
     filename = "plugin/cms_cms_course_html_audit-{course_id}.csv".format(course_id=course_id)
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = "attachment; filename={filename}".format(filename=filename)
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "a_order",
-            "b_course",
-            "c_module",
-            "d_section",
-            "e_unit",
-            "f_xblock_customized_html",
-            "o_unit_url",
-            "p_studio_url",
-            "r_publication_date",
-            "s_changed_by",
-            "t_change_made",
-        ]
+    # s_changed_by is projected to the username, which is
+    # how the User instance would have rendered.
+    columns = [field if field != "s_changed_by" else "s_changed_by__username" for field in CSV_FIELDS]
+    output = (
+        CourseAudit.objects.filter(course_id=course_key)
+        .order_by("a_order")
+        .values_list(*columns)
+        .iterator(chunk_size=CSV_CHUNK_SIZE)
     )
-    for row in output:
-        writer.writerow(
-            [
-                row.a_order,
-                row.b_course,
-                row.c_module,
-                row.d_section,
-                row.e_unit,
-                row.f_xblock_customized_html,
-                row.o_unit_url,
-                row.p_studio_url,
-                row.r_publication_date,
-                row.s_changed_by,
-                row.t_change_made,
-            ]
-        )
 
-    return response
+    return csv_response(filename, CSV_FIELDS, output)